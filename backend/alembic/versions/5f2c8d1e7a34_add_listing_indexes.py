@@ -0,0 +1,61 @@
+"""add listing indexes
+
+Revision ID: 5f2c8d1e7a34
+Revises: abb290895e46
+Create Date: 2026-10-18 09:12:41.208334
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c8d1e7a34'
+down_revision: str | Sequence[str] | None = 'abb290895e46'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The ownership migration shipped empty, so fresh databases never got the
+    # column that the owner indexes below are built on.
+    project_columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('projects')}
+    if 'owner_id' not in project_columns:
+        with op.batch_alter_table('projects', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('owner_id', sa.Uuid(), nullable=True))
+            batch_op.create_foreign_key(
+                batch_op.f('fk_projects_owner_id_users'),
+                'users',
+                ['owner_id'],
+                ['id'],
+                ondelete='CASCADE',
+            )
+
+    op.create_index(
+        'ix_issues_project_status_priority_created',
+        'issues',
+        ['project_id', 'status', 'priority', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_issues_project_created', 'issues', ['project_id', 'created_at'], unique=False
+    )
+    op.create_index(
+        'ix_issues_project_priority', 'issues', ['project_id', 'priority'], unique=False
+    )
+    op.create_index(
+        'ix_projects_owner_created', 'projects', ['owner_id', 'created_at'], unique=False
+    )
+    op.create_index('ix_projects_owner_name', 'projects', ['owner_id', 'name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_owner_name', table_name='projects')
+    op.drop_index('ix_projects_owner_created', table_name='projects')
+    op.drop_index('ix_issues_project_priority', table_name='issues')
+    op.drop_index('ix_issues_project_created', table_name='issues')
+    op.drop_index('ix_issues_project_status_priority_created', table_name='issues')
@@ -0,0 +1,71 @@
+"""add issue counters
+
+Revision ID: 8b3e6f0c2d91
+Revises: 5f2c8d1e7a34
+Create Date: 2026-10-18 10:02:15.774120
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3e6f0c2d91'
+down_revision: str | Sequence[str] | None = '5f2c8d1e7a34'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_counters',
+    sa.Column('scope', sa.String(length=10), nullable=False),
+    sa.Column('scope_id', sa.Uuid(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint(
+        'scope', 'scope_id', 'status', 'priority', name=op.f('pk_issue_counters')
+    )
+    )
+    op.create_table('project_counters',
+    sa.Column('owner_id', sa.Uuid(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('owner_id', name=op.f('pk_project_counters'))
+    )
+
+    # Backfill from the existing rows
+    op.execute(
+        """
+        INSERT INTO issue_counters (scope, scope_id, status, priority, count)
+        SELECT 'project', project_id, status, priority, COUNT(id)
+        FROM issues
+        GROUP BY project_id, status, priority
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO issue_counters (scope, scope_id, status, priority, count)
+        SELECT 'owner', projects.owner_id, issues.status, issues.priority, COUNT(issues.id)
+        FROM issues JOIN projects ON issues.project_id = projects.id
+        WHERE projects.owner_id IS NOT NULL
+        GROUP BY projects.owner_id, issues.status, issues.priority
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO project_counters (owner_id, count)
+        SELECT owner_id, COUNT(id)
+        FROM projects
+        WHERE owner_id IS NOT NULL
+        GROUP BY owner_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('project_counters')
+    op.drop_table('issue_counters')
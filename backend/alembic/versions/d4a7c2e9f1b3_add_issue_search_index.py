@@ -0,0 +1,82 @@
+"""add issue search index
+
+Revision ID: d4a7c2e9f1b3
+Revises: 8b3e6f0c2d91
+Create Date: 2026-10-18 14:20:41.318502
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e9f1b3'
+down_revision: str | Sequence[str] | None = '8b3e6f0c2d91'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # Generated, so existing rows are indexed as the column is added
+        op.execute(
+            """
+            ALTER TABLE issues ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', title), 'A')
+                || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED
+            """
+        )
+        op.execute("CREATE INDEX ix_issues_search_vector ON issues USING gin (search_vector)")
+        return
+
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE issues_fts USING fts5(
+            title, description,
+            content='issues', content_rowid='rowid', tokenize='porter unicode61'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_insert AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_delete AFTER DELETE ON issues BEGIN
+            INSERT INTO issues_fts (issues_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_update AFTER UPDATE OF title, description ON issues BEGIN
+            INSERT INTO issues_fts (issues_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO issues_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """
+    )
+    # Index the existing rows
+    op.execute("INSERT INTO issues_fts (issues_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX ix_issues_search_vector")
+        op.execute("ALTER TABLE issues DROP COLUMN search_vector")
+        return
+
+    op.execute("DROP TRIGGER issues_fts_update")
+    op.execute("DROP TRIGGER issues_fts_delete")
+    op.execute("DROP TRIGGER issues_fts_insert")
+    op.execute("DROP TABLE issues_fts")
@@ -0,0 +1,59 @@
+"""add issue rank columns
+
+Revision ID: e2b9a4c61d07
+Revises: d4a7c2e9f1b3
+Create Date: 2026-10-18 15:42:08.604917
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9a4c61d07'
+down_revision: str | Sequence[str] | None = 'd4a7c2e9f1b3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+STATUS_RANK = "CASE status WHEN 'open' THEN 0 WHEN 'in_progress' THEN 1 WHEN 'done' THEN 2 END"
+PRIORITY_RANK = "CASE priority WHEN 'low' THEN 0 WHEN 'medium' THEN 1 WHEN 'high' THEN 2 END"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated columns, so existing rows are backfilled as they are added: SQLite
+    # adds them as virtual columns in place, Postgres stores them (table rewrite)
+    op.add_column('issues', sa.Column('status_rank', sa.SmallInteger(), sa.Computed(STATUS_RANK)))
+    op.add_column(
+        'issues', sa.Column('priority_rank', sa.SmallInteger(), sa.Computed(PRIORITY_RANK))
+    )
+    op.drop_index('ix_issues_project_status_priority_created', table_name='issues')
+    op.drop_index('ix_issues_project_priority', table_name='issues')
+    op.create_index(
+        'ix_issues_project_status_priority_rank_created',
+        'issues',
+        ['project_id', 'status_rank', 'priority_rank', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_issues_project_priority_rank', 'issues', ['project_id', 'priority_rank'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_project_priority_rank', table_name='issues')
+    op.drop_index('ix_issues_project_status_priority_rank_created', table_name='issues')
+    op.create_index(
+        'ix_issues_project_priority', 'issues', ['project_id', 'priority'], unique=False
+    )
+    op.create_index(
+        'ix_issues_project_status_priority_created',
+        'issues',
+        ['project_id', 'status', 'priority', 'created_at'],
+        unique=False,
+    )
+    op.drop_column('issues', 'priority_rank')
+    op.drop_column('issues', 'status_rank')
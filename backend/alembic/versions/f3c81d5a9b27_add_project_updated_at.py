@@ -0,0 +1,29 @@
+"""add project updated_at
+
+Revision ID: f3c81d5a9b27
+Revises: e2b9a4c61d07
+Create Date: 2026-10-18 18:05:41.218306
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c81d5a9b27'
+down_revision: str | Sequence[str] | None = 'e2b9a4c61d07'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Null until the first update; Last-Modified falls back to created_at
+    op.add_column('projects', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'updated_at')
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.routes import auth, health, issues, projects, users
+from app.api.v1.routes import auth, health, issues, projects, stats, users
 
 router = APIRouter()
 router.include_router(health.router, tags=["health"])
@@ -8,3 +8,4 @@ router.include_router(projects.router, tags=["projects"])
 router.include_router(issues.router, tags=["issues"])
 router.include_router(auth.router, tags=["auth"])
 router.include_router(users.router, tags=["users"])
+router.include_router(stats.router, tags=["stats"])
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.authorization import Principal
+from app.core.dependencies import get_token_principal
 from app.db.session import get_db
 from app.schemas.auth import LoginRequest, TokenResponse
 from app.services.auth_service import auth_service
@@ -30,3 +32,8 @@ async def signup(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
         payload.password,
     )
     return {"access_token": token}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(principal: Principal = Depends(get_token_principal)):
+    await auth_service.revoke(principal)
@@ -1,7 +1,14 @@
 from fastapi import APIRouter
 
+from app.core.redis import get_cache_stats
+
 router = APIRouter()
 
 @router.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@router.get("/metrics")
+def metrics():
+    return {"cache": get_cache_stats()}
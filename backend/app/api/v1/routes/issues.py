@@ -1,42 +1,86 @@
-from fastapi import APIRouter, Depends, status
+import tempfile
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_issue_for_user, get_project_for_user
+from app.core.authorization import Principal
+from app.core.dependencies import get_current_principal, get_issue_for_user, get_project_for_user
+from app.core.errors import ErrorCodes
+from app.core.http_exceptions import bad_request
+from app.core.list_cache import list_validators, owner_scope, project_scope
+from app.core.responses import ORJSONResponse, Projection, Validators, parse_fields
 from app.db.models.issue import Issue
 from app.db.models.project import Project
 from app.db.session import get_db
+from app.schemas.file_format import FileFormat
 from app.schemas.issue import (
+    BulkItemResult,
+    IssueBulkCreate,
+    IssueBulkCreateOut,
+    IssueBulkDeleteOut,
+    IssueBulkSelection,
+    IssueBulkUpdate,
+    IssueBulkUpdateOut,
     IssueCreate,
     IssueOut,
     IssuePriority,
+    IssueSearchHit,
     IssueStatus,
     IssueUpdate,
 )
 from app.schemas.page import Page
-from app.schemas.pagination import PaginationParams
+from app.schemas.pagination import PaginationParams, TotalMode
 from app.schemas.sorting import SortOrder
+from app.services.import_service import (
+    ImportFormatError,
+    import_service,
+    iter_lines,
+    iter_records,
+)
 from app.services.issue_service import issue_service
-
-from app.core.dependencies import get_current_user, get_issue_for_user, get_project_for_user
-from app.db.models.user import User
+from app.services.search_service import search_service
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
+# Read routes serialize their items directly; response_model still documents them
+issue_out = Projection(IssueOut)
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, e.g. title,status,priority; the id is always "
+    "included and other fields are omitted. Only the requested columns are loaded."
+)
+
 
 @router.get("/", response_model=Page[IssueOut])
 async def list_all_issues(
+    request: Request,
     page: int = 1,
     page_size: int = 10,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.exact,
     sort_by: str = "created_at",
     order: SortOrder = SortOrder.desc,
     status: IssueStatus | None = None,
     priority: IssuePriority | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_principal),
 ):
-    pagination = PaginationParams(page=page, page_size=page_size)
+    columns = parse_fields(fields, IssueOut)
+    validators = await list_validators([owner_scope(user.id)], request)
+    if validators.matches(request):
+        return validators.not_modified()
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
-    items, total = await issue_service.list_all(
+    items, total, next_cursor = await issue_service.list_all(
         db=db,
         user_id=user.id,
         pagination=pagination,
@@ -44,25 +88,72 @@ async def list_all_issues(
         priority=priority,
         sort_by=sort_by,
         order=order,
+        fields=columns,
     )
 
-    return {"items": items, "page": page, "page_size": page_size, "total": total}
+    projection = Projection(IssueOut, columns) if columns else issue_out
+    return ORJSONResponse(
+        {
+            "items": projection.many(items),
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "next_cursor": next_cursor,
+        },
+        headers=validators.headers(),
+    )
+
+
+@router.get("/search", response_model=Page[IssueSearchHit])
+async def search_issues(
+    q: str = Query(..., min_length=1, max_length=200),
+    project_id: UUID | None = None,
+    page: int = 1,
+    page_size: int = 10,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+):
+    pagination = PaginationParams(page=page, page_size=page_size, cursor=cursor)
+    items, next_cursor = await search_service.search_issues(
+        db, user.id, q, pagination, project_id=project_id
+    )
+    return {
+        "items": items,
+        "page": page,
+        "page_size": page_size,
+        "total": None,
+        "next_cursor": next_cursor,
+    }
 
 
 @router.get("/projects/{project_id}", response_model=Page[IssueOut])
 async def list_issues(
+    request: Request,
     page: int = 1,
     page_size: int = 10,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.exact,
     sort_by: str = "created_at",
     order: SortOrder = SortOrder.desc,
     status: IssueStatus | None = None,
     priority: IssuePriority | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     project: Project = Depends(get_project_for_user),
 ):
-    pagination = PaginationParams(page=page, page_size=page_size)
+    columns = parse_fields(fields, IssueOut)
+    validators = await list_validators([project_scope(project.id)], request)
+    if validators.matches(request):
+        return validators.not_modified()
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
-    items, total = await issue_service.list_by_project(
+    items, total, next_cursor = await issue_service.list_by_project(
         db=db,
         project_id=project.id,
         pagination=pagination,
@@ -70,9 +161,87 @@ async def list_issues(
         priority=priority,
         sort_by=sort_by,
         order=order,
+        fields=columns,
     )
 
-    return {"items": items, "page": page, "page_size": page_size, "total": total}
+    projection = Projection(IssueOut, columns) if columns else issue_out
+    return ORJSONResponse(
+        {
+            "items": projection.many(items),
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "next_cursor": next_cursor,
+        },
+        headers=validators.headers(),
+    )
+
+
+@router.get("/projects/{project_id}/export")
+async def export_issues(
+    format: FileFormat = FileFormat.ndjson,
+    status: IssueStatus | None = None,
+    priority: IssuePriority | None = None,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_for_user),
+):
+    media_types = {FileFormat.ndjson: "application/x-ndjson", FileFormat.csv: "text/csv"}
+    return StreamingResponse(
+        issue_service.export_by_project(db, project.id, format, status, priority),
+        media_type=media_types[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="issues-{project.id}.{format.value}"'
+        },
+    )
+
+
+@router.post("/projects/{project_id}/import")
+async def import_issues(
+    request: Request,
+    format: FileFormat = FileFormat.ndjson,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_for_user),
+):
+    """
+    Import the request body, an NDJSON or CSV file, as it streams in.
+
+    The response is the error file: one NDJSON line per rejected row, empty
+    when every row was imported. Counts are in the X-Import-* headers. An
+    unreadable file is a 400 whose details count the rows already committed.
+    """
+    # Spills to disk past 1 MiB, so a file full of bad rows stays cheap to hold
+    errors = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode="w+", encoding="utf-8")
+    try:
+        result = await import_service.import_issues(
+            db,
+            project.id,
+            project.owner_id,
+            iter_records(iter_lines(request.stream()), format),
+            errors,
+        )
+    except ImportFormatError as exc:
+        errors.close()
+        # Earlier batches are committed; a client must not retry the whole file
+        bad_request(
+            ErrorCodes.INVALID_FILE,
+            str(exc),
+            {
+                "created": exc.result.created,
+                "failed": exc.result.failed,
+                "last_committed_row": exc.result.last_row,
+            },
+        )
+    errors.seek(0)
+
+    def error_file():
+        with errors:
+            yield from iter(lambda: errors.read(1 << 16), "")
+
+    return StreamingResponse(
+        error_file(),
+        media_type="application/x-ndjson",
+        headers={"X-Import-Created": str(result.created), "X-Import-Failed": str(result.failed)},
+    )
 
 
 @router.post(
@@ -88,9 +257,60 @@ async def create_issue(
     return await issue_service.create(db, project.id, payload)
 
 
+@router.post("/projects/{project_id}/bulk", response_model=IssueBulkCreateOut)
+async def bulk_create_issues(
+    payload: IssueBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_for_user),
+):
+    results: list[BulkItemResult] = []
+    valid: list[tuple[int, IssueCreate]] = []
+    for index, item in enumerate(payload.items):
+        try:
+            valid.append((index, IssueCreate.model_validate(item)))
+        except ValidationError as exc:
+            results.append(BulkItemResult(index=index, errors=exc.errors(include_url=False)))
+
+    ids = await issue_service.bulk_create(
+        db, project.id, project.owner_id, [item for _, item in valid]
+    )
+    results.extend(
+        BulkItemResult(index=index, id=issue_id)
+        for (index, _), issue_id in zip(valid, ids, strict=True)
+    )
+    results.sort(key=lambda result: result.index)
+
+    return {"created": len(ids), "failed": len(results) - len(ids), "results": results}
+
+
+# Registered before the /{issue_id} routes, which would otherwise match "bulk"
+@router.patch("/bulk", response_model=IssueBulkUpdateOut)
+async def bulk_update_issues(
+    payload: IssueBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+):
+    issue_ids = await issue_service.bulk_update(db, user.id, payload)
+    items = await issue_service.get_many(db, issue_ids) if payload.return_items else None
+    return {"updated": len(issue_ids), "items": items}
+
+
+@router.post("/bulk/delete", response_model=IssueBulkDeleteOut)
+async def bulk_delete_issues(
+    payload: IssueBulkSelection,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+):
+    return {"deleted": await issue_service.bulk_delete(db, user.id, payload)}
+
+
 @router.get("/{issue_id}", response_model=IssueOut)
-async def get_issue(issue: Issue = Depends(get_issue_for_user)):
-    return issue
+async def get_issue(request: Request, issue: Issue = Depends(get_issue_for_user)):
+    # With the issue and its project cached, a 304 needs no database round trip
+    validators = Validators.for_entity(issue)
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(issue_out(issue), headers=validators.headers())
 
 
 @router.patch("/{issue_id}", response_model=IssueOut)
@@ -1,48 +1,97 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user, get_project_for_user
+from app.core.authorization import Principal
+from app.core.dependencies import get_current_principal, get_project_for_user
+from app.core.list_cache import list_validators, owner_scope
+from app.core.responses import ORJSONResponse, Projection, Validators, parse_fields
 from app.db.models.project import Project
-from app.db.models.user import User
 from app.db.session import get_db
 from app.schemas.page import Page
-from app.schemas.pagination import PaginationParams
+from app.schemas.pagination import PaginationParams, TotalMode
 from app.schemas.project import (
     ProjectCreate,
     ProjectOut,
     ProjectUpdate,
+    ProjectWithCountsOut,
 )
 from app.schemas.sorting import SortOrder
+from app.services.counter_service import counter_service
 from app.services.project_service import project_service
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Read routes serialize their items directly; response_model still documents them
+project_out = Projection(ProjectOut)
 
-@router.get("", response_model=Page[ProjectOut])
+
+@router.get("", response_model=Page[ProjectWithCountsOut])
 async def list_projects(
+    request: Request,
     page: int = 1,
     page_size: int = 10,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.exact,
     sort_by: str = "created_at",
     order: SortOrder = SortOrder.desc,
+    with_counts: bool = False,
+    fields: str | None = Query(
+        None,
+        description=(
+            "Comma-separated fields to return, e.g. name; the id is always included "
+            "and other fields are omitted. Only the requested columns are loaded."
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    pagination = PaginationParams(page=page, page_size=page_size)
-    items, total = await project_service.list(
+    columns = parse_fields(fields, ProjectOut)
+    # Issue writes bump the owner's generation too, which covers issue_counts
+    validators = await list_validators([owner_scope(current_user.id)], request)
+    if validators.matches(request):
+        return validators.not_modified()
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+    )
+    items, total, next_cursor = await project_service.list(
         db=db,
         pagination=pagination,
         sort_by=sort_by,
         order=order,
         owner_id=current_user.id,
+        fields=columns,
+    )
+    counts = {}
+    if with_counts:
+        counts = await counter_service.project_issue_counts(db, [p.id for p in items])
+    projection = Projection(ProjectOut, columns) if columns else project_out
+    items = projection.many(items)
+    # Full items always carry issue_counts; sparse ones only when asked for
+    if with_counts or not columns:
+        for item in items:
+            item["issue_counts"] = (
+                counts[item["id"]].model_dump() if item["id"] in counts else None
+            )
+    return ORJSONResponse(
+        {
+            "items": items,
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "next_cursor": next_cursor,
+        },
+        headers=validators.headers(),
     )
-    return {"items": items, "page": page, "page_size": page_size, "total": total}
 
 
 @router.post("", response_model=ProjectOut, status_code=status.HTTP_201_CREATED)
 async def create_project(
     payload: ProjectCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     return await project_service.create(
         db=db,
@@ -52,8 +101,11 @@ async def create_project(
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
-async def get_project(project: Project = Depends(get_project_for_user)):
-    return project
+async def get_project(request: Request, project: Project = Depends(get_project_for_user)):
+    validators = Validators.for_entity(project)
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(project_out(project), headers=validators.headers())
 
 
 @router.patch("/{project_id}", response_model=ProjectOut)
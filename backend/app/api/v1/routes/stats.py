@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.authorization import Principal
+from app.core.dependencies import get_current_principal, get_project_for_user
+from app.db.models.project import Project
+from app.db.session import get_db
+from app.schemas.stats import IssueCounts, StatsOut
+from app.services.counter_service import OWNER_SCOPE, PROJECT_SCOPE, counter_service
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("", response_model=StatsOut)
+async def get_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    return {
+        "projects": await counter_service.count_projects(db, current_user.id),
+        "issues": await counter_service.issue_counts(db, OWNER_SCOPE, current_user.id),
+    }
+
+
+@router.get("/projects/{project_id}", response_model=IssueCounts)
+async def get_project_stats(
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_for_user),
+):
+    return await counter_service.issue_counts(db, PROJECT_SCOPE, project.id)
@@ -3,10 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import EmailStr
 
 from app.core.dependencies import get_current_user
+from app.core.redis import delete_cache
 from app.db.models.user import User
 from app.db.session import get_db
 from app.schemas.user import UserOut, UserUpdate
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -22,14 +23,17 @@ async def update_me(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
+    # The current user may be a read-only cached record; update the row itself
+    user = await db.get(User, user.id)
     update_data = payload.model_dump(exclude_unset=True)
     
     if "password" in update_data:
-        update_data["hashed_password"] = hash_password(update_data.pop("password"))
+        update_data["hashed_password"] = await hash_password_async(update_data.pop("password"))
     
     for field, value in update_data.items():
         setattr(user, field, value)
         
     await db.commit()
     await db.refresh(user)
+    await delete_cache(f"user:{user.id}")
     return user
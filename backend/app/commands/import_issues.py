@@ -0,0 +1,103 @@
+"""
+Import issues into a project from an NDJSON or CSV file.
+
+    python -m app.commands.import_issues PROJECT_ID issues.ndjson
+    python -m app.commands.import_issues PROJECT_ID issues.csv --errors rejected.ndjson
+
+The file is read incrementally and committed in batches of
+IMPORT_BATCH_SIZE rows. Rejected rows go to the error file, one NDJSON line
+each with the row number, the record and why it was rejected.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from app.db.models.project import Project
+from app.db.models.user import User  # noqa: F401 - registers the mapper Project refers to
+from app.db.session import AsyncSessionLocal
+from app.schemas.file_format import FileFormat
+from app.services.import_service import (
+    ImportFormatError,
+    ImportResult,
+    import_service,
+    iter_lines,
+    iter_records,
+)
+
+
+async def read_chunks(path: Path, size: int = 1 << 16):
+    with path.open("rb") as file:
+        while chunk := file.read(size):
+            yield chunk
+
+
+def report(result: ImportResult) -> None:
+    print(
+        f"\r{result.processed} rows: {result.created} created, {result.failed} failed",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+async def run(project_id: UUID, path: Path, file_format: FileFormat, errors_path: Path) -> int:
+    async with AsyncSessionLocal() as db:
+        project = await db.get(Project, project_id)
+        if project is None:
+            print(f"Project {project_id} not found", file=sys.stderr)
+            return 1
+        owner_id = project.owner_id
+
+        with errors_path.open("w", encoding="utf-8") as errors:
+            try:
+                result = await import_service.import_issues(
+                    db,
+                    project_id,
+                    owner_id,
+                    iter_records(iter_lines(read_chunks(path)), file_format),
+                    errors,
+                    on_progress=report,
+                )
+            except ImportFormatError as exc:
+                print(f"\n{exc}", file=sys.stderr)
+                if exc.result.last_row:
+                    print(
+                        f"Rows up to {exc.result.last_row} were committed: "
+                        f"{exc.result.created} imported, {exc.result.failed} rejected",
+                        file=sys.stderr,
+                    )
+                return 1
+
+    print(file=sys.stderr)
+    if result.failed:
+        print(f"Rejected rows written to {errors_path}", file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("project_id", type=UUID)
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in FileFormat],
+        help="File format; defaults to the file extension",
+    )
+    parser.add_argument(
+        "--errors",
+        type=Path,
+        help="Where to write rejected rows (default: PATH with .errors.ndjson appended)",
+    )
+    args = parser.parse_args()
+
+    file_format = FileFormat(
+        args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+    )
+    errors_path = args.errors or args.path.with_name(args.path.name + ".errors.ndjson")
+    sys.exit(asyncio.run(run(args.project_id, args.path, file_format, errors_path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Rebuild or verify the issue/project counters.
+
+    python -m app.commands.rebuild_counters           # recompute all counters
+    python -m app.commands.rebuild_counters --verify  # report drift, exit 1 if any
+"""
+import argparse
+import asyncio
+import sys
+
+from app.db.models.user import User  # noqa: F401 - registers the mapper Project refers to
+from app.db.session import AsyncSessionLocal
+from app.services.counter_service import counter_service
+
+
+async def run(verify_only: bool) -> int:
+    async with AsyncSessionLocal() as db:
+        drift = await counter_service.verify(db)
+        for row in drift:
+            print(
+                f"{row['counter']} {row['scope']}={row['scope_id']} "
+                f"status={row['status']} priority={row['priority']}: "
+                f"expected {row['expected']}, found {row['actual']}"
+            )
+
+        if verify_only:
+            print(f"{len(drift)} counter(s) drifted")
+            return 1 if drift else 0
+
+        await counter_service.rebuild(db)
+        print(f"Rebuilt counters ({len(drift)} drifted)")
+        return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Only compare counters with a fresh aggregate; do not modify them",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.verify)))
+
+
+if __name__ == "__main__":
+    main()
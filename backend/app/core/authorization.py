@@ -1,6 +1,18 @@
+from dataclasses import dataclass
+from uuid import UUID
+
 from app.core.http_exceptions import forbidden
 
 
+@dataclass(slots=True, frozen=True)
+class Principal:
+    """The authenticated caller as described by their verified token."""
+
+    id: UUID
+    jti: str | None
+    expires_at: float
+
+
 def require_owner(resource_owner_id, current_user_id):
     if resource_owner_id != current_user_id:
         forbidden("Not allowed to modify this resource")
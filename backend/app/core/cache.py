@@ -0,0 +1,446 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+# Cached in place of rows that do not exist; never a valid codec payload
+MISSING = b"\x00missing"
+
+
+class LRUCache:
+    """Bounded in-process cache with per-entry expiry and least-recently-used eviction."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value, ttl: float | None = None):
+        ttl = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight call."""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn):
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters get the exception; mark it retrieved for the no-waiter case
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing dependency for a while, then probe for recovery.
+
+    Closed: calls go through and consecutive failures are counted. After
+    `failure_threshold` failures the breaker opens and calls are skipped for
+    `reset_seconds`. It then lets a single probe through (half-open): success
+    closes it again, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 5.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.stats = {"opened": 0, "short_circuited": 0}
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                self.stats["short_circuited"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probing = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.stats["short_circuited"] += 1
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def release_probe(self):
+        """End a half-open probe without a verdict (e.g. cancelled); the next call probes."""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.stats["opened"] += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "failures": self.failures, **self.stats}
+
+
+class TieredCache:
+    """
+    In-process LRU (L1) in front of Redis (L2).
+
+    Only keys with one of `l1_prefixes` are kept locally. Deletes are published
+    on a Redis channel so every worker drops its L1 copy; the short L1 TTL bounds
+    staleness if a worker misses a message.
+
+    Redis is optional at runtime: every call goes through a circuit breaker, and
+    any of `errors` turns a read into a miss and a write into a no-op, so callers
+    fall back to the database. While the breaker is open Redis is not called at all.
+
+    Invalidations that do not reach Redis (deletes and counter increments) are
+    queued and replayed ahead of the next call that does, so entries and list
+    generations written before an outage do not outlive it.
+    """
+
+    def __init__(
+        self,
+        client_factory,
+        l1: LRUCache,
+        l1_prefixes: tuple[str, ...],
+        ttl_jitter: float = 0.0,
+        negative_ttl: int = 30,
+        lock_ttl_ms: int = 2000,
+        lock_wait_ms: int = 250,
+        breaker: CircuitBreaker | None = None,
+        errors: tuple[type[BaseException], ...] = (OSError,),
+        pubsub_factory=None,
+    ):
+        self._client_factory = client_factory
+        self._pubsub_factory = pubsub_factory or client_factory
+        self.breaker = breaker or CircuitBreaker()
+        self.errors = errors
+        self.l1 = l1
+        self.l1_prefixes = l1_prefixes
+        self.ttl_jitter = ttl_jitter
+        self.negative_ttl = negative_ttl
+        self.lock_ttl_ms = lock_ttl_ms
+        self.lock_wait_ms = lock_wait_ms
+        self._flight = SingleFlight()
+        self.stats = {
+            "l1": {"hits": 0, "misses": 0},
+            "l2": {"hits": 0, "misses": 0},
+        }
+        self._listener: asyncio.Task | None = None
+        self._pending_deletes: set[str] = set()
+        self._pending_incrs: set[str] = set()
+
+    def _local(self, key: str) -> bool:
+        return key.startswith(self.l1_prefixes)
+
+    async def run(self, call, default=None):
+        """Run `call(client)` through the breaker; `default` if Redis is unavailable."""
+        if not self.breaker.allow():
+            return default
+        probing = self.breaker.state == CircuitBreaker.HALF_OPEN
+        try:
+            client = self._client_factory()
+            if self._pending_deletes or self._pending_incrs:
+                await self._replay(client)
+            result = await call(client)
+        except self.errors:
+            self.breaker.record_failure()
+            logger.warning("Redis call failed; serving without cache", exc_info=True)
+            return default
+        except BaseException:
+            # Cancelled, or a bug: says nothing about Redis, but must not hold the probe
+            if probing:
+                self.breaker.release_probe()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def _replay(self, client):
+        """Apply invalidations queued while Redis was unavailable; requeue them on failure."""
+        deletes, self._pending_deletes = self._pending_deletes, set()
+        incrs, self._pending_incrs = self._pending_incrs, set()
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                if deletes:
+                    pipe.delete(*deletes)
+                    for key in deletes:
+                        pipe.publish(INVALIDATION_CHANNEL, key)
+                for key in incrs:
+                    pipe.incr(key)
+                await pipe.execute()
+        except BaseException:
+            self._pending_deletes |= deletes
+            self._pending_incrs |= incrs
+            raise
+        logger.info("Replayed %d cache deletes and %d increments", len(deletes), len(incrs))
+
+    async def get(self, key: str) -> bytes | None:
+        local = self._local(key)
+        if local:
+            value = self.l1.get(key)
+            if value is not None:
+                self.stats["l1"]["hits"] += 1
+                return value
+            self.stats["l1"]["misses"] += 1
+
+        value = await self.run(lambda client: client.get(key))
+        self.stats["l2"]["hits" if value is not None else "misses"] += 1
+        if local and value is not None:
+            self.l1.set(key, value)
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Batch get: L1 first, then a single MGET for everything else."""
+        found = {}
+        remote = []
+        for key in keys:
+            if self._local(key):
+                value = self.l1.get(key)
+                if value is not None:
+                    self.stats["l1"]["hits"] += 1
+                    found[key] = value
+                    continue
+                self.stats["l1"]["misses"] += 1
+            remote.append(key)
+
+        if remote:
+            values = await self.run(
+                lambda client: client.mget(remote), default=[None] * len(remote)
+            )
+            for key, value in zip(remote, values, strict=True):
+                self.stats["l2"]["hits" if value is not None else "misses"] += 1
+                if value is not None:
+                    found[key] = value
+                    if self._local(key):
+                        self.l1.set(key, value)
+
+        return [found.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, expire: int):
+        expire = self._jittered(expire)
+        # Only keep what Redis has: without it, deletes cannot reach other workers
+        stored = await self.run(lambda client: client.set(key, value, ex=expire))
+        if stored and self._local(key):
+            self.l1.set(key, value, ttl=expire)
+
+    async def set_many(self, items: dict[str, bytes], expire: int):
+        """Batch set in one pipelined round trip."""
+        if not items:
+            return
+        ttls = {key: self._jittered(expire) for key in items}
+
+        async def write(client):
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=ttls[key])
+                await pipe.execute()
+            return True
+
+        if await self.run(write):
+            for key, value in items.items():
+                if self._local(key):
+                    self.l1.set(key, value, ttl=ttls[key])
+
+    async def incr_many(self, keys: list[str]):
+        """Increment counters in one pipelined round trip."""
+        if not keys:
+            return
+
+        async def incr(client):
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                await pipe.execute()
+            return True
+
+        if not await self.run(incr, default=False):
+            self._pending_incrs.update(keys)
+
+    def _jittered(self, expire: int) -> int:
+        # Shorten each TTL by a random fraction so keys written together
+        # do not all expire in the same second
+        return max(1, int(expire * (1 - random.random() * self.ttl_jitter)))
+
+    async def get_or_load(self, key: str, loader, expire: int) -> bytes | None:
+        """
+        Cache-aside read where only one loader runs per key.
+
+        Within a worker concurrent misses share one in-flight load. Across workers
+        a short Redis lock elects one loader; the others poll the cache briefly
+        and only load themselves if nothing shows up before the wait runs out.
+        `loader` is a coroutine function returning the value to cache, or None.
+        A None result is cached briefly as MISSING, so repeated lookups of
+        unknown ids are answered without calling the loader.
+        """
+        value = await self.get(key)
+        if value is None:
+            value = await self._flight.do(key, lambda: self._load(key, loader, expire))
+        return None if value == MISSING else value
+
+    async def _load(self, key: str, loader, expire: int) -> bytes | None:
+        lock_key = f"lock:{key}"
+        # True: we hold the lock. None: another worker does. False: Redis is
+        # unavailable, so there is no one to coordinate with; load directly.
+        locked = await self.run(
+            lambda client: client.set(lock_key, "1", nx=True, px=self.lock_ttl_ms),
+            default=False,
+        )
+        if locked is None:
+            deadline = time.monotonic() + self.lock_wait_ms / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.025)
+                value = await self.get(key)
+                if value is not None:
+                    return value
+
+        try:
+            value = await loader()
+            if value is None:
+                await self.set(key, MISSING, self.negative_ttl)
+            else:
+                await self.set(key, value, expire)
+            return value
+        finally:
+            if locked:
+                await self.run(lambda client: client.delete(lock_key))
+
+    async def delete(self, key: str):
+        self.l1.delete(key)
+
+        async def remove(client):
+            await client.delete(key)
+            await client.publish(INVALIDATION_CHANNEL, key)
+            return True
+
+        if not await self.run(remove, default=False):
+            self._pending_deletes.add(key)
+
+    async def delete_many(self, keys: list[str]):
+        """Delete several keys and notify other workers in one pipelined round trip."""
+        if not keys:
+            return
+        for key in keys:
+            self.l1.delete(key)
+
+        async def remove(client):
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                for key in keys:
+                    pipe.publish(INVALIDATION_CHANNEL, key)
+                await pipe.execute()
+            return True
+
+        if not await self.run(remove, default=False):
+            self._pending_deletes.update(keys)
+
+    async def mark_missing(self, key: str):
+        """Replace a deleted entity with a negative entry on every tier."""
+        self.l1.delete(key)
+
+        async def mark(client):
+            await client.set(key, MISSING, ex=self.negative_ttl)
+            await client.publish(INVALIDATION_CHANNEL, key)
+            return True
+
+        # Dropping the entry is enough if the negative entry cannot be written
+        if not await self.run(mark, default=False):
+            self._pending_deletes.add(key)
+
+    def snapshot(self) -> dict:
+        return {
+            "l1": {**self.stats["l1"], "size": len(self.l1), "evictions": self.l1.evictions},
+            "l2": dict(self.stats["l2"]),
+            "breaker": self.breaker.snapshot(),
+        }
+
+    async def listen_for_invalidations(self):
+        """Drop L1 entries deleted by any worker; reconnects after Redis errors."""
+        while True:
+            try:
+                pubsub = self._pubsub_factory().pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything cached locally while disconnected may have missed a delete
+                self.l1.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.l1.delete(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cache invalidation listener lost Redis; retrying", exc_info=True)
+                self.l1.clear()
+                await asyncio.sleep(1)
+
+    def start_listener(self):
+        if self._listener is None:
+            self._listener = asyncio.create_task(self.listen_for_invalidations())
+
+    async def stop_listener(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
@@ -0,0 +1,193 @@
+import struct
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+# Bump when any layout below changes; entries written by another version
+# decode as None and are reloaded from the database.
+VERSION = 2
+
+# Enum values are stored as their index here, and the index is also the
+# sort rank of the issues.status_rank/priority_rank columns; only ever append
+STATUSES = ("open", "in_progress", "done")
+PRIORITIES = ("low", "medium", "high")
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIME = -(2**63)
+_NO_STRING = 0xFFFFFFFF
+_LENGTH = struct.Struct(">I")
+# version, tag, total (-1 when not computed), number of ids
+_PAGE_HEADER = struct.Struct(">BBqI")
+_PAGE_TAG = 4
+
+
+@dataclass(slots=True, frozen=True)
+class IssueRecord:
+    """Read-only issue served from the cache, without ORM instrumentation."""
+
+    id: UUID
+    project_id: UUID
+    title: str
+    description: str | None
+    status: str
+    priority: str
+    created_at: datetime
+    updated_at: datetime | None
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectRecord:
+    """Read-only project served from the cache."""
+
+    id: UUID
+    owner_id: UUID
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class UserRecord:
+    """Read-only user served from the cache; never carries the password hash."""
+
+    id: UUID
+    email: str
+    created_at: datetime
+
+
+def _pack_time(value: datetime | None) -> int:
+    if value is None:
+        return _NO_TIME
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _unpack_time(value: int) -> datetime | None:
+    if value == _NO_TIME:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+# kind -> (struct format, encode, decode)
+_KINDS = {
+    "uuid": ("16s", lambda value: value.bytes, lambda raw: UUID(bytes=raw)),
+    "time": ("q", _pack_time, _unpack_time),
+    "status": ("B", STATUSES.index, STATUSES.__getitem__),
+    "priority": ("B", PRIORITIES.index, PRIORITIES.__getitem__),
+}
+
+
+class RecordCodec:
+    """
+    Struct-packed encoding of one entity type.
+
+    Layout: version and type tag bytes, the fixed-size fields (UUIDs as 16 raw
+    bytes, datetimes as int64 microseconds, enums as one byte), then each
+    string as a 4-byte length and its UTF-8 bytes.
+    """
+
+    def __init__(self, tag: int, record_type, fields: list[tuple[str, str]], strings: list[str]):
+        self.tag = tag
+        self.record_type = record_type
+        self._names = [name for name, _ in fields]
+        kinds = [_KINDS[kind] for _, kind in fields]
+        self._struct = struct.Struct(">BB" + "".join(kind[0] for kind in kinds))
+        self._encoders = [kind[1] for kind in kinds]
+        self._decoders = [kind[2] for kind in kinds]
+        self._strings = strings
+
+    def encode(self, entity) -> bytes:
+        """Encode an ORM row or record."""
+        parts = [
+            self._struct.pack(
+                VERSION,
+                self.tag,
+                *(
+                    encode(getattr(entity, name))
+                    for name, encode in zip(self._names, self._encoders, strict=True)
+                ),
+            )
+        ]
+        for name in self._strings:
+            value = getattr(entity, name)
+            if value is None:
+                parts.append(_LENGTH.pack(_NO_STRING))
+            else:
+                data = value.encode()
+                parts.append(_LENGTH.pack(len(data)))
+                parts.append(data)
+        return b"".join(parts)
+
+    def decode(self, payload: bytes):
+        """Decode into a record, or None if it was written by another version or type."""
+        if len(payload) < 2 or payload[0] != VERSION or payload[1] != self.tag:
+            return None
+
+        values = self._struct.unpack_from(payload)
+        fields = {
+            name: decode(value)
+            for name, decode, value in zip(self._names, self._decoders, values[2:], strict=True)
+        }
+        offset = self._struct.size
+        for name in self._strings:
+            (length,) = _LENGTH.unpack_from(payload, offset)
+            offset += _LENGTH.size
+            if length == _NO_STRING:
+                fields[name] = None
+            else:
+                fields[name] = payload[offset:offset + length].decode()
+                offset += length
+        return self.record_type(**fields)
+
+
+ISSUE_CODEC = RecordCodec(
+    1,
+    IssueRecord,
+    [
+        ("id", "uuid"),
+        ("project_id", "uuid"),
+        ("status", "status"),
+        ("priority", "priority"),
+        ("created_at", "time"),
+        ("updated_at", "time"),
+    ],
+    ["title", "description"],
+)
+
+PROJECT_CODEC = RecordCodec(
+    2,
+    ProjectRecord,
+    [("id", "uuid"), ("owner_id", "uuid"), ("created_at", "time"), ("updated_at", "time")],
+    ["name", "description"],
+)
+
+USER_CODEC = RecordCodec(
+    3,
+    UserRecord,
+    [("id", "uuid"), ("created_at", "time")],
+    ["email"],
+)
+
+
+def encode_page(ids: list[UUID], total: int | None, next_cursor: str | None) -> bytes:
+    """A cached list page: the ids in order, the total and the next cursor."""
+    return b"".join(
+        [
+            _PAGE_HEADER.pack(VERSION, _PAGE_TAG, -1 if total is None else total, len(ids)),
+            *(entity_id.bytes for entity_id in ids),
+            (next_cursor or "").encode(),
+        ]
+    )
+
+
+def decode_page(payload: bytes) -> tuple[list[UUID], int | None, str | None] | None:
+    if len(payload) < _PAGE_HEADER.size or payload[0] != VERSION or payload[1] != _PAGE_TAG:
+        return None
+
+    _, _, total, count = _PAGE_HEADER.unpack_from(payload)
+    offset = _PAGE_HEADER.size
+    ids = [UUID(bytes=payload[offset + 16 * i:offset + 16 * (i + 1)]) for i in range(count)]
+    next_cursor = payload[offset + 16 * count:].decode() or None
+    return ids, None if total < 0 else total, next_cursor
@@ -16,9 +16,52 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["http://localhost:5173"]
     secret_key: str = "dev-secret-key"
     access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
+    # Trust the token's claims instead of loading the user on every request;
+    # the full user is only loaded by routes that need it (e.g. /users/me)
+    auth_stateless: bool = False
+    # Per-worker Bloom filter mirroring the revoked token ids kept in Redis
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
+    revocation_sync_seconds: float = 1.0
+    # Each sync re-reads this far back: revocations are scored by the revoking
+    # worker's clock, so one recorded late or by a lagging clock scores low
+    revocation_sync_overlap_seconds: float = 60.0
+    # Verified tokens kept per worker so repeat requests skip signature checks
+    token_cache_max_entries: int = 10_000
+    token_cache_ttl_seconds: int = 300
+    # bcrypt cost; existing hashes are upgraded on the next successful login
+    bcrypt_rounds: int = 12
+    # Threads hashing passwords, and how many calls may queue before we shed load
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
     database_url: str = "sqlite+aiosqlite:///./issue_tracker.db"
     redis_url: str = "redis://localhost:6379/0"
+    # Cache calls must fail fast: a slow Redis should cost latency, not availability
+    redis_socket_timeout_seconds: float = 0.25
+    redis_connect_timeout_seconds: float = 0.25
+    # Skip Redis after this many consecutive failures, probing again after the reset
+    cache_breaker_failure_threshold: int = 5
+    cache_breaker_reset_seconds: float = 5.0
+    # Rows per multi-row statement in bulk endpoints
+    bulk_chunk_size: int = 500
+    # Rows fetched per round trip from the server-side cursor of an export
+    export_batch_size: int = 1000
+    # Rows validated and committed per transaction by the streaming import
+    import_batch_size: int = 2000
+    # Longest line, or quoted multi-line CSV record, an import buffers before
+    # rejecting the file; keeps memory bounded when no newline ever comes
+    import_max_line_length: int = 1_000_000
     cache_ttl_seconds: int = 3600  # Default 1 hour
+    cache_ttl_jitter: float = 0.1  # TTLs are shortened by up to 10% at random
+    cache_negative_ttl_seconds: int = 30  # How long unknown ids are remembered
+    # Cached list pages; writes invalidate them, the TTL only bounds garbage
+    cache_list_ttl_seconds: int = 300
+    # Cross-worker lock held while one worker reloads an expired key
+    cache_lock_ttl_ms: int = 2000
+    cache_lock_wait_ms: int = 250
+    # In-process L1 cache in front of Redis, per worker
+    cache_l1_max_entries: int = 10_000
+    cache_l1_ttl_seconds: int = 30
 
     # Configuration to load from .env file and ignore extra environment variables
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
@@ -1,62 +1,85 @@
-import json
-from datetime import datetime
 from uuid import UUID
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.authorization import require_owner
+from app.core.authorization import Principal, require_owner
+from app.core.codec import USER_CODEC, UserRecord
+from app.core.config import settings
 from app.core.errors import ErrorCodes
 from app.core.http_exceptions import not_found, unauthorized
-from app.core.jwt import decode_token
+from app.core.jwt import decode_claims
 from app.core.redis import get_cache, set_cache
+from app.core.revocation import revocation_list
 from app.db.models.issue import Issue
 from app.db.models.project import Project
 from app.db.models.user import User
 from app.db.session import get_db
-from app.schemas.user import UserOut
 from app.services.issue_service import issue_service
 from app.services.project_service import project_service
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def get_token_principal(token: str = Depends(oauth2_scheme)) -> Principal:
     try:
-        user_id = decode_token(token)
+        claims = decode_claims(token)
+        principal = Principal(
+            id=UUID(claims["sub"]), jti=claims.get("jti"), expires_at=claims["exp"]
+        )
     except Exception:
         unauthorized("Invalid token")
 
+    if await revocation_list.is_revoked(principal.jti):
+        unauthorized("Token has been revoked")
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_token_principal),
+    db: AsyncSession = Depends(get_db),
+) -> User | UserRecord:
+    user_id = principal.id
+
     # Try to get from cache
     cache_key = f"user:{user_id}"
     cached_user = await get_cache(cache_key)
     if cached_user:
-        user_data = json.loads(cached_user)
-        # Convert strings back to correct types
-        user_data["id"] = UUID(user_data["id"])
-        if "created_at" in user_data:
-            user_data["created_at"] = datetime.fromisoformat(user_data["created_at"])
-        return User(**user_data)
-
-    user = await db.get(User, UUID(user_id))
+        user = USER_CODEC.decode(cached_user)
+        if user:
+            return user
+
+    user = await db.get(User, user_id)
     if not user:
         unauthorized("User not found")
 
     # Set cache for 10 minutes
-    user_out = UserOut.model_validate(user)
-    await set_cache(cache_key, user_out.model_dump_json(), expire=600)
+    await set_cache(cache_key, USER_CODEC.encode(user), expire=600)
 
     return user
 
 
+async def get_current_principal(
+    principal: Principal = Depends(get_token_principal),
+    db: AsyncSession = Depends(get_db),
+) -> Principal | User | UserRecord:
+    """
+    The caller, for routes that only need their id.
+
+    In stateless mode this is the token's principal, with no cache or database
+    lookup; a deleted user's tokens then keep working until they expire or are
+    revoked. Otherwise it is the full user, as from `get_current_user`.
+    """
+    if settings.auth_stateless:
+        return principal
+    return await get_current_user(principal, db)
+
+
 async def get_project_for_user(
     project_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Project:
     project = await project_service.get(db, project_id)
     if not project:
@@ -71,7 +94,7 @@ async def get_project_for_user(
 async def get_issue_for_user(
     issue_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Issue:
     issue = await issue_service.get(db, issue_id)
     if not issue:
@@ -80,5 +103,11 @@ async def get_issue_for_user(
             "Issue not found",
         )
     project = await project_service.get(db, issue.project_id)
+    if not project:
+        # Cached issue of a project deleted since; its rows cascaded away
+        not_found(
+            ErrorCodes.ISSUE_NOT_FOUND,
+            "Issue not found",
+        )
     require_owner(project.owner_id, current_user.id)
     return issue
@@ -5,6 +5,8 @@ class ErrorCodes:
     INTERNAL_ERROR = "INTERNAL_ERROR"
     AUTHENTICATION_ERROR = "AUTHENTICATION_ERROR"
     AUTHORIZATION_ERROR = "AUTHORIZATION_ERROR"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+    INVALID_FILE = "INVALID_FILE"
 
 
 class AppException(Exception):
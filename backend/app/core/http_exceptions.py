@@ -33,3 +33,11 @@ def forbidden(message: str = "Permission denied"):
         code=ErrorCodes.AUTHORIZATION_ERROR,
         message=message
     )
+
+
+def service_unavailable(message: str):
+    raise AppException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        code=ErrorCodes.SERVICE_UNAVAILABLE,
+        message=message
+    )
@@ -1,11 +1,19 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 from jose import jwt
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 
 ALGORITHM = "HS256"
 
+# Claims of tokens that already passed verification, keyed by token digest.
+# Entries never outlive the token's `exp`.
+_verified = LRUCache(settings.token_cache_max_entries, settings.token_cache_ttl_seconds)
+
 
 def create_access_token(subject: str) -> str:
     expire = datetime.utcnow() + timedelta(
@@ -14,14 +22,27 @@ def create_access_token(subject: str) -> str:
     payload = {
         "sub": subject,
         "exp": expire,
+        # Token id, so a single token can be revoked
+        "jti": uuid4().hex,
     }
     return jwt.encode(payload, settings.secret_key, algorithm=ALGORITHM)
 
 
-def decode_token(token: str) -> str:
-    payload = jwt.decode(
+def decode_claims(token: str) -> dict:
+    """Verified claims of `token`; repeat calls with the same token skip verification."""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    claims = _verified.get(key)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(
         token,
         settings.secret_key,
         algorithms=[ALGORITHM],
     )
-    return payload["sub"]
+    _verified.set(key, claims, ttl=claims["exp"] - time.time())
+    return claims
+
+
+def decode_token(token: str) -> str:
+    return decode_claims(token)["sub"]
@@ -0,0 +1,109 @@
+import hashlib
+import json
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+import app.core.redis as cache
+from app.core.codec import decode_page, encode_page
+from app.core.config import settings
+from app.core.loader import EntityLoader, cache_key, encode_entity
+from app.core.responses import Validators, make_etag
+
+
+def project_scope(project_id: UUID) -> str:
+    return f"project:{project_id}"
+
+
+def owner_scope(owner_id: UUID) -> str:
+    return f"owner:{owner_id}"
+
+
+def generation_key(scope: str) -> str:
+    return f"gen:{scope}"
+
+
+async def bump_generations(*scopes: str):
+    """Invalidate every cached list page of these scopes."""
+    await cache.incr_cache_many([generation_key(scope) for scope in scopes])
+
+
+async def cached_page(
+    db: AsyncSession,
+    model,
+    scopes: list[str],
+    params: dict,
+    fetch,
+    partial: bool = False,
+):
+    """
+    Serve a list page from the result cache, or run `fetch` and cache its ids.
+
+    The key hashes the normalized `params` together with the current generation
+    of each scope; writes bump the generations, so stale pages are never looked
+    up again and simply expire. Generations are read with `get_counters_many`,
+    so one reset by eviction restarts at a random value rather than at values
+    old pages were keyed with; without Redis the cache is skipped. Cached pages
+    hold only ids, the total and the next cursor; entities are hydrated through
+    the request's `EntityLoader`.
+    `fetch` is a coroutine function returning `(items, total, next_cursor)`;
+    with `partial` its items are rows of some columns only (a sparse fieldset),
+    which are paged and returned as usual but not cached as entities. Pages
+    hold ids only, so leave the fieldset out of `params`: requests that differ
+    just in their columns then share the cached page.
+    """
+    generations = await cache.get_counters_many([generation_key(scope) for scope in scopes])
+    if generations is None:
+        return await fetch()
+    key = "list:" + hashlib.sha256(
+        json.dumps(
+            {
+                "model": model.__tablename__,
+                "scopes": scopes,
+                # Read before the query runs, so a page fetched around a write
+                # is stored under the generation it may be stale for
+                "generations": generations,
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+
+    payload = await cache.get_cache(key)
+    page = decode_page(payload) if payload else None
+    if page:
+        ids, total, next_cursor = page
+        loaded = await EntityLoader.for_session(db).load_many(model, ids)
+        # An entity gone without a generation bump (e.g. cascaded) means a stale page
+        if all(entity is not None for entity in loaded.values()):
+            return [loaded[entity_id] for entity_id in ids], total, next_cursor
+
+    items, total, next_cursor = await fetch()
+    if not partial:
+        # Warm the entity cache too, so the next hit needs no database at all
+        await cache.set_cache_many(
+            {cache_key(model, item.id): encode_entity(model, item) for item in items}
+        )
+    await cache.set_cache(
+        key,
+        encode_page([item.id for item in items], total, next_cursor),
+        expire=settings.cache_list_ttl_seconds,
+    )
+    return items, total, next_cursor
+
+
+async def list_validators(scopes: list[str], request: Request) -> Validators:
+    """
+    Validators of a list response: its URL and the current generations of its scopes.
+
+    Any write to the scopes changes the ETag, so a matching If-None-Match is
+    answered from the counters alone, before the page is fetched. With Redis
+    unavailable there is no ETag and every request gets the full list.
+    """
+    generations = await cache.get_counters_many([generation_key(scope) for scope in scopes])
+    if generations is None:
+        return Validators(None)
+    query = sorted(request.query_params.multi_items())
+    return Validators(make_etag(request.url.path, query, scopes, generations))
@@ -0,0 +1,129 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+import app.core.redis as cache
+from app.core.cache import MISSING
+from app.core.codec import ISSUE_CODEC, PROJECT_CODEC
+from app.core.config import settings
+from app.db.models.issue import Issue
+from app.db.models.project import Project
+
+# Models cached as "<prefix>:<id>" with their binary codec
+CACHED_MODELS = {
+    Issue: ("issue", ISSUE_CODEC),
+    Project: ("project", PROJECT_CODEC),
+}
+
+
+def cache_key(model, entity_id: UUID) -> str:
+    return f"{CACHED_MODELS[model][0]}:{entity_id}"
+
+
+def encode_entity(model, entity) -> bytes:
+    return CACHED_MODELS[model][1].encode(entity)
+
+
+def decode_entity(model, payload: bytes):
+    """Read-only record for a cache hit, or None if the entry is from another codec version."""
+    return CACHED_MODELS[model][1].decode(payload)
+
+
+class EntityLoader:
+    """
+    Request-scoped, batching loader for cached entities.
+
+    One loader lives in each session's `info`, so the auth dependencies and the
+    service layer share what has already been loaded during the request. Misses
+    go to the entity cache in one MGET and then to the database in one
+    `IN (...)` query. Rows loaded from the database stay attached to the
+    request's session, so a later `db.get` for a write is served from the
+    identity map instead of fetching the row again. Cache hits come back as
+    read-only records (see `app.core.codec`), not ORM objects.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._loaded: dict[tuple[type, UUID], object] = {}
+
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "EntityLoader":
+        loader = db.info.get("entity_loader")
+        if loader is None:
+            loader = db.info["entity_loader"] = cls(db)
+        return loader
+
+    async def load(self, model, entity_id: UUID):
+        if (model, entity_id) in self._loaded:
+            return self._loaded[(model, entity_id)]
+
+        entity = None
+
+        async def load_row():
+            nonlocal entity
+            rows = await self._fetch_rows(model, [entity_id])
+            entity = rows.get(entity_id)
+            return encode_entity(model, entity) if entity else None
+
+        key = cache_key(model, entity_id)
+        payload = await cache.get_or_load_cache(key, load_row)
+        if entity is None and payload:
+            entity = decode_entity(model, payload)
+            if entity is None:
+                # Written by another codec version; replace it
+                await load_row()
+                if entity is not None:
+                    await cache.set_cache(key, encode_entity(model, entity))
+
+        self._loaded[(model, entity_id)] = entity
+        return entity
+
+    async def load_many(self, model, ids) -> dict[UUID, object]:
+        ids = list(dict.fromkeys(ids))
+        pending = [entity_id for entity_id in ids if (model, entity_id) not in self._loaded]
+
+        if pending:
+            payloads = await cache.get_cache_many([cache_key(model, i) for i in pending])
+            misses = []
+            for entity_id, payload in zip(pending, payloads, strict=True):
+                if payload == MISSING:
+                    self._loaded[(model, entity_id)] = None
+                    continue
+                entity = decode_entity(model, payload) if payload is not None else None
+                if entity is None:
+                    misses.append(entity_id)
+                else:
+                    self._loaded[(model, entity_id)] = entity
+
+            if misses:
+                rows = await self._fetch_rows(model, misses)
+                await cache.set_cache_many(
+                    {cache_key(model, i): encode_entity(model, row) for i, row in rows.items()}
+                )
+                missing = [i for i in misses if i not in rows]
+                await cache.set_cache_many(
+                    {cache_key(model, i): MISSING for i in missing},
+                    expire=settings.cache_negative_ttl_seconds,
+                )
+                for entity_id in misses:
+                    self._loaded[(model, entity_id)] = rows.get(entity_id)
+
+        return {entity_id: self._loaded[(model, entity_id)] for entity_id in ids}
+
+    def forget(self, model, entity_id: UUID):
+        self._loaded.pop((model, entity_id), None)
+
+    async def _fetch_rows(self, model, ids: list[UUID]) -> dict[UUID, object]:
+        stmt = select(model).filter(model.id.in_(ids))
+        if model is Issue:
+            # Authorization needs the project next; fetch it in the same query
+            stmt = stmt.options(joinedload(Issue.project))
+
+        result = await self.db.execute(stmt)
+        rows = {row.id: row for row in result.scalars().all()}
+        if model is Issue:
+            for issue in rows.values():
+                self._loaded.setdefault((Project, issue.project_id), issue.project)
+        return rows
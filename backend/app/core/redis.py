@@ -1,26 +1,143 @@
+import secrets
+
 import redis.asyncio as redis
+from redis.exceptions import RedisError
+from app.core.cache import CircuitBreaker, LRUCache, TieredCache
 from app.core.config import settings
 
-# Global variable to hold the pool, but initialized lazily
+# Global variables to hold the pools, but initialized lazily
 _redis_pool = None
+_pubsub_pool = None
 
 def get_redis_client():
     global _redis_pool
     if _redis_pool is None:
-        _redis_pool = redis.ConnectionPool.from_url(settings.redis_url, decode_responses=True)
+        # Cached values are binary (see app.core.codec), so responses stay bytes
+        _redis_pool = redis.ConnectionPool.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout_seconds,
+            socket_connect_timeout=settings.redis_connect_timeout_seconds,
+        )
     return redis.Redis(connection_pool=_redis_pool)
 
-async def set_cache(key: str, value: str, expire: int = settings.cache_ttl_seconds):
-    """Set a value in Redis with an optional expiration."""
-    client = get_redis_client()
-    await client.set(key, value, ex=expire)
+def get_pubsub_client():
+    """Client for the invalidation listener, which blocks on reads by design."""
+    global _pubsub_pool
+    if _pubsub_pool is None:
+        _pubsub_pool = redis.ConnectionPool.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=settings.redis_connect_timeout_seconds,
+            health_check_interval=30,
+        )
+    return redis.Redis(connection_pool=_pubsub_pool)
+
+# Sorted set of revoked token ids, scored by revocation time
+REVOKED_TOKENS_KEY = "auth:revoked"
+
+# Per-worker L1 for the entity entries read on almost every request
+tiered_cache = TieredCache(
+    get_redis_client,
+    LRUCache(settings.cache_l1_max_entries, settings.cache_l1_ttl_seconds),
+    # List pages are safe locally: their keys embed the generations they were read at
+    l1_prefixes=("user:", "project:", "issue:", "list:"),
+    ttl_jitter=settings.cache_ttl_jitter,
+    negative_ttl=settings.cache_negative_ttl_seconds,
+    lock_ttl_ms=settings.cache_lock_ttl_ms,
+    lock_wait_ms=settings.cache_lock_wait_ms,
+    breaker=CircuitBreaker(
+        settings.cache_breaker_failure_threshold, settings.cache_breaker_reset_seconds
+    ),
+    errors=(RedisError, OSError),
+    pubsub_factory=get_pubsub_client,
+)
+
+async def set_cache(key: str, value: bytes, expire: int = settings.cache_ttl_seconds):
+    """Set a value in Redis (and the local L1) with an optional expiration."""
+    await tiered_cache.set(key, value, expire)
+
+async def get_cache(key: str) -> bytes | None:
+    """Get a value from the local L1, falling back to Redis."""
+    return await tiered_cache.get(key)
+
+async def get_cache_many(keys: list[str]) -> list[bytes | None]:
+    """Get several values with one MGET (after the local L1)."""
+    return await tiered_cache.get_many(keys)
+
+async def set_cache_many(items: dict[str, bytes], expire: int = settings.cache_ttl_seconds):
+    """Set several values in one pipelined round trip."""
+    await tiered_cache.set_many(items, expire)
+
+async def incr_cache_many(keys: list[str]):
+    """Increment several counters in one pipelined round trip."""
+    await tiered_cache.incr_many(keys)
+
+async def get_counters_many(keys: list[str]) -> list[int] | None:
+    """
+    Current values of several counters; None if Redis is unavailable.
 
-async def get_cache(key: str) -> str | None:
-    """Get a value from Redis."""
-    client = get_redis_client()
-    return await client.get(key)
+    Missing counters (never incremented, or evicted) are first set to a random
+    value, so one that comes back does not repeat values it had before.
+    """
+    async def read(client):
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, secrets.randbits(48), nx=True)
+            pipe.mget(keys)
+            *_, values = await pipe.execute()
+        return [int(value) for value in values]
+
+    return await tiered_cache.run(read)
+
+async def get_or_load_cache(key: str, loader, expire: int = settings.cache_ttl_seconds):
+    """Cache-aside read that runs at most one `loader` per key at a time."""
+    return await tiered_cache.get_or_load(key, loader, expire)
 
 async def delete_cache(key: str):
-    """Delete a value from Redis."""
-    client = get_redis_client()
-    await client.delete(key)
+    """Delete a value from Redis and from every worker's L1."""
+    await tiered_cache.delete(key)
+
+async def delete_cache_many(keys: list[str]):
+    """Delete several values in one pipelined round trip, everywhere."""
+    await tiered_cache.delete_many(keys)
+
+async def mark_missing_cache(key: str):
+    """Cache a short-lived "does not exist" entry, e.g. after a delete."""
+    await tiered_cache.mark_missing(key)
+
+async def add_revoked_token(jti: str, revoked_at: float) -> bool:
+    """Record a revoked token id; False if Redis is unavailable."""
+    async def add(client):
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zadd(REVOKED_TOKENS_KEY, {jti: revoked_at})
+            # Anything revoked longer ago than a token lives has expired anyway
+            pipe.zremrangebyscore(
+                REVOKED_TOKENS_KEY, "-inf", revoked_at - settings.access_token_expire_minutes * 60
+            )
+            await pipe.execute()
+        return True
+
+    return await tiered_cache.run(add, default=False)
+
+async def is_token_revoked(jti: str) -> bool:
+    """Exact revocation check; fails closed while Redis is unavailable."""
+    unavailable = object()
+    score = await tiered_cache.run(
+        lambda client: client.zscore(REVOKED_TOKENS_KEY, jti), default=unavailable
+    )
+    # The sentinel is not None either: unconfirmed Bloom hits count as revoked
+    return score is not None
+
+async def revoked_tokens_since(since: float) -> list[tuple[str, float]]:
+    """Token ids revoked after `since`, with their revocation times."""
+    rows = await tiered_cache.run(
+        lambda client: client.zrangebyscore(
+            REVOKED_TOKENS_KEY, f"({since}", "+inf", withscores=True
+        ),
+        default=[],
+    )
+    return [(jti.decode(), revoked_at) for jti, revoked_at in rows]
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters per cache tier and the Redis circuit breaker state."""
+    return tiered_cache.snapshot()
@@ -0,0 +1,140 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from operator import attrgetter
+
+import orjson
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.core.errors import ErrorCodes
+from app.core.http_exceptions import bad_request
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON rendered by orjson, which handles UUIDs, datetimes, enums and
+    dataclasses natively. UTC datetimes end in "Z", as Pydantic writes them.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+class Projection:
+    """
+    Reads a schema's fields straight off an ORM row or cached record.
+
+    For read paths whose items already have the schema's shape and types, so
+    per-item validation can be skipped. Routes returning the result still
+    declare the schema as response_model, which keeps the OpenAPI document.
+    """
+
+    def __init__(self, schema: type[BaseModel], fields: Iterable[str] | None = None):
+        wanted = None if fields is None else set(fields)
+        # In schema order, so sparse and full items list their keys alike
+        self.fields = tuple(
+            name for name in schema.model_fields if wanted is None or name in wanted
+        )
+        getter = attrgetter(*self.fields)
+        # attrgetter returns a bare value, not a 1-tuple, for a single name
+        self._get = getter if len(self.fields) > 1 else lambda item: (getter(item),)
+
+    def __call__(self, item) -> dict:
+        return dict(zip(self.fields, self._get(item), strict=True))
+
+    def many(self, items) -> list[dict]:
+        fields, get = self.fields, self._get
+        return [dict(zip(fields, get(item), strict=True)) for item in items]
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    """
+    A comma-separated sparse fieldset, in schema order and always with the id.
+
+    None means every field, whether nothing or all of them were asked for.
+    """
+    if not fields:
+        return None
+    wanted = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = wanted - schema.model_fields.keys()
+    if unknown:
+        bad_request(
+            ErrorCodes.VALIDATION_ERROR,
+            f"Unknown fields: {', '.join(sorted(unknown))}",
+            {"allowed": list(schema.model_fields)},
+        )
+    wanted.add("id")
+    if wanted == schema.model_fields.keys():
+        return None
+    return tuple(name for name in schema.model_fields if name in wanted)
+
+
+# Part of every ETag; bump when a response's shape changes, so clients holding
+# the old shape do not get a 304 for it
+ETAG_VERSION = 1
+
+
+def make_etag(*parts) -> str:
+    """A strong ETag hashing `parts`."""
+    digest = hashlib.sha256(":".join(map(str, (ETAG_VERSION, *parts))).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+@dataclass(slots=True, frozen=True)
+class Validators:
+    """
+    The ETag and Last-Modified date of a response, for conditional GETs.
+
+    Without an ETag (e.g. list versions unavailable) nothing is sent and no
+    request matches, so clients always get the full response.
+    """
+
+    etag: str | None
+    last_modified: datetime | None = None
+
+    @classmethod
+    def for_entity(cls, entity) -> "Validators":
+        """From an issue's or project's last change; ORM rows and cached records agree."""
+        changed = entity.updated_at or entity.created_at
+        if changed.tzinfo is None:
+            changed = changed.replace(tzinfo=UTC)
+        changed = changed.astimezone(UTC)
+        return cls(make_etag(entity.id, changed.isoformat()), changed)
+
+    def matches(self, request: Request) -> bool:
+        """Whether the client's copy is current, so a 304 can be sent (RFC 9110 13.2.2)."""
+        if self.etag is None:
+            return False
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison; If-Modified-Since is ignored once If-None-Match is sent
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if self.last_modified is None or if_modified_since is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # HTTP dates have whole seconds
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def headers(self) -> dict[str, str]:
+        if self.etag is None:
+            return {}
+        # Revalidate on every use, rather than reusing a heuristically fresh copy
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
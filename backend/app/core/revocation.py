@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+
+import app.core.redis as cache
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    Deny list of revoked token ids (`jti`).
+
+    Redis holds the exact list. Each worker mirrors it into a Bloom filter,
+    refreshed in the background, so checking a token that was never revoked
+    (nearly every request) costs no I/O. Only Bloom hits are confirmed
+    against Redis, to rule out false positives.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_seconds: float,
+        sync_overlap_seconds: float = 60.0,
+    ):
+        self._bloom = BloomFilter(capacity, error_rate)
+        self.sync_seconds = sync_seconds
+        self.sync_overlap_seconds = sync_overlap_seconds
+        self._synced_until = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def revoke(self, jti: str) -> bool:
+        """Revoke a token id everywhere; False if Redis could not record it."""
+        self._bloom.add(jti)
+        return await cache.add_revoked_token(jti, time.time())
+
+    async def is_revoked(self, jti: str | None) -> bool:
+        if jti is None or jti not in self._bloom:
+            return False
+        return await cache.is_token_revoked(jti)
+
+    async def sync(self):
+        """
+        Add ids revoked by other workers since the last sync.
+
+        Scores come from each revoking worker's clock, so an id can land below
+        the newest score already seen. Each sync re-reads an overlap window
+        below that score to catch it; ids already in the filter are re-added.
+        """
+        since = self._synced_until - self.sync_overlap_seconds
+        for jti, revoked_at in await cache.revoked_tokens_since(since):
+            self._bloom.add(jti)
+            self._synced_until = max(self._synced_until, revoked_at)
+
+    async def run_sync(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.warning("Revocation list sync failed; retrying", exc_info=True)
+            await asyncio.sleep(self.sync_seconds)
+
+    def start_sync(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run_sync())
+
+    async def stop_sync(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+revocation_list = RevocationList(
+    settings.revocation_bloom_capacity,
+    settings.revocation_bloom_error_rate,
+    settings.revocation_sync_seconds,
+    settings.revocation_sync_overlap_seconds,
+)
@@ -1,6 +1,21 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.core.http_exceptions import service_unavailable
+
+# Hashes made with another cost are still accepted and flagged for rehashing
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
+
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop
+_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+)
+_pending = 0
 
 
 def hash_password(password: str) -> str:
@@ -9,3 +24,30 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
+
+
+async def _offload(fn, *args):
+    """
+    Run a hashing call on the executor.
+
+    Beyond `password_hash_max_pending` queued calls we fail fast with a 503
+    instead of letting a login burst build a queue every request waits behind.
+    """
+    global _pending
+    if _pending >= settings.password_hash_max_pending:
+        service_unavailable("Too many sign-ins in progress, please retry shortly")
+
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _offload(pwd_context.hash, password)
+
+
+async def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify a password; also returns a new hash if the stored one uses an outdated cost."""
+    return await _offload(pwd_context.verify_and_update, password, hashed)
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IssueCounter(Base):
+    """Issue count per (status, priority) for one project or one owner."""
+
+    __tablename__ = "issue_counters"
+
+    # "project" or "owner"; scope_id is the project id or the owner's user id
+    scope: Mapped[str] = mapped_column(String(10), primary_key=True)
+    scope_id: Mapped[UUID] = mapped_column(primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    priority: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ProjectCounter(Base):
+    """Number of projects per owner."""
+
+    __tablename__ = "project_counters"
+
+    owner_id: Mapped[UUID] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
@@ -1,14 +1,43 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import (
+    DDL,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    SmallInteger,
+    String,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.codec import PRIORITIES, STATUSES
 from app.db.base import Base
 
 
+def rank_expression(column: str, values: tuple[str, ...]) -> str:
+    """SQL mapping each enum value to its position in `values`."""
+    cases = " ".join(f"WHEN '{value}' THEN {rank}" for rank, value in enumerate(values))
+    return f"CASE {column} {cases} END"
+
+
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        # Serves list_by_project for every status/priority filter combination
+        Index(
+            "ix_issues_project_status_priority_rank_created",
+            "project_id",
+            "status_rank",
+            "priority_rank",
+            "created_at",
+        ),
+        # Sort columns within a project
+        Index("ix_issues_project_created", "project_id", "created_at"),
+        Index("ix_issues_project_priority_rank", "project_id", "priority_rank"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
 
@@ -24,8 +53,71 @@ class Issue(Base):
     description: Mapped[str | None] = mapped_column(String(1000))
     status: Mapped[str] = mapped_column(String(20))
     priority: Mapped[str] = mapped_column(String(20))
+    # Semantic order of status/priority (open < in_progress < done, low < medium
+    # < high) as generated integers, so sorting and filtering can use an index.
+    # Virtual on SQLite, stored on Postgres; never written by the application.
+    status_rank: Mapped[int] = mapped_column(
+        SmallInteger, Computed(rank_expression("status", STATUSES))
+    )
+    priority_rank: Mapped[int] = mapped_column(
+        SmallInteger, Computed(rank_expression("priority", PRIORITIES))
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
     )
     updated_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+
+# Full-text index over title and description. SQLite keeps an external-content
+# FTS5 table in step with triggers; Postgres a generated, GIN-indexed tsvector.
+# Neither is mapped: app.services.search_service queries them directly.
+SEARCH_DDL = {
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(
+            title, description,
+            content='issues', content_rowid='rowid', tokenize='porter unicode61'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS issues_fts_insert AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS issues_fts_delete AFTER DELETE ON issues BEGIN
+            INSERT INTO issues_fts (issues_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS issues_fts_update
+        AFTER UPDATE OF title, description ON issues BEGIN
+            INSERT INTO issues_fts (issues_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO issues_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        ALTER TABLE issues ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A')
+            || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX ix_issues_search_vector ON issues USING gin (search_vector)",
+    ],
+}
+
+for _dialect, _statements in SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Issue.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(
+    Issue.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS issues_fts").execute_if(dialect="sqlite"),
+)
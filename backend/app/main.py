@@ -1,5 +1,8 @@
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -7,12 +10,27 @@ from fastapi.responses import JSONResponse
 from app.api.v1.router import router as v1_router
 from app.core.config import settings
 from app.core.errors import AppException, ErrorCodes
+from app.core.redis import tiered_cache
+from app.core.revocation import revocation_list
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker listens for cache deletes made by the others
+    tiered_cache.start_listener()
+    # ...and mirrors the tokens they revoke
+    revocation_list.start_sync()
+    yield
+    await revocation_list.stop_sync()
+    await tiered_cache.stop_listener()
+
+
 app = FastAPI(
     title=settings.app_name,
+    lifespan=lifespan,
     # Hide the default documentation if desired, or keep it.
     # We will mostly use standard JSON responses.
 )
@@ -38,7 +56,8 @@ async def validation_exception_handler(request, exc: RequestValidationError):
             "error": {
                 "code": ErrorCodes.VALIDATION_ERROR,
                 "message": "Validation failed",
-                "details": {"errors": exc.errors()},
+                # Errors from model validators carry the exception in their ctx
+                "details": {"errors": jsonable_encoder(exc.errors())},
             }
         },
     )
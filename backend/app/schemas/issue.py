@@ -1,8 +1,9 @@
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class IssueStatus(str, Enum):
@@ -41,3 +42,77 @@ class IssueOut(IssueBase):
     updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class IssueSearchHit(IssueOut):
+    # Higher is more relevant; only comparable within one search
+    rank: float
+    # Best matching fragment, HTML-escaped, with matches wrapped in <mark>
+    snippet: str
+
+
+MAX_BULK_ITEMS = 5000
+
+
+class IssueBulkCreate(BaseModel):
+    # Validated item by item, so one bad row does not reject the whole batch
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: UUID | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+class IssueBulkCreateOut(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+class IssueFilter(BaseModel):
+    project_id: UUID | None = None
+    status: IssueStatus | None = None
+    priority: IssuePriority | None = None
+
+
+class IssueBulkSelection(BaseModel):
+    """Issues to act on: either explicit ids or a filter, within the caller's projects."""
+
+    ids: list[UUID] | None = Field(None, min_length=1, max_length=MAX_BULK_ITEMS)
+    filter: IssueFilter | None = None
+
+    @model_validator(mode="after")
+    def check_one_selector(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        return self
+
+
+class IssueBulkUpdate(IssueBulkSelection):
+    changes: IssueUpdate
+    return_items: bool = False
+
+    @model_validator(mode="after")
+    def check_changes(self):
+        if not self.changes.model_fields_set:
+            raise ValueError("changes must set at least one field")
+        # Only the description may be cleared; the other columns are required
+        nulls = [
+            name
+            for name in ("title", "status", "priority")
+            if name in self.changes.model_fields_set and getattr(self.changes, name) is None
+        ]
+        if nulls:
+            raise ValueError(f"changes cannot set {', '.join(nulls)} to null")
+        return self
+
+
+class IssueBulkUpdateOut(BaseModel):
+    updated: int
+    items: list[IssueOut] | None = None
+
+
+class IssueBulkDeleteOut(BaseModel):
+    deleted: int
@@ -8,4 +8,5 @@ class Page(BaseModel, Generic[T]):
     items: list[T]
     page: int
     page_size: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
@@ -1,6 +1,14 @@
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
 
+class TotalMode(str, Enum):
+    exact = "exact"
+    estimated = "estimated"
+    none = "none"
+
+
 class PaginationParams(BaseModel):
     page: int = Field(1, ge=1, description="Page number (1-based)")
     page_size: int = Field(
@@ -9,6 +17,14 @@ class PaginationParams(BaseModel):
         le=100,
         description="Items per page (max 100)",
     )
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor from a previous page's next_cursor; overrides page",
+    )
+    include_total: TotalMode = Field(
+        TotalMode.exact,
+        description="How to compute total: exact, estimated from statistics, or none",
+    )
 
     @property
     def offset(self) -> int:
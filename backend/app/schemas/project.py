@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.stats import IssueCounts
+
 
 class ProjectBase(BaseModel):
     name: str = Field(..., min_length=2, max_length=100)
@@ -22,5 +24,10 @@ class ProjectOut(ProjectBase):
     id: UUID
     owner_id: UUID
     created_at: datetime
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectWithCountsOut(ProjectOut):
+    issue_counts: IssueCounts | None = None
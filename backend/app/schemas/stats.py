@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class IssueCounts(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    by_priority: dict[str, int]
+
+
+class StatsOut(BaseModel):
+    projects: int
+    issues: IssueCounts
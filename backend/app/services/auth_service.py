@@ -3,9 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.user import User
 
+from app.core.authorization import Principal
 from app.core.jwt import create_access_token
-from app.core.security import verify_password, hash_password
-from app.core.http_exceptions import bad_request
+from app.core.revocation import revocation_list
+from app.core.security import hash_password_async, verify_and_update_password
+from app.core.http_exceptions import bad_request, service_unavailable
 from app.core.errors import ErrorCodes
 
 class AuthService:
@@ -17,10 +19,17 @@ class AuthService:
         if not user:
             return None
 
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await verify_and_update_password(password, user.hashed_password)
+        if not valid:
             return None
 
-        return create_access_token(subject=str(user.id))
+        token = create_access_token(subject=str(user.id))
+        if new_hash:
+            # Stored with an outdated bcrypt cost; upgrade it now we know the password
+            user.hashed_password = new_hash
+            await db.commit()
+
+        return token
 
     async def register(self, db: AsyncSession, email: str, password: str):
         stmt = select(User).filter(User.email == email)
@@ -33,12 +42,21 @@ class AuthService:
 
         user = User(
             email=email,
-            hashed_password=hash_password(password)
+            hashed_password=await hash_password_async(password)
         )
         db.add(user)
         await db.commit()
         await db.refresh(user)
         return create_access_token(subject=str(user.id))
 
+    async def revoke(self, principal: Principal):
+        if principal.jti is None:
+            bad_request(
+                code=ErrorCodes.VALIDATION_ERROR,
+                message="Token cannot be revoked; it predates token ids"
+            )
+        if not await revocation_list.revoke(principal.jti):
+            service_unavailable("Could not revoke the token, please retry")
+
 
 auth_service = AuthService()
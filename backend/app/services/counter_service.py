@@ -0,0 +1,264 @@
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.counter import IssueCounter, ProjectCounter
+from app.db.models.issue import Issue
+from app.db.models.project import Project
+from app.schemas.issue import IssuePriority, IssueStatus
+from app.schemas.stats import IssueCounts
+
+PROJECT_SCOPE = "project"
+OWNER_SCOPE = "owner"
+
+
+def _insert(db: AsyncSession, model):
+    if db.bind.dialect.name == "postgresql":
+        return pg_insert(model)
+    return sqlite_insert(model)
+
+
+class CounterService:
+    """
+    Incrementally maintained issue and project counts.
+
+    Writers call these helpers before committing, so counters change in the same
+    transaction as the rows they describe. Readers get O(1) lookups instead of
+    COUNT queries over the issues table.
+    """
+
+    async def add_issues(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        owner_id: UUID | None,
+        status: str,
+        priority: str,
+        delta: int = 1,
+    ):
+        await self._bump(db, PROJECT_SCOPE, project_id, status, priority, delta)
+        if owner_id:
+            await self._bump(db, OWNER_SCOPE, owner_id, status, priority, delta)
+
+    async def move_issue(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        owner_id: UUID | None,
+        old: tuple[str, str],
+        new: tuple[str, str],
+    ):
+        if old == new:
+            return
+        await self.add_issues(db, project_id, owner_id, *old, delta=-1)
+        await self.add_issues(db, project_id, owner_id, *new, delta=1)
+
+    async def add_projects(self, db: AsyncSession, owner_id: UUID | None, delta: int = 1):
+        if not owner_id:
+            return
+        stmt = _insert(db, ProjectCounter).values(owner_id=owner_id, count=delta)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["owner_id"],
+            set_={"count": ProjectCounter.count + stmt.excluded.count},
+        )
+        await db.execute(stmt)
+
+    async def drop_project(self, db: AsyncSession, project_id: UUID, owner_id: UUID | None):
+        """Remove a project's counters and subtract its issues from the owner's."""
+        scope_filter = (
+            IssueCounter.scope == PROJECT_SCOPE,
+            IssueCounter.scope_id == project_id,
+        )
+        if owner_id:
+            result = await db.execute(select(IssueCounter).filter(*scope_filter))
+            for row in result.scalars().all():
+                if row.count:
+                    await self._bump(
+                        db, OWNER_SCOPE, owner_id, row.status, row.priority, -row.count
+                    )
+
+        await db.execute(delete(IssueCounter).filter(*scope_filter))
+        await self.add_projects(db, owner_id, delta=-1)
+
+    async def _bump(
+        self,
+        db: AsyncSession,
+        scope: str,
+        scope_id: UUID,
+        status: str,
+        priority: str,
+        delta: int,
+    ):
+        stmt = _insert(db, IssueCounter).values(
+            scope=scope,
+            scope_id=scope_id,
+            status=status,
+            priority=priority,
+            count=delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "scope_id", "status", "priority"],
+            set_={"count": IssueCounter.count + stmt.excluded.count},
+        )
+        await db.execute(stmt)
+
+    async def issue_counts(self, db: AsyncSession, scope: str, scope_id: UUID) -> IssueCounts:
+        result = await db.execute(
+            select(IssueCounter.status, IssueCounter.priority, IssueCounter.count).filter(
+                IssueCounter.scope == scope,
+                IssueCounter.scope_id == scope_id,
+            )
+        )
+        return self._to_counts(result.all())
+
+    async def project_issue_counts(
+        self, db: AsyncSession, project_ids: list[UUID]
+    ) -> dict[UUID, IssueCounts]:
+        result = await db.execute(
+            select(
+                IssueCounter.scope_id,
+                IssueCounter.status,
+                IssueCounter.priority,
+                IssueCounter.count,
+            ).filter(
+                IssueCounter.scope == PROJECT_SCOPE,
+                IssueCounter.scope_id.in_(project_ids),
+            )
+        )
+        rows_by_project = {project_id: [] for project_id in project_ids}
+        for scope_id, status, priority, count in result.all():
+            rows_by_project[scope_id].append((status, priority, count))
+        return {
+            project_id: self._to_counts(rows) for project_id, rows in rows_by_project.items()
+        }
+
+    async def count_issues(
+        self,
+        db: AsyncSession,
+        scope: str,
+        scope_id: UUID,
+        status: IssueStatus | None = None,
+        priority: IssuePriority | None = None,
+    ) -> int:
+        stmt = select(func.coalesce(func.sum(IssueCounter.count), 0)).filter(
+            IssueCounter.scope == scope,
+            IssueCounter.scope_id == scope_id,
+        )
+        if status:
+            stmt = stmt.filter(IssueCounter.status == status.value)
+        if priority:
+            stmt = stmt.filter(IssueCounter.priority == priority.value)
+        return await db.scalar(stmt)
+
+    async def count_projects(self, db: AsyncSession, owner_id: UUID) -> int:
+        count = await db.scalar(
+            select(ProjectCounter.count).filter(ProjectCounter.owner_id == owner_id)
+        )
+        return count or 0
+
+    async def rebuild(self, db: AsyncSession):
+        """Recompute every counter from the issues and projects tables."""
+        await db.execute(delete(IssueCounter))
+        await db.execute(delete(ProjectCounter))
+
+        for scope, scope_column, group_stmt in self._expected_queries():
+            await db.execute(
+                IssueCounter.__table__.insert().from_select(
+                    ["scope", "scope_id", "status", "priority", "count"],
+                    group_stmt.with_only_columns(
+                        literal(scope),
+                        scope_column,
+                        Issue.status,
+                        Issue.priority,
+                        func.count(Issue.id),
+                    ),
+                )
+            )
+
+        await db.execute(
+            ProjectCounter.__table__.insert().from_select(
+                ["owner_id", "count"],
+                select(Project.owner_id, func.count(Project.id))
+                .filter(Project.owner_id.is_not(None))
+                .group_by(Project.owner_id),
+            )
+        )
+        await db.commit()
+
+    async def verify(self, db: AsyncSession) -> list[dict]:
+        """Return every counter that differs from a fresh aggregate."""
+        expected = {}
+        for scope, scope_column, group_stmt in self._expected_queries():
+            result = await db.execute(
+                group_stmt.with_only_columns(
+                    scope_column, Issue.status, Issue.priority, func.count(Issue.id)
+                )
+            )
+            for scope_id, status, priority, count in result.all():
+                expected[("issues", scope, scope_id, status, priority)] = count
+
+        result = await db.execute(
+            select(Project.owner_id, func.count(Project.id))
+            .filter(Project.owner_id.is_not(None))
+            .group_by(Project.owner_id)
+        )
+        for owner_id, count in result.all():
+            expected[("projects", OWNER_SCOPE, owner_id, None, None)] = count
+
+        actual = {}
+        result = await db.execute(select(IssueCounter))
+        for row in result.scalars().all():
+            actual[("issues", row.scope, row.scope_id, row.status, row.priority)] = row.count
+        result = await db.execute(select(ProjectCounter))
+        for row in result.scalars().all():
+            actual[("projects", OWNER_SCOPE, row.owner_id, None, None)] = row.count
+
+        drift = []
+        for key in expected.keys() | actual.keys():
+            want, have = expected.get(key, 0), actual.get(key, 0)
+            if want != have:
+                kind, scope, scope_id, status, priority = key
+                drift.append(
+                    {
+                        "counter": kind,
+                        "scope": scope,
+                        "scope_id": scope_id,
+                        "status": status,
+                        "priority": priority,
+                        "expected": want,
+                        "actual": have,
+                    }
+                )
+        return drift
+
+    def _expected_queries(self):
+        project_stmt = select(Issue.project_id).group_by(
+            Issue.project_id, Issue.status, Issue.priority
+        )
+        owner_stmt = (
+            select(Project.owner_id)
+            .select_from(Issue)
+            .join(Project, Issue.project_id == Project.id)
+            .filter(Project.owner_id.is_not(None))
+            .group_by(Project.owner_id, Issue.status, Issue.priority)
+        )
+        return [
+            (PROJECT_SCOPE, Issue.project_id, project_stmt),
+            (OWNER_SCOPE, Project.owner_id, owner_stmt),
+        ]
+
+    def _to_counts(self, rows) -> IssueCounts:
+        by_status = {status.value: 0 for status in IssueStatus}
+        by_priority = {priority.value: 0 for priority in IssuePriority}
+        total = 0
+        for status, priority, count in rows:
+            by_status[status] = by_status.get(status, 0) + count
+            by_priority[priority] = by_priority.get(priority, 0) + count
+            total += count
+        return IssueCounts(total=total, by_status=by_status, by_priority=by_priority)
+
+
+counter_service = CounterService()
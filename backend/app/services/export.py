@@ -0,0 +1,43 @@
+import csv
+import io
+import json
+from datetime import datetime
+from uuid import UUID
+
+# Columns of an exported issue, in CSV column order; the same fields as IssueOut
+EXPORT_FIELDS = (
+    "id",
+    "project_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+)
+
+
+def _plain(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunk(rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row), strict=True)), ensure_ascii=False)
+        + "\n"
+        for row in rows
+    )
+
+
+def csv_chunk(rows, header: bool = False) -> str:
+    """CSV text for `rows`; None becomes an empty field."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows(["" if value is None else _plain(value) for value in row] for row in rows)
+    return buffer.getvalue()
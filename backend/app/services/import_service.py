@@ -0,0 +1,187 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import TextIO
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.schemas.file_format import FileFormat
+from app.schemas.issue import IssueCreate
+from app.services.issue_service import issue_service
+
+
+class ImportFormatError(ValueError):
+    """
+    The upload cannot be read at all, as opposed to a single bad row.
+
+    Raised by `import_issues` with `result` set: the batches before the
+    failure stay committed, and it says how far they got.
+    """
+
+    result: "ImportResult | None" = None
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    failed: int = 0
+    # Row number of the last record in a committed batch
+    last_row: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.created + self.failed
+
+
+def _check_length(text: str):
+    if len(text) > settings.import_max_line_length:
+        raise ImportFormatError(
+            f"Line longer than {settings.import_max_line_length} characters"
+        )
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a byte stream into UTF-8 lines, keeping their endings; a BOM is dropped.
+
+    A line longer than `settings.import_max_line_length` rejects the file, so
+    memory stays bounded even if no newline ever comes.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                _check_length(line)
+                yield line + "\n"
+            _check_length(pending)
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError(f"File is not valid UTF-8: {exc}") from exc
+    if pending:
+        yield pending
+
+
+async def _ndjson_records(lines: AsyncIterator[str]):
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            yield row, json.loads(line), None
+        except json.JSONDecodeError as exc:
+            yield row, line.rstrip("\r\n"), [{"type": "json_invalid", "loc": [], "msg": str(exc)}]
+
+
+async def _csv_records(lines: AsyncIterator[str]):
+    header = None
+    row = 0
+    record = ""
+    async for line in lines:
+        record += line
+        # A quoted field may span lines; the record ends once its quotes balance
+        if record.count('"') % 2:
+            _check_length(record)
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+        fields = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in fields]
+            if "title" not in header:
+                raise ImportFormatError("CSV header must include a title column")
+            continue
+        row += 1
+        if len(fields) != len(header):
+            yield row, text.rstrip("\r\n"), [
+                {
+                    "type": "csv_field_count",
+                    "loc": [],
+                    "msg": f"Expected {len(header)} fields, got {len(fields)}",
+                }
+            ]
+            continue
+        # Empty cells are left unset, so the schema defaults apply
+        values = zip(header, fields, strict=True)
+        yield row, {name: value for name, value in values if value != ""}, None
+    if record.strip():
+        raise ImportFormatError("CSV ends inside a quoted field")
+
+
+def iter_records(lines: AsyncIterator[str], file_format: FileFormat):
+    """Yield `(row, record, errors)`; `errors` is set when the row could not be parsed."""
+    if file_format == FileFormat.csv:
+        return _csv_records(lines)
+    return _ndjson_records(lines)
+
+
+class ImportService:
+    async def import_issues(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        owner_id: UUID,
+        records,
+        errors: TextIO,
+        on_progress: Callable[[ImportResult], None] | None = None,
+    ) -> ImportResult:
+        """
+        Validate and insert streamed records, one transaction per batch.
+
+        Only one batch is held in memory. Each rejected row is written to
+        `errors` as an NDJSON line with its row number, the record and the
+        validation errors. Batches committed before a failure stay imported;
+        an `ImportFormatError` carries the result up to the last of them.
+        """
+        result = ImportResult()
+        batch: list[tuple[int, object, list | None]] = []
+
+        async def flush():
+            valid: list[IssueCreate] = []
+            for row, record, row_errors in batch:
+                if row_errors is None:
+                    try:
+                        valid.append(IssueCreate.model_validate(record))
+                        continue
+                    except ValidationError as exc:
+                        row_errors = exc.errors(include_url=False)
+                errors.write(
+                    json.dumps(
+                        jsonable_encoder({"row": row, "record": record, "errors": row_errors})
+                    )
+                    + "\n"
+                )
+                result.failed += 1
+
+            result.created += len(
+                await issue_service.bulk_create(db, project_id, owner_id, valid)
+            )
+            result.last_row = batch[-1][0]
+            batch.clear()
+            if on_progress:
+                on_progress(result)
+
+        try:
+            async for item in records:
+                batch.append(item)
+                if len(batch) >= settings.import_batch_size:
+                    await flush()
+        except ImportFormatError as exc:
+            exc.result = result
+            raise
+        if batch:
+            await flush()
+        return result
+
+
+import_service = ImportService()
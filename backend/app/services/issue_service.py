@@ -1,16 +1,129 @@
-import json
-from datetime import UTC, datetime
-from uuid import UUID
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from uuid import UUID, uuid4
 
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import bindparam, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.issue import Issue
 from app.db.models.project import Project
-from app.schemas.issue import IssueCreate, IssuePriority, IssueStatus, IssueUpdate, IssueOut
+from app.schemas.issue import (
+    IssueBulkSelection,
+    IssueBulkUpdate,
+    IssueCreate,
+    IssuePriority,
+    IssueStatus,
+    IssueUpdate,
+)
+from app.schemas.file_format import FileFormat
 from app.schemas.pagination import PaginationParams
 from app.schemas.sorting import SortOrder
-from app.core.redis import get_cache, set_cache, delete_cache
+from app.core.codec import PRIORITIES, STATUSES
+from app.core.config import settings
+from app.core.list_cache import bump_generations, cached_page, owner_scope, project_scope
+from app.core.loader import EntityLoader
+from app.core.redis import delete_cache, delete_cache_many, mark_missing_cache
+from app.services.counter_service import OWNER_SCOPE, PROJECT_SCOPE, counter_service
+from app.services.export import EXPORT_FIELDS, csv_chunk, ndjson_chunk
+from app.services.listing import ListQuery, fetch_page, list_params
+
+
+def _filter_ranks(stmt, status: IssueStatus | None, priority: IssuePriority | None):
+    """Filter on the indexed rank columns, which stand in for the enum strings."""
+    if status:
+        stmt = stmt.filter(Issue.status_rank == STATUSES.index(status.value))
+    if priority:
+        stmt = stmt.filter(Issue.priority_rank == PRIORITIES.index(priority.value))
+    return stmt
+
+
+ISSUE_SORT_FIELDS = {
+    "created_at": Issue.created_at,
+    "priority": Issue.priority_rank,
+    "status": Issue.status_rank,
+}
+
+
+def _rank_params(status: IssueStatus | None, priority: IssuePriority | None) -> dict:
+    params = {}
+    if status:
+        params["status_rank"] = STATUSES.index(status.value)
+    if priority:
+        params["priority_rank"] = PRIORITIES.index(priority.value)
+    return params
+
+
+def _select_issues(columns: tuple[str, ...] | None, sort_by: str):
+    """select(Issue), or a sparse fieldset plus the id and sort column paging needs."""
+    if columns is None:
+        return select(Issue)
+    names = dict.fromkeys(["id", *columns, ISSUE_SORT_FIELDS[sort_by].key])
+    return select(*(getattr(Issue, name) for name in names))
+
+
+def _list_query(
+    stmt, count_stmt, has_status: bool, has_priority: bool, sort_by, order, sparse: bool
+):
+    if has_status:
+        stmt = stmt.filter(Issue.status_rank == bindparam("status_rank"))
+        count_stmt = count_stmt.filter(Issue.status_rank == bindparam("status_rank"))
+    if has_priority:
+        stmt = stmt.filter(Issue.priority_rank == bindparam("priority_rank"))
+        count_stmt = count_stmt.filter(Issue.priority_rank == bindparam("priority_rank"))
+    return ListQuery.build(
+        stmt,
+        count_stmt,
+        sort_by,
+        ISSUE_SORT_FIELDS[sort_by],
+        Issue.id,
+        order,
+        rows=sparse,
+    )
+
+
+@cache
+def _owner_list_query(
+    has_status: bool,
+    has_priority: bool,
+    sort_by: str,
+    order: SortOrder,
+    columns: tuple[str, ...] | None = None,
+):
+    """list_all's statements for one shape; the owner and filter values are bound per call."""
+    return _list_query(
+        _select_issues(columns, sort_by)
+        .join(Project, Issue.project_id == Project.id)
+        .filter(Project.owner_id == bindparam("owner_id")),
+        select(func.count(Issue.id))
+        .join(Project, Issue.project_id == Project.id)
+        .filter(Project.owner_id == bindparam("owner_id")),
+        has_status,
+        has_priority,
+        sort_by,
+        order,
+        sparse=columns is not None,
+    )
+
+
+@cache
+def _project_list_query(
+    has_status: bool,
+    has_priority: bool,
+    sort_by: str,
+    order: SortOrder,
+    columns: tuple[str, ...] | None = None,
+):
+    """list_by_project's statements for one shape."""
+    return _list_query(
+        _select_issues(columns, sort_by).filter(Issue.project_id == bindparam("project_id")),
+        select(func.count(Issue.id)).filter(Issue.project_id == bindparam("project_id")),
+        has_status,
+        has_priority,
+        sort_by,
+        order,
+        sparse=columns is not None,
+    )
 
 
 class IssueService:
@@ -23,53 +136,29 @@ class IssueService:
         priority: IssuePriority | None = None,
         sort_by: str = "created_at",
         order: SortOrder = SortOrder.desc,
+        fields: tuple[str, ...] | None = None,
     ):
-        allowed_sort_fields = {
-            "created_at": Issue.created_at,
-            "priority": Issue.priority,
-            "status": Issue.status,
-        }
-
-        sort_column = allowed_sort_fields.get(sort_by, Issue.created_at)
-        order_by = asc(sort_column) if order == SortOrder.asc else desc(sort_column)
-
-        stmt = (
-            select(Issue)
-            .join(Project, Issue.project_id == Project.id)
-            .filter(Project.owner_id == user_id)
+        """`fields` limits the columns loaded; items are then rows of just those."""
+        if sort_by not in ISSUE_SORT_FIELDS:
+            sort_by = "created_at"
+        query = _owner_list_query(
+            status is not None, priority is not None, sort_by, order, fields
         )
-
-        if status:
-            stmt = stmt.filter(Issue.status == status.value)
-
-        if priority:
-            stmt = stmt.filter(Issue.priority == priority.value)
-
-        # Count query
-        count_stmt = (
-            select(func.count(Issue.id))
-            .join(Project, Issue.project_id == Project.id)
-            .filter(Project.owner_id == user_id)
+        params = {"owner_id": user_id, **_rank_params(status, priority)}
+
+        return await cached_page(
+            db,
+            Issue,
+            [owner_scope(user_id)],
+            list_params(pagination, sort_by, order, status=status, priority=priority),
+            lambda: fetch_page(
+                db, query, params, pagination,
+                estimate=lambda: counter_service.count_issues(
+                    db, OWNER_SCOPE, user_id, status, priority
+                ),
+            ),
+            partial=fields is not None,
         )
-        if status:
-            count_stmt = count_stmt.filter(Issue.status == status.value)
-        if priority:
-            count_stmt = count_stmt.filter(Issue.priority == priority.value)
-
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar() or 0
-
-        # Items query
-        stmt = (
-            stmt.order_by(order_by)
-            .offset(pagination.offset)
-            .limit(pagination.page_size)
-        )
-        
-        result = await db.execute(stmt)
-        items = result.scalars().all()
-
-        return items, total
 
     async def list_by_project(
         self,
@@ -80,69 +169,71 @@ class IssueService:
         priority: IssuePriority | None = None,
         sort_by: str = "created_at",
         order: SortOrder = SortOrder.desc,
+        fields: tuple[str, ...] | None = None,
     ):
-        allowed_sort_fields = {
-            "created_at": Issue.created_at,
-            "priority": Issue.priority,
-            "status": Issue.status,
-        }
-
-        sort_column = allowed_sort_fields.get(sort_by, Issue.created_at)
-        order_by = asc(sort_column) if order == SortOrder.asc else desc(sort_column)
-
-        stmt = select(Issue).filter(Issue.project_id == project_id)
-
-        if status:
-            stmt = stmt.filter(Issue.status == status.value)
-
-        if priority:
-            stmt = stmt.filter(Issue.priority == priority.value)
-
-        # Count query
-        count_stmt = select(func.count(Issue.id)).filter(Issue.project_id == project_id)
-        if status:
-            count_stmt = count_stmt.filter(Issue.status == status.value)
-        if priority:
-            count_stmt = count_stmt.filter(Issue.priority == priority.value)
+        """`fields` limits the columns loaded; items are then rows of just those."""
+        if sort_by not in ISSUE_SORT_FIELDS:
+            sort_by = "created_at"
+        query = _project_list_query(
+            status is not None, priority is not None, sort_by, order, fields
+        )
+        params = {"project_id": project_id, **_rank_params(status, priority)}
+
+        return await cached_page(
+            db,
+            Issue,
+            [project_scope(project_id)],
+            list_params(pagination, sort_by, order, status=status, priority=priority),
+            lambda: fetch_page(
+                db, query, params, pagination,
+                estimate=lambda: counter_service.count_issues(
+                    db, PROJECT_SCOPE, project_id, status, priority
+                ),
+            ),
+            partial=fields is not None,
+        )
 
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar() or 0
+    async def export_by_project(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        file_format: FileFormat,
+        status: IssueStatus | None = None,
+        priority: IssuePriority | None = None,
+    ):
+        """
+        Yield a project's issues as NDJSON or CSV text, one chunk per fetched batch.
 
-        # Items query
+        Rows come from a server-side cursor as plain column tuples, so memory
+        use does not grow with the project and no ORM objects are built.
+        """
         stmt = (
-            stmt.order_by(order_by)
-            .offset(pagination.offset)
-            .limit(pagination.page_size)
+            select(*(getattr(Issue, field) for field in EXPORT_FIELDS))
+            .filter(Issue.project_id == project_id)
+            .order_by(Issue.created_at, Issue.id)
         )
-        
-        result = await db.execute(stmt)
-        items = result.scalars().all()
-
-        return items, total
+        stmt = _filter_ranks(stmt, status, priority)
 
+        result = await db.stream(stmt.execution_options(yield_per=settings.export_batch_size))
+        if file_format == FileFormat.csv:
+            yield csv_chunk([], header=True)
+        async for rows in result.partitions():
+            yield csv_chunk(rows) if file_format == FileFormat.csv else ndjson_chunk(rows)
 
     async def get(self, db: AsyncSession, issue_id: UUID):
-        # Cache-aside pattern
-        cache_key = f"issue:{issue_id}"
-        cached_data = await get_cache(cache_key)
-        
-        if cached_data:
-            data = json.loads(cached_data)
-            data["id"] = UUID(data["id"])
-            data["project_id"] = UUID(data["project_id"])
-            if "created_at" in data:
-                data["created_at"] = datetime.fromisoformat(data["created_at"])
-            if "updated_at" in data and data["updated_at"]:
-                data["updated_at"] = datetime.fromisoformat(data["updated_at"])
-            return Issue(**data)
-
-        issue = await db.get(Issue, issue_id)
-        if issue:
-            # Cache the result
-            issue_out = IssueOut.model_validate(issue)
-            await set_cache(cache_key, issue_out.model_dump_json())
-            
-        return issue
+        # Cache-aside through the request's loader, shared with the auth dependencies
+        return await EntityLoader.for_session(db).load(Issue, issue_id)
+
+    async def get_many(self, db: AsyncSession, issue_ids: list[UUID]) -> list:
+        """Issues in the order of `issue_ids`, skipping unknown ids."""
+        loader = EntityLoader.for_session(db)
+        issues = []
+        for start in range(0, len(issue_ids), settings.bulk_chunk_size):
+            loaded = await loader.load_many(
+                Issue, issue_ids[start:start + settings.bulk_chunk_size]
+            )
+            issues.extend(issue for issue in loaded.values() if issue is not None)
+        return issues
 
     async def create(self, db: AsyncSession, project_id: UUID, data: IssueCreate):
         project = await db.get(Project, project_id)
@@ -158,44 +249,242 @@ class IssueService:
         )
 
         db.add(issue)
+        # Read before commit: committing expires the project's attributes
+        owner_id = project.owner_id
+        await counter_service.add_issues(
+            db, project_id, owner_id, issue.status, issue.priority
+        )
         await db.commit()
         await db.refresh(issue)
+
+        # Drop any negative entry cached for this id
+        await delete_cache(f"issue:{issue.id}")
+        await bump_generations(project_scope(project_id), owner_scope(owner_id))
+
         return issue
 
+    async def bulk_create(
+        self, db: AsyncSession, project_id: UUID, owner_id: UUID, items: list[IssueCreate]
+    ) -> list[UUID]:
+        """
+        Insert many issues in one transaction, one multi-row INSERT per chunk.
+
+        Ids and timestamps are generated here, as the model defaults would, so
+        nothing has to be read back. Each row is a microsecond after the one
+        before it, so lists sorted by created_at keep the input order. Returns
+        the new ids in input order.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid4(),
+                "project_id": project_id,
+                "title": item.title,
+                "description": item.description,
+                "status": item.status.value,
+                "priority": item.priority.value,
+                "created_at": now + timedelta(microseconds=index),
+            }
+            for index, item in enumerate(items)
+        ]
+        if not rows:
+            return []
+
+        for start in range(0, len(rows), settings.bulk_chunk_size):
+            await db.execute(insert(Issue).values(rows[start:start + settings.bulk_chunk_size]))
+
+        buckets = Counter((row["status"], row["priority"]) for row in rows)
+        for (status, priority), count in buckets.items():
+            await counter_service.add_issues(
+                db, project_id, owner_id, status, priority, delta=count
+            )
+        await db.commit()
+
+        await bump_generations(project_scope(project_id), owner_scope(owner_id))
+        return [row["id"] for row in rows]
+
+    async def bulk_update(
+        self, db: AsyncSession, owner_id: UUID, data: IssueBulkUpdate
+    ) -> list[UUID]:
+        """
+        Apply the same changes to many issues with set-based UPDATEs.
+
+        The targets' current status/priority are read first (locked, where the
+        database supports it) to move their counters; each UPDATE is still
+        scoped to the owner's projects. Returns the ids of the updated issues.
+        """
+        stmt = self._select_owned(owner_id, data).with_for_update(of=Issue)
+        targets = (await db.execute(stmt)).all()
+        if not targets:
+            return []
+
+        changes = {
+            field: value.value if field in {"status", "priority"} else value
+            for field, value in data.changes.model_dump(exclude_unset=True).items()
+        }
+        changes["updated_at"] = datetime.now(UTC)
+        owned_projects = select(Project.id).filter(Project.owner_id == owner_id)
+        issue_ids = [target.id for target in targets]
+        for start in range(0, len(issue_ids), settings.bulk_chunk_size):
+            await db.execute(
+                update(Issue)
+                .where(
+                    Issue.id.in_(issue_ids[start:start + settings.bulk_chunk_size]),
+                    Issue.project_id.in_(owned_projects),
+                )
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            )
+
+        moves = Counter()
+        for target in targets:
+            old_bucket = (target.status, target.priority)
+            new_bucket = (
+                changes.get("status", target.status),
+                changes.get("priority", target.priority),
+            )
+            if new_bucket != old_bucket:
+                moves[(target.project_id, *old_bucket)] -= 1
+                moves[(target.project_id, *new_bucket)] += 1
+        for (project_id, status, priority), delta in moves.items():
+            if delta:
+                await counter_service.add_issues(
+                    db, project_id, owner_id, status, priority, delta=delta
+                )
+        await db.commit()
+
+        await self._invalidate_many(db, owner_id, targets)
+        return issue_ids
+
+    async def bulk_delete(
+        self, db: AsyncSession, owner_id: UUID, selection: IssueBulkSelection
+    ) -> int:
+        """
+        Delete the owner's issues picked by ids or filter; returns how many.
+
+        Works through the matches one chunk per transaction, so a large filter
+        never holds the (SQLite: database-wide) write lock for long.
+        """
+        owned_projects = select(Project.id).filter(Project.owner_id == owner_id)
+        stmt = self._select_owned(owner_id, selection).limit(settings.bulk_chunk_size)
+        deleted = 0
+        while True:
+            targets = (await db.execute(stmt.with_for_update(of=Issue))).all()
+            if not targets:
+                return deleted
+
+            await db.execute(
+                delete(Issue)
+                .where(
+                    Issue.id.in_([target.id for target in targets]),
+                    Issue.project_id.in_(owned_projects),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            buckets = Counter((t.project_id, t.status, t.priority) for t in targets)
+            for (project_id, status, priority), count in buckets.items():
+                await counter_service.add_issues(
+                    db, project_id, owner_id, status, priority, delta=-count
+                )
+            await db.commit()
+
+            await self._invalidate_many(db, owner_id, targets)
+            deleted += len(targets)
+
+    async def _lock(self, db: AsyncSession, issue_id: UUID) -> Issue | None:
+        """
+        The issue row, locked and re-read even if the session already holds it.
+
+        Writes that move counters start here, so concurrent ones on the same
+        issue see each other's changes instead of adjusting from a stale bucket.
+        """
+        return await db.scalar(
+            select(Issue)
+            .filter(Issue.id == issue_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
 
     async def update(self, db: AsyncSession, issue_id: UUID, data: IssueUpdate):
-        issue = await db.get(Issue, issue_id)
+        issue = await self._lock(db, issue_id)
         if not issue:
             return None
 
         update_data = data.model_dump(exclude_unset=True)
+        old_bucket = (issue.status, issue.priority)
 
         for field, value in update_data.items():
             if field in {"status", "priority"}:
                 value = value.value
             setattr(issue, field, value)
 
+        owner_id = await self._owner_id(db, issue.project_id)
+        new_bucket = (issue.status, issue.priority)
+        if new_bucket != old_bucket:
+            await counter_service.move_issue(
+                db, issue.project_id, owner_id, old_bucket, new_bucket
+            )
+
         issue.updated_at = datetime.now(UTC)
         await db.commit()
         await db.refresh(issue)
         
         # Invalidate cache
         await delete_cache(f"issue:{issue_id}")
+        await bump_generations(project_scope(issue.project_id), owner_scope(owner_id))
         
         return issue
 
     async def delete(self, db: AsyncSession, issue_id: UUID):
-        issue = await db.get(Issue, issue_id)
+        # A concurrent delete of the same issue finds nothing once it gets the lock
+        issue = await self._lock(db, issue_id)
         if not issue:
             return None
 
+        project_id = issue.project_id
+        owner_id = await self._owner_id(db, project_id)
+        await counter_service.add_issues(
+            db, project_id, owner_id, issue.status, issue.priority, delta=-1
+        )
         await db.delete(issue)
         await db.commit()
         
-        # Invalidate cache
-        await delete_cache(f"issue:{issue_id}")
+        # Remember the id is gone so repeat lookups stay off the database
+        await mark_missing_cache(f"issue:{issue_id}")
+        EntityLoader.for_session(db).forget(Issue, issue_id)
+        await bump_generations(project_scope(project_id), owner_scope(owner_id))
         
         return issue
 
+    def _select_owned(self, owner_id: UUID, selection: IssueBulkSelection):
+        """(id, project_id, status, priority) of the owner's issues picked by ids or filter."""
+        stmt = (
+            select(Issue.id, Issue.project_id, Issue.status, Issue.priority)
+            .join(Project, Issue.project_id == Project.id)
+            .filter(Project.owner_id == owner_id)
+        )
+        if selection.ids is not None:
+            return stmt.filter(Issue.id.in_(selection.ids))
+
+        issue_filter = selection.filter
+        if issue_filter.project_id:
+            stmt = stmt.filter(Issue.project_id == issue_filter.project_id)
+        return _filter_ranks(stmt, issue_filter.status, issue_filter.priority)
+
+    async def _invalidate_many(self, db: AsyncSession, owner_id: UUID, targets):
+        """Drop changed issues from every cache tier and bump the affected list generations."""
+        loader = EntityLoader.for_session(db)
+        for target in targets:
+            loader.forget(Issue, target.id)
+        await delete_cache_many([f"issue:{target.id}" for target in targets])
+        await bump_generations(
+            owner_scope(owner_id), *{project_scope(target.project_id) for target in targets}
+        )
+
+    async def _owner_id(self, db: AsyncSession, project_id: UUID) -> UUID | None:
+        # Usually already loaded by the authorization dependency
+        project = await EntityLoader.for_session(db).load(Project, project_id)
+        return project.owner_id if project else None
+
 
 issue_service = IssueService()
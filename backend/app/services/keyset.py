@@ -0,0 +1,132 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, and_, asc, bindparam, desc, or_
+
+from app.core.errors import ErrorCodes
+from app.core.http_exceptions import bad_request
+from app.schemas.pagination import PaginationParams
+from app.schemas.sorting import SortOrder
+
+
+def encode_cursor(sort_by: str, order: SortOrder, value, last_id: UUID) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort_by, order.value, value, str(last_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: SortOrder, sort_column):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_order, value, last_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+        python_type = sort_column.type.python_type
+        if python_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif python_type is int and (not isinstance(value, int) or isinstance(value, bool)):
+            # e.g. a status/priority cursor from before those sorted by rank
+            raise ValueError("Cursor value is not an integer")
+        if not isinstance(last_id, str):
+            raise ValueError("Cursor id is not a string")
+        last_id = UUID(last_id)
+    except (ValueError, TypeError, binascii.Error):
+        bad_request(ErrorCodes.VALIDATION_ERROR, "Invalid cursor")
+
+    if cursor_sort != sort_by or cursor_order != order.value:
+        bad_request(
+            ErrorCodes.VALIDATION_ERROR,
+            "Cursor does not match the requested sort_by and order",
+        )
+    return value, last_id
+
+
+def paginate_query(
+    stmt: Select,
+    sort_column,
+    id_column,
+    order: SortOrder,
+    use_cursor: bool,
+) -> Select:
+    """
+    Apply ordering and either keyset (cursor) or offset pagination.
+
+    The cursor position, offset and limit are left as bind parameters (see
+    `page_params`), so the statement can be built once and reused. The id
+    column breaks ties so rows with equal sort values keep a stable order.
+    """
+    direction = asc if order == SortOrder.asc else desc
+
+    if use_cursor:
+        value = bindparam("page_cursor_value", type_=sort_column.type)
+        last_id = bindparam("page_cursor_id", type_=id_column.type)
+        if order == SortOrder.asc:
+            # Leading range term on the sort column keeps the index usable
+            stmt = stmt.filter(
+                and_(sort_column >= value, or_(sort_column > value, id_column > last_id))
+            )
+        else:
+            stmt = stmt.filter(
+                and_(sort_column <= value, or_(sort_column < value, id_column < last_id))
+            )
+    else:
+        stmt = stmt.offset(bindparam("page_offset"))
+
+    return stmt.order_by(direction(sort_column), direction(id_column)).limit(
+        bindparam("page_limit")
+    )
+
+
+def page_params(
+    pagination: PaginationParams,
+    sort_by: str,
+    sort_column,
+    order: SortOrder,
+) -> dict:
+    """
+    Bind values for a `paginate_query` statement.
+
+    One extra row is fetched so `page_items` can tell whether a next page exists.
+    """
+    params = {"page_limit": pagination.page_size + 1}
+    if pagination.cursor:
+        value, last_id = decode_cursor(pagination.cursor, sort_by, order, sort_column)
+        params.update(page_cursor_value=value, page_cursor_id=last_id)
+    else:
+        params["page_offset"] = pagination.offset
+    return params
+
+
+def paginate(
+    stmt: Select,
+    pagination: PaginationParams,
+    sort_by: str,
+    sort_column,
+    id_column,
+    order: SortOrder,
+) -> Select:
+    """`paginate_query` with the page's values bound, for statements built per request."""
+    return paginate_query(
+        stmt, sort_column, id_column, order, bool(pagination.cursor)
+    ).params(page_params(pagination, sort_by, sort_column, order))
+
+
+def page_items(
+    items,
+    pagination: PaginationParams,
+    sort_by: str,
+    sort_column,
+    order: SortOrder,
+):
+    """Trim the look-ahead row and build the cursor for the following page."""
+    items = list(items)
+    if len(items) <= pagination.page_size:
+        return items, None
+
+    items = items[: pagination.page_size]
+    last = items[-1]
+    return items, encode_cursor(sort_by, order, getattr(last, sort_column.key), last.id)
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.pagination import PaginationParams, TotalMode
+from app.schemas.sorting import SortOrder
+from app.services.keyset import page_items, page_params, paginate_query
+
+
+async def count_total(db: AsyncSession, count_stmt: Select, params: dict) -> int:
+    total_result = await db.execute(count_stmt, params)
+    return total_result.scalar() or 0
+
+
+async def estimate_total(db: AsyncSession, stmt: Select, count_stmt: Select, params: dict) -> int:
+    """
+    Row estimate from the query planner's statistics.
+
+    Only Postgres exposes planner estimates; other backends fall back to an exact count.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return await count_total(db, count_stmt, params)
+
+    compiled = stmt.params(params).compile(
+        dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    conn = await db.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@dataclass(frozen=True, slots=True)
+class ListQuery:
+    """
+    The statements of one list shape: which filters are present, sort field, order.
+
+    Filter values, the page position and the limit are all bind parameters, so
+    a shape is built once (memoize the builder) and each request only binds
+    values. Reusing the statement objects also reuses SQLAlchemy's memoized
+    cache keys, and with them the compiled SQL.
+    """
+
+    stmt: Select
+    count_stmt: Select
+    sort_by: str
+    sort_column: Any
+    order: SortOrder
+    # Offset page with a window count, offset page, cursor page
+    window_items: Select
+    offset_items: Select
+    cursor_items: Select
+    # stmt selects columns (a sparse fieldset), so items are rows, not entities
+    rows: bool = False
+
+    @classmethod
+    def build(
+        cls,
+        stmt: Select,
+        count_stmt: Select,
+        sort_by: str,
+        sort_column,
+        id_column,
+        order,
+        rows: bool = False,
+    ) -> "ListQuery":
+        return cls(
+            stmt=stmt,
+            count_stmt=count_stmt,
+            sort_by=sort_by,
+            sort_column=sort_column,
+            order=order,
+            rows=rows,
+            window_items=paginate_query(
+                stmt.add_columns(func.count().over().label("total")),
+                sort_column, id_column, order, use_cursor=False,
+            ),
+            offset_items=paginate_query(stmt, sort_column, id_column, order, use_cursor=False),
+            cursor_items=paginate_query(stmt, sort_column, id_column, order, use_cursor=True),
+        )
+
+
+def list_params(pagination: PaginationParams, sort_by: str, order: SortOrder, **filters) -> dict:
+    """Normalized description of a list request, used as its result cache key."""
+    return {
+        **pagination.model_dump(mode="json", exclude={"page"} if pagination.cursor else None),
+        "sort_by": sort_by,
+        "order": order.value,
+        "filters": {name: value for name, value in filters.items() if value is not None},
+    }
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: ListQuery,
+    params: dict,
+    pagination: PaginationParams,
+    estimate=None,
+):
+    """
+    Run a list query with `params` bound and compute its total according to
+    `pagination.include_total`.
+
+    Exact totals on offset pages ride along as a window count on the items query,
+    so items and total come back in one round trip. The separate count query is
+    only used when that is not possible: cursor pages (the keyset filter would
+    shrink the window) and pages past the end (no row to carry the count).
+
+    `estimate` is an optional coroutine function serving the estimated mode from
+    maintained counters; without it the planner estimate is used.
+    """
+    mode = pagination.include_total
+    window_total = mode == TotalMode.exact and not pagination.cursor
+
+    if pagination.cursor:
+        items_stmt = query.cursor_items
+    else:
+        items_stmt = query.window_items if window_total else query.offset_items
+    bound = {
+        **params,
+        **page_params(pagination, query.sort_by, query.sort_column, query.order),
+    }
+
+    result = await db.execute(items_stmt, bound)
+    if window_total:
+        rows = result.all()
+        items = rows if query.rows else [row[0] for row in rows]
+        total = rows[0].total if rows else await count_total(db, query.count_stmt, params)
+    else:
+        items = result.all() if query.rows else result.scalars().all()
+        if mode == TotalMode.exact:
+            total = await count_total(db, query.count_stmt, params)
+        elif mode == TotalMode.estimated:
+            total = await (
+                estimate()
+                if estimate
+                else estimate_total(db, query.stmt, query.count_stmt, params)
+            )
+        else:
+            total = None
+
+    items, next_cursor = page_items(
+        items, pagination, query.sort_by, query.sort_column, query.order
+    )
+    return items, total, next_cursor
@@ -1,15 +1,51 @@
-from datetime import datetime
-import json
+from datetime import UTC, datetime
+from functools import cache
 from uuid import UUID
 
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.project import Project
 from app.schemas.pagination import PaginationParams
-from app.schemas.project import ProjectCreate, ProjectOut, ProjectUpdate
+from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.schemas.sorting import SortOrder
-from app.core.redis import get_cache, set_cache, delete_cache
+from app.core.list_cache import bump_generations, cached_page, owner_scope, project_scope
+from app.core.loader import EntityLoader
+from app.core.redis import delete_cache, mark_missing_cache
+from app.services.counter_service import counter_service
+from app.services.listing import ListQuery, fetch_page, list_params
+
+
+PROJECT_SORT_FIELDS = {
+    "created_at": Project.created_at,
+    "name": Project.name,
+}
+
+
+@cache
+def _list_query(
+    owned: bool, sort_by: str, order: SortOrder, columns: tuple[str, ...] | None = None
+) -> ListQuery:
+    """ProjectService.list's statements for one shape; the owner is bound per call."""
+    if columns is None:
+        stmt = select(Project)
+    else:
+        # A sparse fieldset, plus the id and sort column paging needs
+        names = dict.fromkeys(["id", *columns, PROJECT_SORT_FIELDS[sort_by].key])
+        stmt = select(*(getattr(Project, name) for name in names))
+    count_stmt = select(func.count(Project.id))
+    if owned:
+        stmt = stmt.filter(Project.owner_id == bindparam("owner_id"))
+        count_stmt = count_stmt.filter(Project.owner_id == bindparam("owner_id"))
+    return ListQuery.build(
+        stmt,
+        count_stmt,
+        sort_by,
+        PROJECT_SORT_FIELDS[sort_by],
+        Project.id,
+        order,
+        rows=columns is not None,
+    )
 
 
 class ProjectService:
@@ -20,62 +56,35 @@ class ProjectService:
         sort_by: str = "created_at",
         order: SortOrder = SortOrder.desc,
         owner_id: UUID | None = None,
+        fields: tuple[str, ...] | None = None,
     ):
-        allowed_sort_fields = {
-            "created_at": Project.created_at,
-            "name": Project.name,
-        }
-
-        sort_column = allowed_sort_fields.get(sort_by, Project.created_at)
-        order_by = asc(sort_column) if order == SortOrder.asc else desc(sort_column)
-
-        # Base query for items
-        stmt = select(Project)
-        if owner_id:
-            stmt = stmt.filter(Project.owner_id == owner_id)
-        
-        # Query for total count
-        count_stmt = select(func.count(Project.id))
-        if owner_id:
-            count_stmt = count_stmt.filter(Project.owner_id == owner_id)
-        
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar() or 0
-
-        # Apply sorting and pagination to items statement
-        stmt = (
-            stmt.order_by(order_by)
-            .offset(pagination.offset)
-            .limit(pagination.page_size)
+        """`fields` limits the columns loaded; items are then rows of just those."""
+        if sort_by not in PROJECT_SORT_FIELDS:
+            sort_by = "created_at"
+        query = _list_query(owner_id is not None, sort_by, order, fields)
+        params = {"owner_id": owner_id} if owner_id else {}
+
+        estimate = (lambda: counter_service.count_projects(db, owner_id)) if owner_id else None
+
+        def fetch():
+            return fetch_page(db, query, params, pagination, estimate=estimate)
+
+        # Only owner-scoped lists have a generation that writes can bump
+        if not owner_id:
+            return await fetch()
+        return await cached_page(
+            db,
+            Project,
+            [owner_scope(owner_id)],
+            list_params(pagination, sort_by, order),
+            fetch,
+            partial=fields is not None,
         )
-        
-        result = await db.execute(stmt)
-        items = result.scalars().all()
-
-        return items, total 
 
 
     async def get(self, db: AsyncSession, project_id: UUID):
-        # Cache-aside pattern
-        cache_key = f"project:{project_id}"
-        cached_data = await get_cache(cache_key)
-        
-        if cached_data:
-            data = json.loads(cached_data)
-            data["id"] = UUID(data["id"])
-            if "created_at" in data:
-                data["created_at"] = datetime.fromisoformat(data["created_at"])
-            if "owner_id" in data:
-                data["owner_id"] = UUID(data["owner_id"])
-            return Project(**data)
-
-        project = await db.get(Project, project_id)
-        if project:
-            # Cache the result
-            project_out = ProjectOut.model_validate(project)
-            await set_cache(cache_key, project_out.model_dump_json())
-            
-        return project
+        # Cache-aside through the request's loader, shared with the auth dependencies
+        return await EntityLoader.for_session(db).load(Project, project_id)
 
     async def create(self, db: AsyncSession, data: ProjectCreate, owner_id: UUID):
         project = Project(
@@ -84,8 +93,14 @@ class ProjectService:
             owner_id=owner_id,
         )
         db.add(project)
+        await counter_service.add_projects(db, owner_id)
         await db.commit()
         await db.refresh(project)
+
+        # Drop any negative entry cached for this id
+        await delete_cache(f"project:{project.id}")
+        await bump_generations(owner_scope(owner_id))
+
         return project
 
     async def update(self, db: AsyncSession, project_id: UUID, data: ProjectUpdate):
@@ -96,12 +111,14 @@ class ProjectService:
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(project, field, value)
+        project.updated_at = datetime.now(UTC)
 
         await db.commit()
         await db.refresh(project)
         
         # Invalidate cache
         await delete_cache(f"project:{project_id}")
+        await bump_generations(owner_scope(project.owner_id))
         
         return project
 
@@ -110,11 +127,15 @@ class ProjectService:
         if not project:
             return None
 
+        owner_id = project.owner_id
+        await counter_service.drop_project(db, project.id, owner_id)
         await db.delete(project)
         await db.commit()
         
-        # Invalidate cache
-        await delete_cache(f"project:{project_id}")
+        # Remember the id is gone so repeat lookups stay off the database
+        await mark_missing_cache(f"project:{project_id}")
+        EntityLoader.for_session(db).forget(Project, project_id)
+        await bump_generations(project_scope(project_id), owner_scope(owner_id))
         
         return project
 
@@ -0,0 +1,107 @@
+import html
+import re
+from uuid import UUID
+
+from sqlalchemy import Float, column, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import ErrorCodes
+from app.core.http_exceptions import bad_request
+from app.db.models.issue import Issue
+from app.db.models.project import Project
+from app.schemas.pagination import PaginationParams
+from app.schemas.sorting import SortOrder
+from app.services.keyset import page_items, paginate
+
+# Highlight markers inside the database snippet; replaced once the text is escaped
+_START, _STOP = "\x02", "\x03"
+_TERM = re.compile(r"\w+")
+
+_issues_fts = table("issues_fts", column("rowid"))
+# Inlined rather than bound, so Postgres resolves it as a regconfig
+_PG_CONFIG = literal_column("'english'")
+
+
+def fts5_query(q: str) -> str:
+    """
+    All words of `q` as quoted FTS5 terms, the last one a prefix.
+
+    Quoting keeps user input from being read as FTS5 query syntax.
+    """
+    terms = [f'"{term}"' for term in _TERM.findall(q)]
+    if not terms:
+        bad_request(ErrorCodes.VALIDATION_ERROR, "Search query has no searchable words")
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+class SearchService:
+    def _sqlite_hits(self, q: str):
+        fts = literal_column("issues_fts")
+        return (
+            select(
+                Issue,
+                # bm25 is negative, lower is better; title matches weigh 10x
+                func.bm25(fts, 10.0, 1.0, type_=Float).label("score"),
+                func.snippet(fts, -1, _START, _STOP, "…", 16).label("snippet"),
+            )
+            .join(_issues_fts, _issues_fts.c.rowid == literal_column("issues.rowid"))
+            .filter(fts.match(fts5_query(q)))
+        )
+
+    def _postgres_hits(self, q: str):
+        query = func.websearch_to_tsquery(_PG_CONFIG, q)
+        vector = literal_column("issues.search_vector")
+        return select(
+            Issue,
+            (-func.ts_rank_cd(vector, query, type_=Float)).label("score"),
+            func.ts_headline(
+                _PG_CONFIG,
+                Issue.title + " " + func.coalesce(Issue.description, ""),
+                query,
+                f"StartSel={_START}, StopSel={_STOP}, MaxWords=24, MinWords=8",
+            ).label("snippet"),
+        ).filter(vector.op("@@")(query))
+
+    async def search_issues(
+        self,
+        db: AsyncSession,
+        owner_id: UUID,
+        q: str,
+        pagination: PaginationParams,
+        project_id: UUID | None = None,
+    ):
+        """
+        Rank the owner's issues matching `q`, most relevant first.
+
+        Matching runs on the full-text index of the database in use. Cursors
+        page by (score, id); scores shift as the index changes, so a cursor
+        is only stable while the matching issues are.
+        """
+        builder = self._postgres_hits if db.bind.dialect.name == "postgresql" else self._sqlite_hits
+        stmt = (
+            builder(q)
+            .join(Project, Project.id == Issue.project_id)
+            .filter(Project.owner_id == owner_id)
+        )
+        if project_id:
+            stmt = stmt.filter(Issue.project_id == project_id)
+
+        hits = stmt.subquery()
+        page_stmt = paginate(
+            select(hits), pagination, "score", hits.c.score, hits.c.id, SortOrder.asc
+        )
+        rows = (await db.execute(page_stmt)).all()
+        rows, next_cursor = page_items(rows, pagination, "score", hits.c.score, SortOrder.asc)
+        items = [
+            {**row._mapping, "rank": -row.score, "snippet": highlight(row.snippet)}
+            for row in rows
+        ]
+        return items, next_cursor
+
+
+search_service = SearchService()
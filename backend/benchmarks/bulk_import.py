@@ -0,0 +1,51 @@
+"""
+Issue import throughput: one POST per issue vs. the bulk endpoint.
+
+    python -m benchmarks.bulk_import [issues]
+
+Runs the app in-process against a throwaway SQLite database. Redis is not
+needed; with none running the cache degrades to misses, as in production.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+async def main(issues: int = 1000):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        signup = await client.post(
+            "/api/v1/auth/signup", json={"email": "bench@example.com", "password": "password123"}
+        )
+        client.headers["Authorization"] = f"Bearer {signup.json()['access_token']}"
+        project = (await client.post("/api/v1/projects", json={"name": "Bench"})).json()
+        items = [{"title": f"Imported issue {i}", "priority": "high"} for i in range(issues)]
+
+        started = time.perf_counter()
+        for item in items:
+            await client.post(f"/api/v1/issues/projects/{project['id']}", json=item)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await client.post(f"/api/v1/issues/projects/{project['id']}/bulk", json={"items": items})
+        bulk = time.perf_counter() - started
+
+    print(f"single: {issues / single:>9.0f} issues/s")
+    print(f"bulk:   {issues / bulk:>9.0f} issues/s  ({single / bulk:.0f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
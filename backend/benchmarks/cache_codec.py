@@ -0,0 +1,64 @@
+"""
+Compare the entity cache encodings.
+
+    python -m benchmarks.cache_codec [iterations]
+
+"json" is the previous path: Pydantic JSON on write, then parse and build a
+transient ORM object on every hit. "binary" is app.core.codec: struct-packed
+fields decoded into a slotted read-only record.
+"""
+import sys
+import timeit
+from datetime import datetime
+from enum import Enum
+from uuid import uuid4
+
+from app.core.codec import ISSUE_CODEC
+from app.db.models.issue import Issue
+from app.db.models.project import Project  # noqa: F401 - registers the mappers Issue refers to
+from app.db.models.user import User  # noqa: F401
+from app.schemas.issue import IssueOut
+
+
+def json_encode(issue) -> bytes:
+    return IssueOut.model_validate(issue).model_dump_json().encode()
+
+
+def json_decode(payload: bytes) -> Issue:
+    data = IssueOut.model_validate_json(payload)
+    return Issue(
+        **{field: value.value if isinstance(value, Enum) else value for field, value in data}
+    )
+
+
+def main(iterations: int = 20_000):
+    issue = Issue(
+        id=uuid4(),
+        project_id=uuid4(),
+        title="Login form rejects valid passwords",
+        description="Steps: open the login page, enter valid credentials, submit.",
+        status="in_progress",
+        priority="high",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    paths = {
+        "json": (json_encode, json_decode),
+        "binary": (ISSUE_CODEC.encode, ISSUE_CODEC.decode),
+    }
+
+    print(f"{'path':<8} {'bytes':>6} {'encode µs':>10} {'decode µs':>10}")
+    for name, (encode, decode) in paths.items():
+        payload = encode(issue)
+        encode_s = timeit.timeit(lambda encode=encode: encode(issue), number=iterations)
+        decode_s = timeit.timeit(
+            lambda decode=decode, payload=payload: decode(payload), number=iterations
+        )
+        print(
+            f"{name:<8} {len(payload):>6} "
+            f"{encode_s / iterations * 1e6:>10.2f} {decode_s / iterations * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Cost of a polled GET: the full response vs. a 304 for an unchanged resource.
+
+    python -m benchmarks.conditional_get [iterations]
+
+Runs the app in-process against a throwaway SQLite database. Lists only get
+an ETag while Redis holds their versions, so without a Redis server running
+only the single-issue route is measured.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+async def poll(client, url: str, iterations: int, headers=None) -> tuple[float, int, int]:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        response = await client.get(url, headers=headers)
+    elapsed = (time.perf_counter() - started) / iterations * 1e6
+    return elapsed, response.status_code, len(response.content)
+
+
+async def main(iterations: int = 500):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        signup = await client.post(
+            "/api/v1/auth/signup", json={"email": "bench@example.com", "password": "password123"}
+        )
+        client.headers["Authorization"] = f"Bearer {signup.json()['access_token']}"
+        project = (await client.post("/api/v1/projects", json={"name": "Bench"})).json()
+        base = f"/api/v1/issues/projects/{project['id']}"
+        await client.post(
+            f"{base}/bulk",
+            json={"items": [{"title": f"Issue {i}", "description": "x" * 500} for i in range(50)]},
+        )
+        issue = (await client.post(base, json={"title": "Polled", "description": "x" * 900})).json()
+
+        print(f"{'route':<8} {'full µs':>9} {'304 µs':>9} {'full bytes':>11} {'304 bytes':>10}")
+        for name, url in (("issue", f"/api/v1/issues/{issue['id']}"), ("list", base)):
+            etag = (await client.get(url)).headers.get("etag")
+            if etag is None:
+                print(f"{name:<8} no ETag (list versions need Redis)")
+                continue
+            full, _, full_bytes = await poll(client, url, iterations)
+            cached, status, cached_bytes = await poll(
+                client, url, iterations, headers={"If-None-Match": etag}
+            )
+            assert status == 304
+            print(f"{name:<8} {full:>9.0f} {cached:>9.0f} {full_bytes:>11} {cached_bytes:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,106 @@
+"""
+Search latency as the number of issues grows.
+
+    python -m benchmarks.issue_search [max_issues] [queries]
+
+Each round adds unrelated issues to a throwaway SQLite database that holds
+the same 20 matching issues throughout, then times a ranked search page.
+"fts" is app.services.search_service on the FTS5 index; "like" is the
+substring scan over title and description it replaces.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+
+from sqlalchemy import insert, or_, select  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.models.issue import Issue  # noqa: E402
+from app.db.models.project import Project  # noqa: E402
+from app.db.models.user import User  # noqa: E402
+from app.db.session import AsyncSessionLocal, engine  # noqa: E402
+from app.schemas.pagination import PaginationParams  # noqa: E402
+from app.services.search_service import search_service  # noqa: E402
+
+WORDS = "login dashboard export timeout cache editor upload footer sidebar report".split()
+
+
+def issue_rows(project_id, start: int, count: int, title: str | None = None):
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "project_id": project_id,
+            "title": title or f"{WORDS[i % len(WORDS)]} issue {i}",
+            "description": f"Steps to reproduce {WORDS[(i * 7) % len(WORDS)]} problem number {i}",
+            "status": "open",
+            "priority": "medium",
+            "created_at": now,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+async def per_query_ms(fn, queries: int) -> float:
+    started = time.perf_counter()
+    for _ in range(queries):
+        await fn()
+    return (time.perf_counter() - started) / queries * 1e3
+
+
+async def main(max_issues: int = 100_000, queries: int = 50):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Bench", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+        owner_id, project_id = user.id, project.id
+        await db.execute(insert(Issue), issue_rows(project_id, 0, 20, "Kerfuffle in the settings"))
+        await db.commit()
+
+        pagination = PaginationParams(page_size=10)
+        like = (
+            select(Issue)
+            .join(Project)
+            .filter(
+                Project.owner_id == owner_id,
+                or_(Issue.title.ilike("%kerfuffle%"), Issue.description.ilike("%kerfuffle%")),
+            )
+            # Ordered like a ranked page would be, so it cannot stop at the first 10 hits
+            .order_by(Issue.title, Issue.id)
+            .limit(10)
+        )
+        cases = {
+            "fts": lambda: search_service.search_issues(db, owner_id, "kerfuffle", pagination),
+            "like": lambda: db.execute(like),
+        }
+
+        print(f"{'issues':>8} " + " ".join(f"{name + ' ms':>9}" for name in cases))
+        total = 0
+        size = 1_000
+        while size <= max_issues:
+            for start in range(total, size, 10_000):
+                await db.execute(
+                    insert(Issue), issue_rows(project_id, start, min(10_000, size - start))
+                )
+            await db.commit()
+            total = size
+            timings = [await per_query_ms(fn, queries) for fn in cases.values()]
+            print(f"{total:>8} " + " ".join(f"{ms:>9.2f}" for ms in timings))
+            size *= 10
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,91 @@
+"""
+Python-side cost of preparing an issue list query, per request.
+
+    python -m benchmarks.list_queries [iterations]
+
+"rebuilt" constructs the select() chain, sort map and pagination for every
+request, as list_by_project did before; "cached" looks up the statements of
+the request's shape and binds values. "build" times construction alone,
+"execute" adds SQLAlchemy's cache key, compiled cache lookup and execution
+against an empty in-memory SQLite table, so the database does almost no work.
+"""
+import sys
+import timeit
+from uuid import uuid4
+
+from sqlalchemy import and_, asc, create_engine, desc, func, or_, select
+
+from app.core.codec import STATUSES
+from app.db.base import Base
+from app.db.models.issue import Issue
+from app.db.models.project import Project  # noqa: F401 - registers the mappers Issue refers to
+from app.db.models.user import User  # noqa: F401
+from app.schemas.issue import IssueStatus
+from app.schemas.pagination import PaginationParams
+from app.schemas.sorting import SortOrder
+from app.services.issue_service import _project_list_query, _rank_params
+from app.services.keyset import decode_cursor, encode_cursor, page_params
+
+
+def rebuilt(project_id, status, sort_by, order, pagination):
+    allowed_sort_fields = {
+        "created_at": Issue.created_at,
+        "priority": Issue.priority_rank,
+        "status": Issue.status_rank,
+    }
+    sort_column = allowed_sort_fields[sort_by]
+    stmt = select(Issue).filter(Issue.project_id == project_id)
+    stmt = stmt.filter(Issue.status_rank == STATUSES.index(status.value))
+    count_stmt = select(func.count(Issue.id)).filter(Issue.project_id == project_id)
+    count_stmt = count_stmt.filter(Issue.status_rank == STATUSES.index(status.value))
+
+    direction = asc if order == SortOrder.asc else desc
+    value, last_id = decode_cursor(pagination.cursor, sort_by, order, sort_column)
+    stmt = stmt.filter(and_(sort_column <= value, or_(sort_column < value, Issue.id < last_id)))
+    stmt = stmt.order_by(direction(sort_column), direction(Issue.id)).limit(
+        pagination.page_size + 1
+    )
+    return stmt, {}
+
+
+def cached(project_id, status, sort_by, order, pagination):
+    query = _project_list_query(status is not None, False, sort_by, order)
+    params = {"project_id": project_id, **_rank_params(status, None)}
+    return query.cursor_items, {
+        **params,
+        **page_params(pagination, sort_by, query.sort_column, order),
+    }
+
+
+def main(iterations: int = 20_000):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    project_id = uuid4()
+    pagination = PaginationParams(
+        page_size=20, cursor=encode_cursor("priority", SortOrder.desc, 2, uuid4())
+    )
+    request = (project_id, IssueStatus.open, "priority", SortOrder.desc, pagination)
+    paths = {
+        "rebuilt": lambda: rebuilt(*request),
+        "cached": lambda: cached(*request),
+    }
+
+    print(f"{'path':<8} {'build µs':>9} {'execute µs':>11}")
+    with engine.connect() as conn:
+        for name, prepare in paths.items():
+            build_s = timeit.timeit(prepare, number=iterations)
+
+            def run(prepare=prepare):
+                stmt, params = prepare()
+                conn.execute(stmt, params).all()
+
+            run()
+            execute_s = timeit.timeit(run, number=iterations)
+            print(
+                f"{name:<8} {build_s / iterations * 1e6:>9.2f} "
+                f"{execute_s / iterations * 1e6:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""
+Serialization time of an issue list page, per page size.
+
+    python -m benchmarks.response_serialization [iterations]
+
+"pydantic" is what FastAPI does with response_model=Page[IssueOut]: validate
+every item from its attributes, then dump JSON. "stdlib" dumps the validated
+page with the json module instead. "orjson" is the routes' path now:
+app.core.responses.Projection reads the fields and orjson renders the bytes.
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.core.responses import ORJSONResponse, Projection
+from app.db.models.issue import Issue
+from app.db.models.project import Project  # noqa: F401 - registers the mappers Issue refers to
+from app.db.models.user import User  # noqa: F401
+from app.schemas.issue import IssueOut
+from app.schemas.page import Page
+
+page_adapter = TypeAdapter(Page[IssueOut])
+issue_out = Projection(IssueOut)
+
+
+def content(items, project=lambda items: items):
+    return {
+        "items": project(items),
+        "page": 1,
+        "page_size": len(items),
+        "total": 1000,
+        "next_cursor": None,
+    }
+
+
+def main(iterations: int = 2_000):
+    issues = [
+        Issue(
+            id=uuid4(),
+            project_id=uuid4(),
+            title=f"Login form rejects valid passwords #{i}",
+            description="Steps: open the login page, enter valid credentials, submit.",
+            status="in_progress",
+            priority="high",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow() if i % 2 else None,
+        )
+        for i in range(100)
+    ]
+    paths = {
+        "pydantic": lambda items: page_adapter.dump_json(
+            page_adapter.validate_python(content(items), from_attributes=True)
+        ),
+        "stdlib": lambda items: json.dumps(
+            page_adapter.dump_python(
+                page_adapter.validate_python(content(items), from_attributes=True), mode="json"
+            )
+        ).encode(),
+        "orjson": lambda items: ORJSONResponse(content(items, issue_out.many)).body,
+    }
+
+    print(f"{'items':>5} " + " ".join(f"{name + ' µs':>11}" for name in paths))
+    for size in (10, 50, 100):
+        items = issues[:size]
+        timings = [
+            timeit.timeit(
+                lambda serialize=serialize, items=items: serialize(items), number=iterations
+            )
+            / iterations
+            * 1e6
+            for serialize in paths.values()
+        ]
+        print(f"{size:>5} " + " ".join(f"{us:>11.1f}" for us in timings))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,4 +1,7 @@
+from datetime import datetime
+from typing import NamedTuple
 from unittest.mock import MagicMock, AsyncMock
+from uuid import uuid4
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event, select
@@ -11,11 +14,30 @@ import app.core.redis
 app.core.redis.get_cache = AsyncMock(return_value=None)
 app.core.redis.set_cache = AsyncMock()
 app.core.redis.delete_cache = AsyncMock()
+app.core.redis.delete_cache_many = AsyncMock()
+app.core.redis.mark_missing_cache = AsyncMock()
+app.core.redis.get_cache_many = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+app.core.redis.set_cache_many = AsyncMock()
+app.core.redis.incr_cache_many = AsyncMock()
+# As with Redis down: lists get no ETag unless a test provides counters
+app.core.redis.get_counters_many = AsyncMock(return_value=None)
+app.core.redis.add_revoked_token = AsyncMock(return_value=True)
+# Only reached for ids in the local Bloom filter, i.e. ones revoked in this process
+app.core.redis.is_token_revoked = AsyncMock(return_value=True)
+app.core.redis.revoked_tokens_since = AsyncMock(return_value=[])
+
+
+async def _load_without_cache(key, loader, *args, **kwargs):
+    return await loader()
+
+
+app.core.redis.get_or_load_cache = AsyncMock(side_effect=_load_without_cache)
 
 from app.db.base import Base
 from app.db.session import get_db
 from app.main import app
 from app.core.security import hash_password
+from app.db.models.issue import Issue
 from app.db.models.user import User
 
 # Use a separate test database
@@ -35,6 +57,14 @@ TestingSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# What the API runs with: the app's own sessions expire attributes on commit
+AppSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=AsyncSession,
+)
+
 @pytest.fixture(scope="session", autouse=True)
 async def setup_database():
     async with engine.begin() as conn:
@@ -52,7 +82,7 @@ async def db_session():
 @pytest.fixture
 async def client(db_session):
     async def override_get_db():
-        async with TestingSessionLocal() as session:
+        async with AppSessionLocal() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
@@ -85,3 +115,39 @@ async def auth_client(client, db_session):
     token = response.json()["access_token"]
     client.headers.update({"Authorization": f"Bearer {token}"})
     return client
+
+class Query(NamedTuple):
+    statement: str
+    parameters: object
+
+@pytest.fixture
+def queries(db_session):
+    """Every statement sent to the test database while the test runs, in order."""
+    captured: list[Query] = []
+    sync_engine = db_session.bind.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append(Query(statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield captured
+    event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+@pytest.fixture
+def make_issue():
+    """Build a transient Issue with every column set; keyword arguments override fields."""
+    def make(**overrides):
+        fields = {
+            "id": uuid4(),
+            "project_id": uuid4(),
+            "title": "Crash on save — ünïcode \"quoted\"",
+            "description": None,
+            "status": "in_progress",
+            "priority": "high",
+            "created_at": datetime(2024, 5, 1, 12, 30, 15, 123456),
+            "updated_at": None,
+        }
+        fields.update(overrides)
+        return Issue(**fields)
+
+    return make
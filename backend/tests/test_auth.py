@@ -0,0 +1,131 @@
+from uuid import uuid4
+
+import pytest
+from passlib.hash import bcrypt
+
+import app.core.redis
+import app.core.security
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.jwt import create_access_token
+from app.core.revocation import RevocationList
+from app.db.models.user import User
+
+
+@pytest.fixture
+async def weak_user(db_session):
+    # Hashed with a lower cost than the configured one, as after raising bcrypt_rounds
+    user = User(
+        email=f"rehash-{uuid4()}@example.com",
+        hashed_password=bcrypt.using(rounds=4).hash("password123"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_cost(client, db_session, weak_user):
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": weak_user.email, "password": "password123"}
+    )
+    assert response.status_code == 200
+
+    await db_session.refresh(weak_user)
+    assert weak_user.hashed_password.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": weak_user.email, "password": "password123"}
+    )
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_wrong_password_does_not_rehash(client, db_session, weak_user):
+    old_hash = weak_user.hashed_password
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": weak_user.email, "password": "wrong-password"}
+    )
+    assert response.status_code == 401
+
+    await db_session.refresh(weak_user)
+    assert weak_user.hashed_password == old_hash
+
+@pytest.mark.asyncio
+async def test_login_sheds_load_when_hashing_is_saturated(client, weak_user, monkeypatch):
+    monkeypatch.setattr(app.core.security, "_pending", settings.password_hash_max_pending)
+
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": weak_user.email, "password": "password123"}
+    )
+
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "SERVICE_UNAVAILABLE"
+
+@pytest.mark.asyncio
+async def test_logout_revokes_the_token(auth_client):
+    response = await auth_client.post("/api/v1/auth/logout")
+    assert response.status_code == 204
+
+    response = await auth_client.get("/api/v1/projects")
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Token has been revoked"
+
+@pytest.mark.asyncio
+async def test_stateless_mode_skips_the_user_lookup(client, monkeypatch):
+    # A valid token whose user does not exist: only a user lookup can notice
+    client.headers["Authorization"] = f"Bearer {create_access_token(str(uuid4()))}"
+
+    assert (await client.get("/api/v1/projects")).status_code == 401
+
+    monkeypatch.setattr(settings, "auth_stateless", True)
+    response = await client.get("/api/v1/projects")
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    # Routes that need the full user still load it
+    assert (await client.get("/api/v1/users/me")).status_code == 401
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    ids = [uuid4().hex for _ in range(1000)]
+    for jti in ids:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in ids)
+    false_positives = sum(uuid4().hex in bloom for _ in range(10_000))
+    assert false_positives < 300
+
+@pytest.mark.asyncio
+async def test_revocations_from_other_workers_are_synced(monkeypatch):
+    revocations = RevocationList(capacity=100, error_rate=0.01, sync_seconds=1)
+    jti = uuid4().hex
+    assert not await revocations.is_revoked(jti)
+
+    async def revoked_tokens_since(since):
+        return [(jti, 1700000000.0)] if since < 1700000000.0 else []
+
+    monkeypatch.setattr(app.core.redis, "revoked_tokens_since", revoked_tokens_since)
+    await revocations.sync()
+
+    assert await revocations.is_revoked(jti)
+    assert not await revocations.is_revoked(None)
+
+
+@pytest.mark.asyncio
+async def test_late_revocations_below_the_high_water_mark_are_synced(monkeypatch):
+    revocations = RevocationList(
+        capacity=100, error_rate=0.01, sync_seconds=1, sync_overlap_seconds=30
+    )
+    first, late = uuid4().hex, uuid4().hex
+    revoked = [(first, 1700000100.0)]
+
+    async def revoked_tokens_since(since):
+        return [(jti, score) for jti, score in revoked if score > since]
+
+    monkeypatch.setattr(app.core.redis, "revoked_tokens_since", revoked_tokens_since)
+    await revocations.sync()
+
+    # Recorded after that sync, by a worker whose clock runs 10 seconds behind
+    revoked.append((late, 1700000090.0))
+    await revocations.sync()
+
+    assert await revocations.is_revoked(first)
+    assert await revocations.is_revoked(late)
@@ -0,0 +1,457 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import (
+    INVALIDATION_CHANNEL,
+    MISSING,
+    CircuitBreaker,
+    LRUCache,
+    TieredCache,
+)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value, ex))
+
+    def delete(self, *keys):
+        self.commands.append(("delete", keys))
+
+    def publish(self, channel, message):
+        self.commands.append(("publish", channel, message))
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    async def execute(self):
+        self.redis.calls.append(("pipeline", len(self.commands)))
+        for command, *args in self.commands:
+            if command == "set":
+                key, value, ex = args
+                self.redis.data[key] = value
+                self.redis.expiries[key] = ex
+            elif command == "delete":
+                for key in args[0]:
+                    self.redis.data.pop(key, None)
+            elif command == "incr":
+                self.redis.data[args[0]] = int(self.redis.data.get(args[0], 0)) + 1
+            else:
+                await self.redis.publish(*args)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the cache layer."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiries = {}
+        self.calls = []
+        self.subscribers = {}
+
+    async def get(self, key):
+        self.calls.append(("get", key))
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        self.calls.append(("set", key))
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expiries[key] = ex
+        return True
+
+    async def mget(self, keys):
+        self.calls.append(("mget", tuple(keys)))
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def delete(self, key):
+        self.calls.append(("delete", key))
+        self.data.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.calls.append(("publish", channel))
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+class DownRedis:
+    """A Redis that refuses every connection."""
+
+    def __init__(self):
+        self.attempts = 0
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            self.attempts += 1
+            raise ConnectionError("connection refused")
+
+        return fail
+
+
+def make_cache(redis, max_entries=100, ttl=30, **kwargs):
+    return TieredCache(
+        lambda: redis, LRUCache(max_entries, ttl), l1_prefixes=("issue:",), **kwargs
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(max_entries=2, ttl_seconds=30)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert lru.evictions == 1
+
+
+def test_lru_expires_entries():
+    lru = LRUCache(max_entries=2, ttl_seconds=30)
+    lru.set("a", 1, ttl=0)
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+@pytest.mark.asyncio
+async def test_l1_hit_skips_redis():
+    redis = FakeRedis()
+    cache = make_cache(redis)
+    await cache.set("issue:1", "payload", expire=60)
+    redis.calls.clear()
+
+    assert await cache.get("issue:1") == "payload"
+    assert redis.calls == []
+    assert cache.snapshot()["l1"]["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_l1_filled_from_redis_and_other_keys_stay_remote():
+    redis = FakeRedis()
+    redis.data = {"issue:1": "payload", "other:1": "remote"}
+    cache = make_cache(redis)
+
+    assert await cache.get("issue:1") == "payload"
+    assert await cache.get("issue:1") == "payload"
+    assert await cache.get("other:1") == "remote"
+    assert await cache.get("other:1") == "remote"
+
+    stats = cache.snapshot()
+    assert stats["l1"] == {"hits": 1, "misses": 1, "size": 1, "evictions": 0}
+    assert stats["l2"] == {"hits": 3, "misses": 0}
+
+@pytest.mark.asyncio
+async def test_delete_fans_out_to_other_workers():
+    redis = FakeRedis()
+    worker_a = make_cache(redis)
+    worker_b = make_cache(redis)
+    worker_b.start_listener()
+    try:
+        await asyncio.sleep(0)  # let the listener subscribe
+        await worker_a.set("issue:1", "payload", expire=60)
+        assert await worker_b.get("issue:1") == "payload"
+
+        await worker_a.delete("issue:1")
+        assert ("publish", INVALIDATION_CHANNEL) in redis.calls
+        await asyncio.sleep(0)
+
+        assert worker_b.l1.get("issue:1") is None
+        assert await worker_b.get("issue:1") is None
+    finally:
+        await worker_b.stop_listener()
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    redis = FakeRedis()
+    cache = make_cache(redis)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return "payload"
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("issue:1", loader, expire=60) for _ in range(10))
+    )
+
+    assert results == ["payload"] * 10
+    assert loads == 1
+    assert "lock:issue:1" not in redis.data
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    cache = make_cache(FakeRedis())
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("issue:1", loader, expire=60) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+@pytest.mark.asyncio
+async def test_waits_for_loader_in_another_worker():
+    redis = FakeRedis()
+    redis.data["lock:issue:1"] = "1"  # another worker holds the load lock
+    cache = make_cache(redis, lock_wait_ms=500)
+
+    async def other_worker_finishes():
+        await asyncio.sleep(0.05)
+        redis.data["issue:1"] = "from-other-worker"
+
+    async def loader():
+        raise AssertionError("should not load while another worker is loading")
+
+    _, value = await asyncio.gather(
+        other_worker_finishes(), cache.get_or_load("issue:1", loader, expire=60)
+    )
+    assert value == "from-other-worker"
+
+@pytest.mark.asyncio
+async def test_ttl_jitter_shortens_expiry():
+    redis = FakeRedis()
+    cache = make_cache(redis, ttl_jitter=0.2)
+    for i in range(20):
+        await cache.set(f"issue:{i}", "payload", expire=1000)
+
+    assert all(800 <= ttl <= 1000 for ttl in redis.expiries.values())
+    assert len(set(redis.expiries.values())) > 1
+
+@pytest.mark.asyncio
+async def test_missing_rows_are_cached_negatively():
+    redis = FakeRedis()
+    cache = make_cache(redis, negative_ttl=15)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        return None
+
+    assert await cache.get_or_load("issue:gone", loader, expire=60) is None
+    assert await cache.get_or_load("issue:gone", loader, expire=60) is None
+
+    assert loads == 1
+    assert redis.data["issue:gone"] == MISSING
+    assert redis.expiries["issue:gone"] == 15
+
+@pytest.mark.asyncio
+async def test_mark_missing_replaces_entry_everywhere():
+    redis = FakeRedis()
+    cache = make_cache(redis)
+    await cache.set("issue:1", "payload", expire=60)
+
+    await cache.mark_missing("issue:1")
+
+    assert cache.l1.get("issue:1") is None
+    assert redis.data["issue:1"] == MISSING
+    assert ("publish", INVALIDATION_CHANNEL) in redis.calls
+
+    async def loader():
+        raise AssertionError("deleted ids should not reach the database")
+
+    assert await cache.get_or_load("issue:1", loader, expire=60) is None
+
+@pytest.mark.asyncio
+async def test_get_many_uses_l1_then_one_mget():
+    redis = FakeRedis()
+    cache = make_cache(redis)
+    await cache.set("issue:1", "one", expire=60)
+    redis.data["issue:2"] = "two"
+    redis.calls.clear()
+
+    values = await cache.get_many(["issue:1", "issue:2", "issue:3"])
+
+    assert values == ["one", "two", None]
+    assert redis.calls == [("mget", ("issue:2", "issue:3"))]
+    assert cache.l1.get("issue:2") == "two"
+
+@pytest.mark.asyncio
+async def test_set_many_pipelines_writes():
+    redis = FakeRedis()
+    cache = make_cache(redis)
+
+    await cache.set_many({"issue:1": "one", "issue:2": "two"}, expire=60)
+
+    assert redis.calls == [("pipeline", 2)]
+    assert redis.data == {"issue:1": "one", "issue:2": "two"}
+    assert cache.l1.get("issue:1") == "one"
+
+@pytest.mark.asyncio
+async def test_delete_many_pipelines_and_fans_out():
+    redis = FakeRedis()
+    worker_a = make_cache(redis)
+    worker_b = make_cache(redis)
+    worker_b.start_listener()
+    try:
+        await asyncio.sleep(0)
+        await worker_a.set_many({"issue:1": "one", "issue:2": "two"}, expire=60)
+        assert await worker_b.get_many(["issue:1", "issue:2"]) == ["one", "two"]
+
+        await worker_a.delete_many(["issue:1", "issue:2"])
+        await asyncio.sleep(0)
+
+        assert redis.data == {}
+        assert worker_a.l1.get("issue:1") is None
+        assert worker_b.l1.get("issue:1") is None
+        assert worker_b.l1.get("issue:2") is None
+    finally:
+        await worker_b.stop_listener()
+
+def test_breaker_opens_then_probes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Reset elapsed: one probe goes through, concurrent calls are still skipped
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["opened"] == 2
+
+@pytest.mark.asyncio
+async def test_redis_outage_degrades_to_misses():
+    redis = DownRedis()
+    cache = make_cache(redis, breaker=CircuitBreaker(failure_threshold=3, reset_seconds=60))
+
+    await cache.set("issue:1", "payload", expire=60)
+    assert await cache.get("issue:1") is None
+    assert await cache.get_many(["issue:1", "issue:2"]) == [None, None]
+    assert cache.l1.get("issue:1") is None
+    assert cache.breaker.state == CircuitBreaker.OPEN
+
+    # Open breaker: Redis is not called at all
+    attempts = redis.attempts
+    await cache.delete("issue:1")
+    await cache.mark_missing("issue:1")
+    await cache.set_many({"issue:1": "payload"}, expire=60)
+    assert redis.attempts == attempts
+    assert cache.snapshot()["breaker"]["short_circuited"] == 3
+
+@pytest.mark.asyncio
+async def test_invalidations_missed_in_outage_are_replayed():
+    redis = FakeRedis()
+    redis.data = {"issue:1": "stale", "issue:2": "stale", "issue:3": "stale", "gen:p": 5}
+    clients = [DownRedis()]
+    cache = TieredCache(
+        lambda: clients[-1],
+        LRUCache(100, 30),
+        l1_prefixes=("issue:",),
+        breaker=CircuitBreaker(failure_threshold=1, reset_seconds=60),
+    )
+
+    # The first write fails and opens the breaker; the rest are short-circuited
+    await cache.delete("issue:1")
+    await cache.delete_many(["issue:2"])
+    await cache.mark_missing("issue:3")
+    await cache.incr_many(["gen:p"])
+    assert cache.breaker.state == CircuitBreaker.OPEN
+
+    clients.append(redis)
+    cache.breaker.reset_seconds = 0
+    assert await cache.get("issue:1") is None
+    assert await cache.get_many(["issue:2", "issue:3"]) == [None, None]
+    assert redis.data == {"gen:p": 6}
+    assert ("publish", INVALIDATION_CHANNEL) in redis.calls
+    assert cache.breaker.state == CircuitBreaker.CLOSED
+
+    # Replayed once only
+    await cache.incr_many(["gen:p"])
+    assert redis.data == {"gen:p": 7}
+
+@pytest.mark.asyncio
+async def test_get_or_load_falls_back_to_loader_without_redis():
+    cache = make_cache(DownRedis(), lock_wait_ms=500)
+
+    async def loader():
+        return "from-db"
+
+    assert await cache.get_or_load("issue:1", loader, expire=60) == "from-db"
+
+@pytest.mark.asyncio
+async def test_breaker_recovers_when_redis_returns():
+    redis = FakeRedis()
+    cache = make_cache(redis, breaker=CircuitBreaker(failure_threshold=1, reset_seconds=0))
+    cache.breaker.record_failure()
+    assert cache.breaker.state == CircuitBreaker.OPEN
+
+    await cache.set("issue:1", "payload", expire=60)
+
+    assert cache.breaker.state == CircuitBreaker.CLOSED
+    assert redis.data["issue:1"] == "payload"
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_wedge_the_breaker():
+    redis = FakeRedis()
+    started = asyncio.Event()
+    original_get = redis.get
+
+    async def hanging_get(key):
+        started.set()
+        await asyncio.sleep(60)
+
+    redis.get = hanging_get
+    cache = make_cache(redis, breaker=CircuitBreaker(failure_threshold=1, reset_seconds=0))
+    cache.breaker.record_failure()
+
+    probe = asyncio.create_task(cache.get("issue:1"))
+    await started.wait()
+    assert cache.breaker.state == CircuitBreaker.HALF_OPEN
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    redis.get = original_get
+    redis.data["issue:1"] = "payload"
+    assert await cache.get("issue:1") == "payload"
+    assert cache.breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    response = await client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    cache = response.json()["cache"]
+    assert set(cache) == {"l1", "l2", "breaker"}
+    assert cache["breaker"]["state"] == "closed"
@@ -0,0 +1,82 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.core.codec import (
+    ISSUE_CODEC,
+    PROJECT_CODEC,
+    USER_CODEC,
+    VERSION,
+    IssueRecord,
+    ProjectRecord,
+    UserRecord,
+    decode_page,
+    encode_page,
+)
+from app.db.models.user import User
+
+
+def test_issue_round_trip(make_issue):
+    issue = make_issue()
+    record = ISSUE_CODEC.decode(ISSUE_CODEC.encode(issue))
+
+    assert isinstance(record, IssueRecord)
+    assert record == IssueRecord(
+        id=issue.id,
+        project_id=issue.project_id,
+        title=issue.title,
+        description=None,
+        status="in_progress",
+        priority="high",
+        created_at=issue.created_at,
+        updated_at=None,
+    )
+    # Records encode like the rows they came from
+    assert ISSUE_CODEC.encode(record) == ISSUE_CODEC.encode(issue)
+
+
+def test_aware_datetimes_are_stored_as_utc(make_issue):
+    issue = make_issue(updated_at=datetime(2024, 5, 2, 8, 0, tzinfo=UTC), description="")
+    record = ISSUE_CODEC.decode(ISSUE_CODEC.encode(issue))
+
+    assert record.updated_at == datetime(2024, 5, 2, 8, 0)
+    assert record.description == ""
+
+
+def test_project_and_user_round_trip():
+    project = ProjectRecord(
+        id=uuid4(), owner_id=uuid4(), name="Backend", description="API", created_at=datetime.now()
+    )
+    assert PROJECT_CODEC.decode(PROJECT_CODEC.encode(project)) == project
+
+    user = User(
+        id=uuid4(), email="a@example.com", hashed_password="secret", created_at=datetime.now()
+    )
+    payload = USER_CODEC.encode(user)
+    assert b"secret" not in payload
+    assert USER_CODEC.decode(payload) == UserRecord(
+        id=user.id, email=user.email, created_at=user.created_at
+    )
+
+
+def test_other_versions_and_types_decode_as_none(make_issue):
+    payload = ISSUE_CODEC.encode(make_issue())
+
+    assert ISSUE_CODEC.decode(bytes([VERSION + 1]) + payload[1:]) is None
+    assert PROJECT_CODEC.decode(payload) is None
+    assert ISSUE_CODEC.decode(b'{"id": "legacy json"}') is None
+    assert ISSUE_CODEC.decode(b"") is None
+
+
+def test_payload_is_compact(make_issue):
+    issue = make_issue(description="Steps to reproduce")
+    # 2 header + 2 * 16 UUID + 2 enum + 2 * 8 time + 2 * 4 lengths + text
+    text = len(issue.title.encode()) + len(issue.description)
+    assert len(ISSUE_CODEC.encode(issue)) == 2 + 32 + 2 + 16 + 8 + text
+
+
+def test_page_round_trip(make_issue):
+    ids = [uuid4() for _ in range(3)]
+
+    assert decode_page(encode_page(ids, 42, "abc_-")) == (ids, 42, "abc_-")
+    assert decode_page(encode_page([], None, None)) == ([], None, None)
+    assert decode_page(ISSUE_CODEC.encode(make_issue())) is None
@@ -1,5 +1,17 @@
+import base64
+import csv
+import io
+import json
+from uuid import uuid4
+
 import pytest
 
+import app.core.redis
+from app.core.errors import ErrorCodes
+from app.schemas.sorting import SortOrder
+from app.services.keyset import encode_cursor
+
+
 @pytest.mark.asyncio
 async def test_create_issue(auth_client):
     project_resp = await auth_client.post(
@@ -103,3 +115,708 @@ async def test_delete_issue(auth_client):
 
     delete = await auth_client.delete(f"/api/v1/issues/{issue['id']}")
     assert delete.status_code == 204
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_issues(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Cursor Issues"},
+    )
+    project = project_resp.json()
+
+    created = set()
+    for i in range(7):
+        issue_resp = await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": f"Cursor {i}", "priority": "high"},
+        )
+        created.add(issue_resp.json()["id"])
+
+    # Every row ties on priority, so ordering relies on the id tie-breaker
+    seen = []
+    cursor = None
+    while True:
+        params = {"page_size": 3, "sort_by": "priority", "order": "asc"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await auth_client.get(
+            f"/api/v1/issues/projects/{project['id']}", params=params
+        )
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(created)
+    assert set(seen) == created
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(auth_client):
+    response = await auth_client.get("/api/v1/issues/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+    # Well-formed, but the id is not a string
+    cursor = base64.urlsafe_b64encode(
+        json.dumps(["created_at", "desc", "2025-01-01T00:00:00", 5]).encode()
+    ).decode()
+    response = await auth_client.get("/api/v1/issues/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Invalid cursor"
+
+@pytest.mark.asyncio
+async def test_include_total_modes(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Total Modes"},
+    )
+    project = project_resp.json()
+    for i in range(4):
+        await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": f"Total {i}"},
+        )
+
+    url = f"/api/v1/issues/projects/{project['id']}"
+    exact = await auth_client.get(url, params={"page_size": 3})
+    assert exact.json()["total"] == 4
+
+    past_end = await auth_client.get(url, params={"page": 5, "page_size": 3})
+    assert past_end.json()["items"] == []
+    assert past_end.json()["total"] == 4
+
+    estimated = await auth_client.get(url, params={"include_total": "estimated"})
+    assert estimated.json()["total"] == 4
+
+    none = await auth_client.get(url, params={"include_total": "none"})
+    assert none.status_code == 200
+    assert none.json()["total"] is None
+    assert len(none.json()["items"]) == 4
+
+@pytest.mark.asyncio
+async def test_bulk_create_issues(auth_client, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.bulk_chunk_size", 2)
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Bulk Import"},
+    )
+    project = project_resp.json()
+
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [
+                {"title": "Imported 1", "priority": "high"},
+                {"title": "no"},
+                {"title": "Imported 2", "status": "done"},
+                {"title": "Imported 3", "status": "bogus"},
+                {"title": "Imported 4"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert data["failed"] == 2
+    assert [result["index"] for result in data["results"]] == [0, 1, 2, 3, 4]
+    assert data["results"][1]["id"] is None
+    assert data["results"][1]["errors"][0]["loc"] == ["title"]
+    assert data["results"][3]["errors"][0]["loc"] == ["status"]
+
+    issue = await auth_client.get(f"/api/v1/issues/{data['results'][2]['id']}")
+    assert issue.json()["status"] == "done"
+
+    listed = await auth_client.get(f"/api/v1/issues/projects/{project['id']}")
+    assert listed.json()["total"] == 3
+    # Newest first, as if the items had been created one by one
+    assert [item["title"] for item in listed.json()["items"]] == [
+        "Imported 4", "Imported 2", "Imported 1"
+    ]
+
+    stats = await auth_client.get(f"/api/v1/stats/projects/{project['id']}")
+    assert stats.json()["by_priority"]["high"] == 1
+    assert stats.json()["total"] == 3
+
+@pytest.mark.asyncio
+async def test_bulk_create_requires_ownership(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Not Yours"},
+    )
+    project = project_resp.json()
+
+    signup = await auth_client.post(
+        "/api/v1/auth/signup",
+        json={"email": f"other-{uuid4()}@example.com", "password": "password123"},
+    )
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={"items": [{"title": "Sneaky"}]},
+        headers={"Authorization": f"Bearer {signup.json()['access_token']}"},
+    )
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_ids_and_filter(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Sprint"},
+    )
+    project = project_resp.json()
+    created = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [
+                {"title": "Sprint 1", "status": "in_progress"},
+                {"title": "Sprint 2", "status": "in_progress"},
+                {"title": "Sprint 3", "status": "open", "priority": "low"},
+            ]
+        },
+    )
+    ids = [result["id"] for result in created.json()["results"]]
+
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={
+            "filter": {"project_id": project["id"], "status": "in_progress"},
+            "changes": {"status": "done"},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2, "items": None}
+
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={
+            "ids": [ids[2], "00000000-0000-0000-0000-000000000000"],
+            "changes": {"priority": "high"},
+            "return_items": True,
+        },
+    )
+    data = response.json()
+    assert data["updated"] == 1
+    assert data["items"][0]["id"] == ids[2]
+    assert data["items"][0]["priority"] == "high"
+    assert data["items"][0]["updated_at"] is not None
+
+    stats = (await auth_client.get(f"/api/v1/stats/projects/{project['id']}")).json()
+    assert stats["by_status"] == {"open": 1, "in_progress": 0, "done": 2}
+    assert stats["by_priority"]["high"] == 1
+
+@pytest.mark.asyncio
+async def test_bulk_update_only_touches_own_issues(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Mine"},
+    )
+    project = project_resp.json()
+    issue = (
+        await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": "Keep open"},
+        )
+    ).json()
+
+    signup = await auth_client.post(
+        "/api/v1/auth/signup",
+        json={"email": f"other-{uuid4()}@example.com", "password": "password123"},
+    )
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": [issue["id"]], "changes": {"status": "done"}},
+        headers={"Authorization": f"Bearer {signup.json()['access_token']}"},
+    )
+    assert response.json()["updated"] == 0
+    assert (await auth_client.get(f"/api/v1/issues/{issue['id']}")).json()["status"] == "open"
+
+@pytest.mark.asyncio
+async def test_bulk_update_requires_one_selector(auth_client):
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": [str(uuid4())], "filter": {}, "changes": {"status": "done"}},
+    )
+    assert response.status_code == 422
+
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={"filter": {}, "changes": {}},
+    )
+    assert response.status_code == 422
+
+    for field in ("title", "status", "priority"):
+        response = await auth_client.patch(
+            "/api/v1/issues/bulk", json={"filter": {}, "changes": {field: None}}
+        )
+        assert response.status_code == 422
+        assert f"cannot set {field} to null" in response.text
+
+    # The description is optional, so it can be cleared
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Nulls"})).json()
+    issue = (
+        await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": "Described", "description": "Soon gone"},
+        )
+    ).json()
+    response = await auth_client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": [issue["id"]], "changes": {"description": None}, "return_items": True},
+    )
+    assert response.status_code == 200
+    assert response.json()["items"][0]["description"] is None
+
+@pytest.mark.asyncio
+async def test_bulk_delete_in_chunks(auth_client, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.bulk_chunk_size", 2)
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Cleanup"},
+    )
+    project = project_resp.json()
+    created = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [{"title": f"Stale {i}", "status": "done"} for i in range(5)]
+            + [{"title": "Still open"}]
+        },
+    )
+    ids = [result["id"] for result in created.json()["results"]]
+
+    response = await auth_client.post(
+        "/api/v1/issues/bulk/delete",
+        json={"filter": {"project_id": project["id"], "status": "done"}},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 5}
+
+    response = await auth_client.post("/api/v1/issues/bulk/delete", json={"ids": ids})
+    assert response.json() == {"deleted": 1}
+
+    listed = await auth_client.get(f"/api/v1/issues/projects/{project['id']}")
+    assert listed.json()["total"] == 0
+    stats = (await auth_client.get(f"/api/v1/stats/projects/{project['id']}")).json()
+    assert stats["total"] == 0
+
+@pytest.mark.asyncio
+async def test_bulk_delete_only_touches_own_issues(auth_client):
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Protected"},
+    )
+    project = project_resp.json()
+    issue = (
+        await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": "Keep me"},
+        )
+    ).json()
+
+    signup = await auth_client.post(
+        "/api/v1/auth/signup",
+        json={"email": f"other-{uuid4()}@example.com", "password": "password123"},
+    )
+    response = await auth_client.post(
+        "/api/v1/issues/bulk/delete",
+        json={"filter": {"project_id": project["id"]}},
+        headers={"Authorization": f"Bearer {signup.json()['access_token']}"},
+    )
+    assert response.json() == {"deleted": 0}
+    assert (await auth_client.get(f"/api/v1/issues/{issue['id']}")).status_code == 200
+
+@pytest.mark.asyncio
+async def test_export_issues_ndjson_and_csv(auth_client, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.export_batch_size", 2)
+    project_resp = await auth_client.post(
+        "/api/v1/projects",
+        json={"name": "Export"},
+    )
+    project = project_resp.json()
+    await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [{"title": f"Export {i}", "priority": "high"} for i in range(5)]
+            + [{"title": "Low, with comma", "description": "line\nbreak", "priority": "low"}]
+        },
+    )
+
+    response = await auth_client.get(f"/api/v1/issues/projects/{project['id']}/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 6
+    listed = await auth_client.get(f"/api/v1/issues/{rows[0]['id']}")
+    assert rows[0] == listed.json()
+
+    response = await auth_client.get(
+        f"/api/v1/issues/projects/{project['id']}/export",
+        params={"format": "csv", "priority": "low"},
+    )
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["title"], row["description"]) for row in rows] == [
+        ("Low, with comma", "line\nbreak")
+    ]
+
+@pytest.mark.asyncio
+async def test_export_requires_ownership(auth_client):
+    signup = await auth_client.post(
+        "/api/v1/auth/signup",
+        json={"email": f"other-{uuid4()}@example.com", "password": "password123"},
+    )
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Private"})).json()
+    response = await auth_client.get(
+        f"/api/v1/issues/projects/{project['id']}/export",
+        headers={"Authorization": f"Bearer {signup.json()['access_token']}"},
+    )
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_import_issues_streams_batches_and_reports_errors(auth_client, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.import_batch_size", 2)
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Import"})).json()
+    lines = [
+        json.dumps({"title": "Imported A", "priority": "high"}),
+        "{not json",
+        "",
+        json.dumps({"title": "no"}),
+        json.dumps({"title": "Imported B", "status": "done"}),
+        json.dumps({"title": "Imported C"}),
+    ]
+
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/import",
+        content="\n".join(lines).encode(),
+    )
+    assert response.status_code == 200
+    assert response.headers["x-import-created"] == "3"
+    assert response.headers["x-import-failed"] == "2"
+    errors = [json.loads(line) for line in response.text.splitlines()]
+    assert [error["row"] for error in errors] == [2, 3]
+    assert errors[0]["errors"][0]["type"] == "json_invalid"
+    assert errors[1]["record"] == {"title": "no"}
+    assert errors[1]["errors"][0]["loc"] == ["title"]
+
+    stats = (await auth_client.get(f"/api/v1/stats/projects/{project['id']}")).json()
+    assert stats["total"] == 3
+
+@pytest.mark.asyncio
+async def test_import_csv_round_trips_an_export(auth_client):
+    source = (await auth_client.post("/api/v1/projects", json={"name": "Source"})).json()
+    await auth_client.post(
+        f"/api/v1/issues/projects/{source['id']}/bulk",
+        json={
+            "items": [
+                {"title": "Plain issue"},
+                {"title": 'Quoted "title", too', "description": "two\nlines", "priority": "low"},
+            ]
+        },
+    )
+    exported = await auth_client.get(
+        f"/api/v1/issues/projects/{source['id']}/export", params={"format": "csv"}
+    )
+
+    target = (await auth_client.post("/api/v1/projects", json={"name": "Target"})).json()
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{target['id']}/import",
+        params={"format": "csv"},
+        content=exported.content,
+    )
+    assert response.headers["x-import-created"] == "2"
+    assert response.text == ""
+
+    listed = await auth_client.get(f"/api/v1/issues/projects/{target['id']}")
+    assert sorted(
+        (item["title"], item["description"], item["priority"]) for item in listed.json()["items"]
+    ) == [
+        ("Plain issue", None, "medium"),
+        ('Quoted "title", too', "two\nlines", "low"),
+    ]
+
+@pytest.mark.asyncio
+async def test_import_rejects_unreadable_files(auth_client, monkeypatch):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Bad files"})).json()
+    url = f"/api/v1/issues/projects/{project['id']}/import"
+
+    response = await auth_client.post(url, params={"format": "csv"}, content=b"name\nx\n")
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_FILE"
+
+    response = await auth_client.post(url, content=b'{"title": "\xff\xfe"}\n')
+    assert response.status_code == 400
+
+    monkeypatch.setattr("app.core.config.settings.import_max_line_length", 100)
+    # One line that never ends, and a quote that never closes
+    for content in (b"x" * 1000, b'title\n"' + b"y\n" * 500):
+        response = await auth_client.post(url, params={"format": "csv"}, content=content)
+        assert response.status_code == 400
+        assert "longer than 100" in response.json()["error"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_import_format_error_reports_committed_batches(auth_client, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.import_batch_size", 2)
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Half"})).json()
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/import",
+        params={"format": "csv"},
+        content=b'title\nKept 1\nno\nLost 3\n"Never closed\n',
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["details"] == {
+        "created": 1,
+        "failed": 1,
+        "last_committed_row": 2,
+    }
+    listed = (await auth_client.get(f"/api/v1/issues/projects/{project['id']}")).json()
+    assert [item["title"] for item in listed["items"]] == ["Kept 1"]
+
+@pytest.mark.asyncio
+async def test_import_csv_rejects_ragged_rows(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Ragged"})).json()
+    response = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/import",
+        params={"format": "csv"},
+        content=b"title,priority\nKept,high\nToo many,low,extra\nToo few\n",
+    )
+    assert response.headers["x-import-created"] == "1"
+    errors = [json.loads(line) for line in response.text.splitlines()]
+    assert [(error["row"], error["record"]) for error in errors] == [
+        (2, "Too many,low,extra"),
+        (3, "Too few"),
+    ]
+    assert errors[0]["errors"][0]["msg"] == "Expected 2 fields, got 3"
+
+@pytest.mark.asyncio
+async def test_search_ranks_highlights_and_pages(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Searchable"})).json()
+    created = await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [
+                {"title": "Crash when saving <drafts>", "description": "Editor crashes"},
+                {"title": "Slow dashboard", "description": "Mentions a crash once"},
+                {"title": "Typo in footer"},
+            ]
+            + [{"title": f"Crashing report {i}"} for i in range(3)]
+        },
+    )
+    ids = [result["id"] for result in created.json()["results"]]
+
+    response = await auth_client.get("/api/v1/issues/search", params={"q": "crash saving"})
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [ids[0]]
+    assert "<mark>Crash</mark>" in items[0]["snippet"]
+    assert "&lt;drafts&gt;" in items[0]["snippet"]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "crash", "page_size": 2, "project_id": project["id"]}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await auth_client.get("/api/v1/issues/search", params=params)).json()
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(item["id"] for item in seen) == sorted(ids[:2] + ids[3:])
+    ranks = [item["rank"] for item in seen]
+    assert ranks == sorted(ranks, reverse=True)
+    # Title matches outrank a description-only match
+    assert seen[-1]["id"] == ids[1]
+
+@pytest.mark.asyncio
+async def test_search_follows_edits_and_ownership(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Search edits"})).json()
+    issue = (
+        await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}", json={"title": "Quixotic widget"}
+        )
+    ).json()
+
+    async def found(q, **kwargs):
+        response = await auth_client.get("/api/v1/issues/search", params={"q": q}, **kwargs)
+        return [item["id"] for item in response.json()["items"]]
+
+    assert await found("quixotic") == [issue["id"]]
+    await auth_client.patch(f"/api/v1/issues/{issue['id']}", json={"title": "Zephyr widget"})
+    assert await found("quixotic") == []
+    assert await found("zephyr") == [issue["id"]]
+
+    signup = await auth_client.post(
+        "/api/v1/auth/signup",
+        json={"email": f"other-{uuid4()}@example.com", "password": "password123"},
+    )
+    headers = {"Authorization": f"Bearer {signup.json()['access_token']}"}
+    assert await found("zephyr", headers=headers) == []
+
+    await auth_client.delete(f"/api/v1/issues/{issue['id']}")
+    assert await found("zephyr") == []
+
+    response = await auth_client.get("/api/v1/issues/search", params={"q": '"*'})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_sort_by_priority_and_status_is_semantic(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Ranks"})).json()
+    await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [
+                {"title": "Medium done", "priority": "medium", "status": "done"},
+                {"title": "High open", "priority": "high", "status": "open"},
+                {"title": "Low in progress", "priority": "low", "status": "in_progress"},
+                {"title": "High done", "priority": "high", "status": "done"},
+            ]
+        },
+    )
+    url = f"/api/v1/issues/projects/{project['id']}"
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"sort_by": "priority", "order": "asc", "page_size": 1}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await auth_client.get(url, params=params)).json()
+        seen.extend(item["priority"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == ["low", "medium", "high", "high"]
+
+    response = await auth_client.get(url, params={"sort_by": "status", "order": "desc"})
+    assert [item["status"] for item in response.json()["items"]] == [
+        "done", "done", "in_progress", "open"
+    ]
+
+    response = await auth_client.get(url, params={"priority": "high", "status": "done"})
+    assert [item["title"] for item in response.json()["items"]] == ["High done"]
+
+    # A cursor from when priority sorted by its string
+    stale = encode_cursor("priority", SortOrder.asc, "high", uuid4())
+    response = await auth_client.get(
+        url, params={"sort_by": "priority", "order": "asc", "cursor": stale}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_issues_with_sparse_fields(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Sparse"})).json()
+    await auth_client.post(
+        f"/api/v1/issues/projects/{project['id']}/bulk",
+        json={
+            "items": [
+                {"title": f"Sparse {i}", "description": "x" * 100, "priority": priority}
+                for i, priority in enumerate(["high", "low", "medium", "low", "high"])
+            ]
+        },
+    )
+    url = f"/api/v1/issues/projects/{project['id']}"
+
+    seen = []
+    cursor = None
+    while True:
+        # The sort column is loaded for the cursor but not returned
+        params = {"fields": "title, status", "sort_by": "priority", "order": "asc", "page_size": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await auth_client.get(url, params=params)).json()
+        for item in page["items"]:
+            assert list(item) == ["title", "status", "id"]
+        seen.extend(item["title"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(seen[:2]) == ["Sparse 1", "Sparse 3"]
+    assert sorted(seen) == [f"Sparse {i}" for i in range(5)]
+
+    # Asking for the same page in full still returns every field
+    full = (
+        await auth_client.get(url, params={"sort_by": "priority", "order": "asc", "page_size": 2})
+    ).json()
+    assert full["items"][0]["description"] == "x" * 100
+
+    response = await auth_client.get("/api/v1/issues/", params={"fields": "priority"})
+    assert response.status_code == 200
+    assert all(set(item) == {"id", "priority"} for item in response.json()["items"])
+
+    response = await auth_client.get(url, params={"fields": "title,secret"})
+    assert response.status_code == 400
+    error = response.json()["error"]
+    assert error["code"] == ErrorCodes.VALIDATION_ERROR
+    assert "secret" in error["message"]
+
+
+@pytest.mark.asyncio
+async def test_get_issue_conditional_requests(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Etags"})).json()
+    issue = (
+        await auth_client.post(f"/api/v1/issues/projects/{project['id']}", json={"title": "Poll"})
+    ).json()
+    url = f"/api/v1/issues/{issue['id']}"
+
+    response = await auth_client.get(url)
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    response = await auth_client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    await auth_client.patch(url, json={"status": "done"})
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["status"] == "done"
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_issues_conditional_requests(auth_client, monkeypatch):
+    counters = {}
+
+    async def get_counters_many(keys):
+        return [counters.setdefault(key, 0) for key in keys]
+
+    async def incr_cache_many(keys):
+        for key in keys:
+            counters[key] = counters.get(key, 0) + 1
+
+    project = (await auth_client.post("/api/v1/projects", json={"name": "List etags"})).json()
+    url = f"/api/v1/issues/projects/{project['id']}"
+    await auth_client.post(url, json={"title": "First"})
+
+    # Without list versions (Redis unavailable) there is nothing to validate against
+    response = await auth_client.get(url)
+    assert "etag" not in response.headers
+
+    monkeypatch.setattr(app.core.redis, "get_counters_many", get_counters_many)
+    monkeypatch.setattr(app.core.redis, "incr_cache_many", incr_cache_many)
+    etag = (await auth_client.get(url)).headers["etag"]
+
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    response = await auth_client.get(url, params={"page_size": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    await auth_client.post(url, json={"title": "Second"})
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+    # The owner-wide list moves with every project's writes too
+    etag = (await auth_client.get("/api/v1/issues/")).headers["etag"]
+    await auth_client.post(url, json={"title": "Third"})
+    response = await auth_client.get("/api/v1/issues/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
@@ -0,0 +1,52 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from jose import JWTError, jwt
+
+import app.core.jwt
+from app.core.config import settings
+from app.core.jwt import ALGORITHM, create_access_token, decode_claims, decode_token
+
+
+@pytest.fixture
+def jose_calls(monkeypatch):
+    calls = []
+    original = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app.core.jwt.jwt, "decode", counting_decode)
+    app.core.jwt._verified.clear()
+    return calls
+
+
+def test_repeat_decodes_skip_verification(jose_calls):
+    token = create_access_token("user-1")
+
+    assert decode_token(token) == "user-1"
+    assert decode_token(token) == "user-1"
+    assert len(jose_calls) == 1
+
+
+def test_cached_claims_never_outlive_exp(jose_calls):
+    exp = datetime.utcnow() + timedelta(seconds=20)
+    token = jwt.encode({"sub": "user-1", "exp": exp}, settings.secret_key, algorithm=ALGORITHM)
+
+    claims = decode_claims(token)
+
+    expires_at, _ = next(iter(app.core.jwt._verified._entries.values()))
+    assert expires_at - time.monotonic() <= claims["exp"] - time.time() + 0.01
+
+
+def test_invalid_tokens_are_not_cached(jose_calls):
+    token = create_access_token("user-1")
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            decode_token(tampered)
+    assert len(jose_calls) == 2
+    assert len(app.core.jwt._verified) == 0
@@ -0,0 +1,166 @@
+import random
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.core.redis
+from app.db.models.user import User
+from app.schemas.issue import IssueCreate, IssueStatus, IssueUpdate
+from app.schemas.pagination import PaginationParams
+from app.schemas.project import ProjectCreate
+from app.services.issue_service import issue_service
+from app.services.project_service import project_service
+
+
+class FakeCache:
+    """Dict-backed stand-in for the cache functions the list cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get_cache(self, key):
+        return self.data.get(key)
+
+    async def set_cache(self, key, value, expire=None):
+        self.data[key] = value
+
+    async def get_cache_many(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set_cache_many(self, items, expire=None):
+        self.data.update(items)
+
+    async def get_counters_many(self, keys):
+        for key in keys:
+            self.data.setdefault(key, str(random.getrandbits(48)).encode())
+        return [int(self.data[key]) for key in keys]
+
+    async def incr_cache_many(self, keys):
+        for key in keys:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    fake = FakeCache()
+    for name in (
+        "get_cache",
+        "set_cache",
+        "get_cache_many",
+        "set_cache_many",
+        "get_counters_many",
+        "incr_cache_many",
+    ):
+        monkeypatch.setattr(app.core.redis, name, getattr(fake, name))
+    return fake
+
+
+@pytest.fixture
+async def project(db_session):
+    owner = User(email=f"lists-{uuid4()}@example.com", hashed_password="x")
+    db_session.add(owner)
+    await db_session.commit()
+    project = await project_service.create(
+        db_session, ProjectCreate(name="List Cache"), owner_id=owner.id
+    )
+    for i in range(3):
+        await issue_service.create(db_session, project.id, IssueCreate(title=f"Listed {i}"))
+    return project
+
+
+@pytest.fixture
+def new_session(db_session):
+    # A fresh session per simulated request, so nothing is shared in memory
+    return async_sessionmaker(bind=db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
+
+async def list_titles(new_session, project, **filters):
+    async with new_session() as db:
+        items, total, _ = await issue_service.list_by_project(
+            db, project.id, PaginationParams(page=1, page_size=10), **filters
+        )
+    return sorted(item.title for item in items), total
+
+@pytest.mark.asyncio
+async def test_repeated_list_is_served_from_cache(project, fake_cache, new_session, queries):
+    first = await list_titles(new_session, project)
+    queries.clear()
+
+    assert await list_titles(new_session, project) == first
+    assert queries == []
+
+@pytest.mark.asyncio
+async def test_writes_bump_generations(project, fake_cache, new_session):
+    titles, total = await list_titles(new_session, project)
+    assert total == 3
+
+    async with new_session() as db:
+        issue = await issue_service.create(db, project.id, IssueCreate(title="Listed 3"))
+    titles, total = await list_titles(new_session, project)
+    assert total == 4
+    assert "Listed 3" in titles
+
+    async with new_session() as db:
+        await issue_service.update(db, issue.id, IssueUpdate(status=IssueStatus.done))
+    assert await list_titles(new_session, project, status=IssueStatus.done) == (["Listed 3"], 1)
+
+    async with new_session() as db:
+        await issue_service.delete(db, issue.id)
+    assert (await list_titles(new_session, project))[1] == 3
+
+    # The owner-wide list shares the owner's generation
+    async with new_session() as db:
+        _, owner_total, _ = await issue_service.list_all(
+            db, project.owner_id, PaginationParams(page=1, page_size=10)
+        )
+    assert owner_total == 3
+
+@pytest.mark.asyncio
+async def test_evicted_generations_do_not_revive_old_pages(project, fake_cache, new_session):
+    await list_titles(new_session, project)
+    async with new_session() as db:
+        await issue_service.create(db, project.id, IssueCreate(title="Listed 3"))
+    assert (await list_titles(new_session, project))[1] == 4
+
+    # Redis evicts the generations; the next write's INCR restarts them at 1
+    for key in [key for key in fake_cache.data if key.startswith("gen:")]:
+        del fake_cache.data[key]
+    async with new_session() as db:
+        await issue_service.create(db, project.id, IssueCreate(title="Listed 4"))
+
+    titles, total = await list_titles(new_session, project)
+    assert total == 5
+    assert "Listed 4" in titles
+
+@pytest.mark.asyncio
+async def test_sparse_and_full_pages_share_an_entry(project, fake_cache, new_session):
+    pagination = PaginationParams(page=1, page_size=10)
+    async with new_session() as db:
+        sparse, _, _ = await issue_service.list_by_project(
+            db, project.id, pagination, fields=("title",)
+        )
+    assert {item.title for item in sparse} == {f"Listed {i}" for i in range(3)}
+    # Rows of some columns only are never cached as entities
+    assert [key for key in fake_cache.data if key.startswith("issue:")] == []
+    page_keys = [key for key in fake_cache.data if key.startswith("list:")]
+    assert len(page_keys) == 1
+
+    # The full page is the cached one, hydrated with complete issues
+    async with new_session() as db:
+        full, total, _ = await issue_service.list_by_project(db, project.id, pagination)
+    assert [key for key in fake_cache.data if key.startswith("list:")] == page_keys
+    assert [item.id for item in full] == [item.id for item in sparse]
+    assert total == 3
+    assert all(item.status == "open" for item in full)
+
+@pytest.mark.asyncio
+async def test_filters_and_pages_get_their_own_entries(project, fake_cache, new_session):
+    await list_titles(new_session, project)
+    await list_titles(new_session, project, status=IssueStatus.open)
+    async with new_session() as db:
+        await issue_service.list_by_project(
+            db, project.id, PaginationParams(page=2, page_size=2)
+        )
+
+    assert len([key for key in fake_cache.data if key.startswith("list:")]) == 3
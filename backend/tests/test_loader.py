@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.core.redis
+from app.core.cache import MISSING
+from app.core.loader import EntityLoader, cache_key, encode_entity
+from app.db.models.issue import Issue
+from app.db.models.project import Project
+from app.db.models.user import User
+from app.schemas.issue import IssueCreate, IssueUpdate
+from app.schemas.project import ProjectCreate
+from app.services.issue_service import issue_service
+from app.services.project_service import project_service
+
+
+@pytest.fixture
+async def seeded(db_session):
+    owner = User(email=f"loader-{uuid4()}@example.com", hashed_password="x")
+    db_session.add(owner)
+    await db_session.commit()
+    project = await project_service.create(
+        db_session, ProjectCreate(name="Loader Project"), owner_id=owner.id
+    )
+    issues = [
+        await issue_service.create(db_session, project.id, IssueCreate(title=f"Loader {i}"))
+        for i in range(3)
+    ]
+    return project, issues
+
+
+@pytest.fixture
+async def fresh_session(db_session):
+    sessionmaker = async_sessionmaker(
+        bind=db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
+    async with sessionmaker() as session:
+        yield session
+
+@pytest.mark.asyncio
+async def test_issue_load_primes_project_and_write_path(seeded, fresh_session, queries):
+    project, issues = seeded
+    queries.clear()
+
+    issue = await issue_service.get(fresh_session, issues[0].id)
+    loaded_project = await project_service.get(fresh_session, issue.project_id)
+    assert loaded_project.id == project.id
+    assert len(queries) == 1
+
+    queries.clear()
+    await issue_service.update(fresh_session, issue.id, IssueUpdate(title="Renamed"))
+    # The row is re-read once, locked where supported, so concurrent updates move
+    # the counters from the current bucket; nothing else runs before the write
+    assert queries[0].statement.lstrip().upper().startswith("SELECT")
+    assert "FROM ISSUES" in queries[0].statement.upper()
+    assert queries[1].statement.lstrip().upper().startswith("UPDATE")
+
+@pytest.mark.asyncio
+async def test_load_many_uses_one_query(seeded, fresh_session, queries):
+    _, issues = seeded
+    ids = [issue.id for issue in issues]
+    unknown = uuid4()
+    queries.clear()
+
+    loaded = await EntityLoader.for_session(fresh_session).load_many(
+        Issue, ids + ids[:1] + [unknown]
+    )
+
+    assert len(queries) == 1
+    assert " IN " in queries[0].statement.upper()
+    assert [loaded[i].id for i in ids] == ids
+    assert loaded[unknown] is None
+
+    # Already loaded in this request
+    queries.clear()
+    await EntityLoader.for_session(fresh_session).load_many(Issue, ids)
+    assert queries == []
+
+@pytest.mark.asyncio
+async def test_load_many_serves_cache_hits(seeded, fresh_session, queries, monkeypatch):
+    project, issues = seeded
+    gone = uuid4()
+    cached = {
+        cache_key(Issue, issues[0].id): encode_entity(Issue, issues[0]),
+        cache_key(Project, project.id): encode_entity(Project, project),
+        cache_key(Issue, gone): MISSING,
+    }
+
+    async def get_cache_many(keys):
+        return [cached.get(key) for key in keys]
+
+    monkeypatch.setattr(app.core.redis, "get_cache_many", get_cache_many)
+    queries.clear()
+
+    loaded = await EntityLoader.for_session(fresh_session).load_many(
+        Issue, [issues[0].id, gone]
+    )
+
+    assert queries == []
+    assert loaded[issues[0].id].title == issues[0].title
+    assert loaded[issues[0].id].status == "open"
+    assert loaded[gone] is None
+
+@pytest.mark.asyncio
+async def test_payload_from_other_codec_version_is_reloaded(seeded, fresh_session, monkeypatch):
+    _, issues = seeded
+    stale = b"\xff" + encode_entity(Issue, issues[0])[1:]
+    written = {}
+
+    async def get_cache_many(keys):
+        return [stale for _ in keys]
+
+    async def set_cache_many(items, expire=None):
+        written.update(items)
+
+    monkeypatch.setattr(app.core.redis, "get_cache_many", get_cache_many)
+    monkeypatch.setattr(app.core.redis, "set_cache_many", set_cache_many)
+
+    loaded = await EntityLoader.for_session(fresh_session).load_many(Issue, [issues[0].id])
+
+    assert loaded[issues[0].id].title == issues[0].title
+    assert written[cache_key(Issue, issues[0].id)] == encode_entity(Issue, issues[0])
@@ -108,4 +108,67 @@ async def test_project_pagination(auth_client):
     assert "total" in data
     assert isinstance(data["items"], list)
     assert isinstance(data["total"], int)
-    assert len(data["items"]) == 5
\ No newline at end of file
+    assert len(data["items"]) == 5
+
+@pytest.mark.asyncio
+async def test_project_cursor_pagination(auth_client):
+    for i in range(6):
+        await auth_client.post("/api/v1/projects", json={"name": f"Cursor P{i}"})
+
+    first = await auth_client.get("/api/v1/projects?page_size=4&sort_by=name&order=asc")
+    data = first.json()
+    assert len(data["items"]) == 4
+    assert data["next_cursor"]
+
+    second = await auth_client.get(
+        "/api/v1/projects",
+        params={"page_size": 4, "sort_by": "name", "order": "asc", "cursor": data["next_cursor"]},
+    )
+    assert second.status_code == 200
+    names = [p["name"] for p in data["items"] + second.json()["items"]]
+    assert names == sorted(names)
+    first_ids = {p["id"] for p in data["items"]}
+    assert first_ids.isdisjoint(p["id"] for p in second.json()["items"])
+
+    mismatched = await auth_client.get(
+        "/api/v1/projects",
+        params={"page_size": 4, "sort_by": "created_at", "cursor": data["next_cursor"]},
+    )
+    assert mismatched.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_projects_with_sparse_fields(auth_client):
+    await auth_client.post("/api/v1/projects", json={"name": "Sparse", "description": "Long"})
+
+    response = await auth_client.get("/api/v1/projects", params={"fields": "name"})
+    assert response.status_code == 200
+    assert all(set(item) == {"id", "name"} for item in response.json()["items"])
+
+    response = await auth_client.get(
+        "/api/v1/projects", params={"fields": "name", "with_counts": True}
+    )
+    assert all(
+        set(item) == {"id", "name", "issue_counts"} for item in response.json()["items"]
+    )
+
+    response = await auth_client.get("/api/v1/projects", params={"fields": "owner"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_project_conditional_requests(auth_client):
+    project = (await auth_client.post("/api/v1/projects", json={"name": "Polled"})).json()
+    assert project["updated_at"] is None
+    url = f"/api/v1/projects/{project['id']}"
+
+    etag = (await auth_client.get(url)).headers["etag"]
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    updated = (await auth_client.patch(url, json={"name": "Renamed"})).json()
+    assert updated["updated_at"] is not None
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.headers["etag"] != etag
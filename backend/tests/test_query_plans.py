@@ -0,0 +1,140 @@
+import itertools
+import re
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.issue import IssuePriority, IssueStatus
+from app.schemas.pagination import PaginationParams
+from app.schemas.sorting import SortOrder
+from app.services.issue_service import issue_service
+from app.services.keyset import encode_cursor
+from app.services.project_service import project_service
+
+ISSUE_SORTS = ["created_at", "priority", "status"]
+PROJECT_SORTS = ["created_at", "name"]
+STATUSES = [None, IssueStatus.open]
+PRIORITIES = [None, IssuePriority.high]
+FULL_SCAN = re.compile(r"SCAN (?!CONSTANT ROW|\(subquery)")
+SAMPLE_SORT_VALUES = {
+    "created_at": datetime(2025, 1, 1),
+    # Ranks: issues sort by their status/priority rank columns
+    "priority": 1,
+    "status": 0,
+    "name": "Project",
+}
+
+
+def pagination_for(use_cursor, sort_by, order):
+    # Offset pages exercise the window count, cursor pages the separate count query
+    if not use_cursor:
+        return PaginationParams(page=2, page_size=5)
+    cursor = encode_cursor(sort_by, order, SAMPLE_SORT_VALUES[sort_by], uuid4())
+    return PaginationParams(page_size=5, cursor=cursor)
+
+
+async def capture_selects(queries, call):
+    """Run a service call and return every SELECT it sent to the database."""
+    queries.clear()
+    await call()
+    return [query for query in queries if query.statement.lstrip().upper().startswith("SELECT")]
+
+
+async def assert_no_full_scan(db_session, statements):
+    assert statements
+    conn = await db_session.connection()
+    for statement, parameters in statements:
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plan = [row[3] for row in result]
+        # Scanning a materialized subquery (e.g. for a window count) is fine;
+        # scanning a table or a whole index is not.
+        scans = [step for step in plan if FULL_SCAN.match(step)]
+        assert not scans, f"Full scan in plan {plan} for:\n{statement}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status,priority,sort_by,order,use_cursor",
+    list(itertools.product(STATUSES, PRIORITIES, ISSUE_SORTS, SortOrder, [False, True])),
+)
+async def test_list_by_project_uses_index(
+    db_session, queries, status, priority, sort_by, order, use_cursor
+):
+    statements = await capture_selects(
+        queries,
+        lambda: issue_service.list_by_project(
+            db=db_session,
+            project_id=uuid4(),
+            pagination=pagination_for(use_cursor, sort_by, order),
+            status=status,
+            priority=priority,
+            sort_by=sort_by,
+            order=order,
+        ),
+    )
+    await assert_no_full_scan(db_session, statements)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status,priority,sort_by,order,use_cursor",
+    list(itertools.product(STATUSES, PRIORITIES, ISSUE_SORTS, SortOrder, [False, True])),
+)
+async def test_list_all_uses_index(
+    db_session, queries, status, priority, sort_by, order, use_cursor
+):
+    statements = await capture_selects(
+        queries,
+        lambda: issue_service.list_all(
+            db=db_session,
+            user_id=uuid4(),
+            pagination=pagination_for(use_cursor, sort_by, order),
+            status=status,
+            priority=priority,
+            sort_by=sort_by,
+            order=order,
+        ),
+    )
+    await assert_no_full_scan(db_session, statements)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sort_by,order,use_cursor",
+    list(itertools.product(PROJECT_SORTS, SortOrder, [False, True])),
+)
+async def test_project_list_uses_index(db_session, queries, sort_by, order, use_cursor):
+    statements = await capture_selects(
+        queries,
+        lambda: project_service.list(
+            db=db_session,
+            pagination=pagination_for(use_cursor, sort_by, order),
+            sort_by=sort_by,
+            order=order,
+            owner_id=uuid4(),
+        ),
+    )
+    await assert_no_full_scan(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_list_statements_are_reused_across_values(db_session, queries):
+    async def list_sql(status):
+        statements = await capture_selects(
+            queries,
+            lambda: issue_service.list_by_project(
+                db=db_session,
+                project_id=uuid4(),
+                pagination=PaginationParams(page_size=5),
+                status=status,
+                sort_by="priority",
+            ),
+        )
+        return [statement for statement, _ in statements]
+
+    first = await list_sql(IssueStatus.open)
+    # Values are bound, not inlined, so another request of the same shape runs
+    # the identical SQL (and SQLAlchemy's compiled cache entry)
+    assert await list_sql(IssueStatus.done) == first
+    assert await list_sql(None) != first
@@ -0,0 +1,94 @@
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from app.core.codec import ISSUE_CODEC, PROJECT_CODEC
+from app.core.responses import ORJSONResponse, Projection, Validators
+from app.db.models.project import Project
+from app.schemas.issue import IssueOut
+from app.schemas.page import Page
+from app.schemas.project import ProjectOut
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"description": "Details", "updated_at": datetime(2024, 5, 2, 8, 0, 0)},
+        # Set by bulk updates before the row is reloaded
+        {"updated_at": datetime(2024, 5, 2, 8, 0, 0, 5, tzinfo=UTC)},
+    ],
+)
+def test_issue_projection_matches_pydantic(overrides, make_issue):
+    issue = make_issue(**overrides)
+    record = ISSUE_CODEC.decode(ISSUE_CODEC.encode(issue))
+
+    issue_out = Projection(IssueOut)
+    for item in (issue, record):
+        expected = Page[IssueOut](items=[item], page=1, page_size=10, total=1).model_dump_json()
+        body = ORJSONResponse(
+            {
+                "items": issue_out.many([item]),
+                "page": 1,
+                "page_size": 10,
+                "total": 1,
+                "next_cursor": None,
+            }
+        ).body
+        assert json.loads(body) == json.loads(expected)
+
+
+def test_project_projection_matches_pydantic():
+    project = Project(
+        id=uuid4(),
+        owner_id=uuid4(),
+        name="Tracker",
+        description=None,
+        created_at=datetime(2024, 1, 1),
+    )
+    record = PROJECT_CODEC.decode(PROJECT_CODEC.encode(project))
+    expected = json.loads(ProjectOut.model_validate(project).model_dump_json())
+    project_out = Projection(ProjectOut)
+    assert json.loads(ORJSONResponse(project_out(project)).body) == expected
+    assert json.loads(ORJSONResponse(project_out(record)).body) == expected
+
+
+def make_request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_entity_validators_agree_for_rows_and_records(make_issue):
+    issue = make_issue(updated_at=datetime(2024, 5, 2, 8, 0, 0, 5, tzinfo=UTC))
+    record = ISSUE_CODEC.decode(ISSUE_CODEC.encode(issue))
+    assert Validators.for_entity(issue) == Validators.for_entity(record)
+
+    headers = Validators.for_entity(issue).headers()
+    assert headers["Last-Modified"] == "Thu, 02 May 2024 08:00:00 GMT"
+    assert Validators.for_entity(make_issue(id=issue.id)).etag != headers["ETag"]
+
+
+def test_conditional_request_matching():
+    validators = Validators('"abc"', datetime(2024, 5, 2, 8, 0, 0, 500, tzinfo=UTC))
+
+    assert validators.matches(make_request(if_none_match='"abc"'))
+    assert validators.matches(make_request(if_none_match='"old", W/"abc"'))
+    assert validators.matches(make_request(if_none_match="*"))
+    assert not validators.matches(make_request(if_none_match='"old"'))
+    assert not validators.matches(make_request())
+
+    assert validators.matches(make_request(if_modified_since="Thu, 02 May 2024 08:00:00 GMT"))
+    assert not validators.matches(
+        make_request(if_modified_since="Thu, 02 May 2024 07:59:59 GMT")
+    )
+    assert not validators.matches(make_request(if_modified_since="yesterday"))
+    # If-None-Match wins over If-Modified-Since
+    assert not validators.matches(
+        make_request(if_none_match='"old"', if_modified_since="Thu, 02 May 2024 08:00:00 GMT")
+    )
+
+    assert Validators(None).headers() == {}
+    assert not Validators(None).matches(make_request(if_none_match="*"))
@@ -0,0 +1,120 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import update
+
+from app.db.models.counter import IssueCounter
+from app.db.models.issue import Issue
+from app.schemas.issue import IssueUpdate
+from app.services.counter_service import counter_service
+from app.services.issue_service import issue_service
+
+
+async def create_project_with_issues(auth_client, name):
+    project_resp = await auth_client.post("/api/v1/projects", json={"name": name})
+    project = project_resp.json()
+    issues = []
+    for title, priority in [("Stat A", "high"), ("Stat B", "high"), ("Stat C", "low")]:
+        issue_resp = await auth_client.post(
+            f"/api/v1/issues/projects/{project['id']}",
+            json={"title": title, "priority": priority},
+        )
+        issues.append(issue_resp.json())
+    return project, issues
+
+@pytest.mark.asyncio
+async def test_project_stats_follow_writes(auth_client):
+    project, issues = await create_project_with_issues(auth_client, "Stats Project")
+
+    await auth_client.patch(f"/api/v1/issues/{issues[0]['id']}", json={"status": "done"})
+    await auth_client.delete(f"/api/v1/issues/{issues[2]['id']}")
+
+    response = await auth_client.get(f"/api/v1/stats/projects/{project['id']}")
+    assert response.status_code == 200
+    counts = response.json()
+    assert counts["total"] == 2
+    assert counts["by_status"] == {"open": 1, "in_progress": 0, "done": 1}
+    assert counts["by_priority"] == {"low": 0, "medium": 0, "high": 2}
+
+@pytest.mark.asyncio
+async def test_owner_stats_match_listings(auth_client):
+    await create_project_with_issues(auth_client, "Owner Stats")
+
+    stats = (await auth_client.get("/api/v1/stats")).json()
+    projects = (await auth_client.get("/api/v1/projects")).json()
+    issues = (await auth_client.get("/api/v1/issues/")).json()
+    high = (await auth_client.get("/api/v1/issues/", params={"priority": "high"})).json()
+
+    assert stats["projects"] == projects["total"]
+    assert stats["issues"]["total"] == issues["total"]
+    assert stats["issues"]["by_priority"]["high"] == high["total"]
+
+    estimated = await auth_client.get(
+        "/api/v1/issues/", params={"priority": "high", "include_total": "estimated"}
+    )
+    assert estimated.json()["total"] == high["total"]
+
+@pytest.mark.asyncio
+async def test_delete_project_drops_counters(auth_client):
+    project, _ = await create_project_with_issues(auth_client, "Stats Delete")
+    before = (await auth_client.get("/api/v1/stats")).json()
+
+    await auth_client.delete(f"/api/v1/projects/{project['id']}")
+
+    after = (await auth_client.get("/api/v1/stats")).json()
+    assert after["projects"] == before["projects"] - 1
+    assert after["issues"]["total"] == before["issues"]["total"] - 3
+
+@pytest.mark.asyncio
+async def test_list_projects_with_counts(auth_client):
+    project, _ = await create_project_with_issues(auth_client, "With Counts")
+
+    response = await auth_client.get("/api/v1/projects", params={"with_counts": True})
+    assert response.status_code == 200
+    listed = {p["id"]: p for p in response.json()["items"]}
+    assert listed[project["id"]]["issue_counts"]["total"] == 3
+
+    plain = await auth_client.get("/api/v1/projects")
+    assert plain.json()["items"][0]["issue_counts"] is None
+
+@pytest.mark.asyncio
+async def test_verify_and_rebuild_counters(auth_client, db_session):
+    await create_project_with_issues(auth_client, "Drift")
+    assert await counter_service.verify(db_session) == []
+
+    await db_session.execute(update(IssueCounter).values(count=IssueCounter.count + 5))
+    await db_session.commit()
+    assert await counter_service.verify(db_session) != []
+
+    await counter_service.rebuild(db_session)
+    assert await counter_service.verify(db_session) == []
+
+@pytest.mark.asyncio
+async def test_update_moves_counters_from_the_current_row(auth_client, db_session):
+    project, issues = await create_project_with_issues(auth_client, "Stats Stale")
+    issue_id = issues[0]["id"]
+    # A copy read before another request changes the issue
+    stale = await db_session.get(Issue, UUID(issue_id))
+    await db_session.commit()
+    await auth_client.patch(f"/api/v1/issues/{issue_id}", json={"status": "done"})
+    assert stale.status == "open"
+
+    await issue_service.update(db_session, stale.id, IssueUpdate(status="in_progress"))
+
+    counts = (await auth_client.get(f"/api/v1/stats/projects/{project['id']}")).json()
+    assert counts["by_status"] == {"open": 2, "in_progress": 1, "done": 0}
+
+@pytest.mark.asyncio
+async def test_repeated_delete_decrements_counters_once(auth_client, db_session):
+    project, issues = await create_project_with_issues(auth_client, "Stats Double Delete")
+    issue_id = issues[0]["id"]
+    # A copy read before another request deletes the issue
+    stale = await db_session.get(Issue, UUID(issue_id))
+    await db_session.commit()
+    await auth_client.delete(f"/api/v1/issues/{issue_id}")
+    assert stale.title == "Stat A"
+
+    assert await issue_service.delete(db_session, UUID(issue_id)) is None
+
+    counts = (await auth_client.get(f"/api/v1/stats/projects/{project['id']}")).json()
+    assert counts["total"] == 2
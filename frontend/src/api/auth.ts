@@ -13,3 +13,7 @@ export async function signup(email: string, password: string) {
         body: JSON.stringify({ email, password }),
     });
 }
+
+export async function logout() {
+    return apiFetch("/auth/logout", { method: "POST" });
+}
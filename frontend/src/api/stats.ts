@@ -0,0 +1,10 @@
+import { apiFetch } from "./client";
+import type { IssueCounts, Stats } from "../types/stats";
+
+export function fetchStats(): Promise<Stats> {
+    return apiFetch("/stats");
+}
+
+export function fetchProjectStats(projectId: string): Promise<IssueCounts> {
+    return apiFetch(`/stats/projects/${projectId}`);
+}
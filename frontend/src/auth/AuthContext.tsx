@@ -1,5 +1,5 @@
 import { createContext, useContext, useState } from "react";
-import { login as apiLogin } from "../api/auth";
+import { login as apiLogin, logout as apiLogout } from "../api/auth";
 
 type User = {
     email: string;
@@ -31,6 +31,8 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     }
 
     function logout() {
+        // Revoke the token server-side; the local session ends regardless
+        apiLogout().catch(() => undefined);
         localStorage.removeItem("access_token");
         localStorage.removeItem("user");
         setToken(null);
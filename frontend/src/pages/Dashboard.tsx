@@ -16,7 +16,7 @@ import { Card, CardHeader, CardTitle, CardContent } from "../components/ui/Card"
 import { Button } from "../components/ui/Button";
 import { Badge } from "../components/ui/Badge";
 import { cn } from "../lib/utils";
-import { fetchProjects } from "../api/projects";
+import { fetchStats } from "../api/stats";
 import { fetchAllIssues } from "../api/issues";
 import type { Issue } from "../types/issue";
 
@@ -71,17 +71,15 @@ export default function Dashboard() {
     async function loadDashboardData() {
         setIsLoading(true);
         try {
-            const [projectsData, issuesData] = await Promise.all([
-                fetchProjects(1, 1), // Just to get total
+            const [statsData, issuesData] = await Promise.all([
+                fetchStats(), // Maintained counters, no COUNT queries
                 fetchAllIssues(1, 5) // Recent 5 issues
             ]);
 
-            // In a real app we'd have a stats endpoint. 
-            // Here we'll just use the totals from the responses.
             setStats({
-                totalProjects: projectsData.total,
-                activeIssues: issuesData.items.filter(i => i.status !== 'done').length, // This is just for the page, not real global count
-                doneIssues: issuesData.items.filter(i => i.status === 'done').length,
+                totalProjects: statsData.projects,
+                activeIssues: statsData.issues.total - statsData.issues.by_status.done,
+                doneIssues: statsData.issues.by_status.done,
             });
             setRecentIssues(issuesData.items);
         } catch (err) {
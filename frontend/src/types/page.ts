@@ -2,5 +2,6 @@ export interface Page<T> {
     items: T[];
     page: number;
     page_size: number;
-    total: number;
+    total: number | null;
+    next_cursor?: string | null;
 }
@@ -4,4 +4,5 @@ export interface Project {
     description?: string;
     owner_id: string;
     created_at: string;
+    updated_at?: string;
 }
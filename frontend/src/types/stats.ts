@@ -0,0 +1,10 @@
+export interface IssueCounts {
+    total: number;
+    by_status: Record<"open" | "in_progress" | "done", number>;
+    by_priority: Record<"low" | "medium" | "high", number>;
+}
+
+export interface Stats {
+    projects: number;
+    issues: IssueCounts;
+}